@@ -3,7 +3,7 @@ Flask web application for a Japanese learning site.
 
 This application implements a simple vocabulary study tool inspired by the
 screenshots provided by the user.  It supports user registration (gated by a
-purchase code), login and logout functionality, and a dashboard where
+purchase code, see purchase_codes.py), login and logout functionality, and a dashboard where
 registered users can browse and search through a database of more than a
 thousand Japanese expressions.  Each expression includes its Japanese form,
 romaji reading, translation, part of speech, common collocations, and an
@@ -15,18 +15,26 @@ browser’s built‑in speech synthesis.
 Security note:  This application is intended as a demonstration.  In a
 production environment you should use proper password hashing (e.g. via
 Werkzeug’s `generate_password_hash`), use HTTPS, implement CSRF protection
-and integrate a real payment provider.  The purchase code check here is
-purely illustrative and should be replaced with a proper order fulfilment
-system.
+and integrate a real payment provider.  Purchase codes are imported from the
+order system's CSV exports with ``python purchase_codes.py``; until codes
+are imported nobody can register.
 """
 
+import time
+
+# Start of the application's imports, for the startup report.
+IMPORT_STARTED = time.perf_counter()
+
 import json
 import os
 import sqlite3
+import threading
 from functools import wraps
 
 from flask import (
     Flask,
+    abort,
+    current_app,
     g,
     redirect,
     render_template,
@@ -35,38 +43,152 @@ from flask import (
     url_for,
     jsonify,
     flash,
+    Response,
+    stream_with_context,
+)
+
+import progress
+import purchase_codes
+import vocab_db
+from assets import init_assets
+from decks import DeckRegistry
+from metrics import CallbackCounter, Gauge, init_metrics
+from passwords import DEFAULT_METHOD, HasherBusy, PasswordHasher
+from progress import ProgressBuffer, due_cards, review_rows
+from purchase_codes import code_available, redeem_code
+from quiz import build_quiz
+from vocab_binary import BinaryVocabStore
+from vocab_db import (
+    get_vocab,
+    import_vocab_file,
+    iter_vocab,
+    search_vocab,
+    vocab_count,
+    vocab_facets,
+    vocab_usages,
 )
-from werkzeug.security import generate_password_hash, check_password_hash
+from vocab_store import VocabPayload, VocabStore, normalize_entries
 
 
+IMPORT_SECONDS = time.perf_counter() - IMPORT_STARTED
+
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATABASE = os.path.join(BASE_DIR, 'users.db')
 VOCAB_PATH = os.path.join(BASE_DIR, 'data', 'vocab.json')
+DECKS_DIR = os.path.join(BASE_DIR, 'data', 'decks')
+
+
+# Schema migrations, applied in order.  The index of a migration plus one is
+# the schema version it produces, which is stored in ``PRAGMA user_version``.
+# Never edit a migration that has shipped; append a new one instead.
+MIGRATIONS = (
+    # 1: user accounts
+    (
+        '''CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT UNIQUE NOT NULL,
+            password TEXT NOT NULL
+        )''',
+    ),
+    # 2: vocabulary tables and full-text index
+    vocab_db.SCHEMA,
+    # 3: per-user study progress
+    progress.SCHEMA,
+    # 4: purchase codes, one per order
+    purchase_codes.SCHEMA,
+    # 5: full-text index of collocations and example sentences
+    vocab_db.USAGE_SCHEMA + (vocab_db.REBUILD_USAGE_FTS,),
+)
+
+# Connection tuning applied to every connection.  WAL lets readers proceed
+# while a writer commits, and synchronous=NORMAL is durable in WAL mode
+# except for the last transactions before a power loss.
+CONNECTION_PRAGMAS = (
+    'PRAGMA journal_mode = WAL',
+    'PRAGMA synchronous = NORMAL',
+    'PRAGMA cache_size = -16000',
+    'PRAGMA temp_store = MEMORY',
+    'PRAGMA busy_timeout = 5000',
+)
+
+# Number of prepared statements each connection keeps for reuse.
+STATEMENT_CACHE_SIZE = 256
+
+_connections = threading.local()
+
+
+def connect_db(path, factory=sqlite3.Connection):
+    """Open a tuned connection to the SQLite database at ``path``."""
+    db = sqlite3.connect(path, cached_statements=STATEMENT_CACHE_SIZE, factory=factory)
+    db.row_factory = sqlite3.Row
+    for pragma in CONNECTION_PRAGMAS:
+        db.execute(pragma)
+    return db
 
 
 def get_db():
-    """Open a new database connection if there is none yet for the
-    current application context.
+    """Return the current thread's connection to the application database.
+
+    Each worker thread keeps one open connection per database path and
+    reuses it across requests, so requests do not pay for opening the file,
+    applying pragmas or re-preparing statements.
     """
     db = getattr(g, '_database', None)
     if db is None:
-        db = g._database = sqlite3.connect(DATABASE)
-        db.row_factory = sqlite3.Row
+        path = current_app.config['DATABASE']
+        pool = getattr(_connections, 'pool', None)
+        if pool is None:
+            pool = _connections.pool = {}
+        db = pool.get(path)
+        if db is None:
+            # With metrics enabled every statement is timed.
+            metrics = current_app.extensions.get('metrics')
+            factory = metrics.connection_class if metrics else sqlite3.Connection
+            db = pool[path] = connect_db(path, factory)
+        g._database = db
     return db
 
 
-def init_db():
-    """Initialise the user database if it does not already exist."""
-    db = get_db()
-    cursor = db.cursor()
-    cursor.execute(
-        '''CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT UNIQUE NOT NULL,
-            password TEXT NOT NULL
-        )'''
-    )
-    db.commit()
+def reset_connections():
+    """Forget the pooled connections of the current thread.
+
+    SQLite connections must not be used on both sides of a ``fork()``, so
+    the workers started by ``serve.py`` call this before serving.
+    """
+    _connections.pool = {}
+
+
+def warm_connection(app):
+    """Open the calling thread's pooled connection to ``app``'s database,
+    so that the thread's first request does not pay for it.
+    """
+    with app.app_context():
+        get_db().execute('SELECT 1')
+
+
+def init_db(path):
+    """Bring the database at ``path`` up to the latest schema version.
+
+    This runs once when the application is created.  The version check and
+    the migrations happen inside one immediate transaction, so several
+    worker processes starting together apply each migration exactly once.
+    """
+    db = sqlite3.connect(path, isolation_level=None)
+    try:
+        db.execute('PRAGMA journal_mode = WAL')
+        db.execute('BEGIN IMMEDIATE')
+        try:
+            version = db.execute('PRAGMA user_version').fetchone()[0]
+            for number in range(version, len(MIGRATIONS)):
+                for statement in MIGRATIONS[number]:
+                    db.execute(statement)
+            db.execute('PRAGMA user_version = %d' % len(MIGRATIONS))
+            db.execute('COMMIT')
+        except BaseException:
+            db.execute('ROLLBACK')
+            raise
+    finally:
+        db.close()
 
 
 def login_required(view_func):
@@ -81,20 +203,137 @@ def login_required(view_func):
     return wrapped_view
 
 
-def create_app():
+def create_app(config=None):
+    """Create the application.  ``config`` is an optional mapping of
+    settings that override the defaults below.
+    """
+    started = time.perf_counter()
     app = Flask(__name__)
     app.config['SECRET_KEY'] = 'change-this-secret-key'
+    if config:
+        app.config.update(config)
+    app.config.setdefault('DATABASE', DATABASE)
+    app.config.setdefault('VOCAB_PATH', VOCAB_PATH)
+    # How often (in seconds) the vocabulary file is checked for changes.
+    app.config.setdefault('VOCAB_CHECK_INTERVAL', 1.0)
+    # Memory-mapped binary deck written by generate_vocab.py, used for
+    # lookups by id.  Without it those fall back to the vocabulary backend.
+    app.config.setdefault(
+        'VOCAB_BINARY_PATH', os.path.splitext(app.config['VOCAB_PATH'])[0] + '.bin'
+    )
+    # Page size limits for filtered /api/vocab queries.
+    app.config.setdefault('VOCAB_PAGE_SIZE', 50)
+    app.config.setdefault('VOCAB_MAX_PAGE_SIZE', 500)
+    # Approximate size in bytes of each chunk written by streaming exports.
+    app.config.setdefault('VOCAB_STREAM_CHUNK', 64 * 1024)
+    # Limits for /api/quiz: questions per quiz and answers per question.
+    app.config.setdefault('QUIZ_MAX_QUESTIONS', 50)
+    app.config.setdefault('QUIZ_MAX_CHOICES', 8)
+    # Password hashing: Werkzeug method string (cost included), number of
+    # hashing threads and how many hashes may be running or queued before
+    # logins and registrations are refused with a 503.
+    app.config.setdefault('PASSWORD_HASH_METHOD', DEFAULT_METHOD)
+    app.config.setdefault('PASSWORD_HASH_WORKERS', os.cpu_count() or 1)
+    app.config.setdefault('PASSWORD_HASH_MAX_PENDING', 4 * app.config['PASSWORD_HASH_WORKERS'])
+    # Where the vocabulary is read from: 'json' keeps data/vocab.json in
+    # memory, 'sqlite' queries the vocab tables in the user database.
+    app.config.setdefault('VOCAB_BACKEND', os.environ.get('VOCAB_BACKEND', 'json'))
+    use_sqlite_vocab = app.config['VOCAB_BACKEND'] == 'sqlite'
+
+    # Migrate the schema once per process rather than on every request.
+    init_db(app.config['DATABASE'])
+
+    if use_sqlite_vocab:
+        # Import the JSON deck the first time the database is used.
+        with app.app_context():
+            empty = vocab_count(get_db()) == 0
+        if empty:
+            import_vocab_file(app.config['VOCAB_PATH'], app.config['DATABASE'])
+
+    # The vocabulary is parsed once per process and shared by all requests.
+    vocab_store = VocabStore(app.config['VOCAB_PATH'], app.config['VOCAB_CHECK_INTERVAL'])
+    app.extensions['vocab_store'] = vocab_store
+    binary_store = BinaryVocabStore(app.config['VOCAB_BINARY_PATH'], app.config['VOCAB_CHECK_INTERVAL'])
+    app.extensions['vocab_binary'] = binary_store
 
-    @app.before_request
-    def before_request():
-        # ensure the database is initialised
-        init_db()
+    # Additional decks (see decks.py) are loaded on first use and dropped
+    # least recently used first once more than DECK_CACHE_SIZE are loaded
+    # or their files exceed DECK_CACHE_BYTES (0 disables either limit).
+    # Decks are loaded by the workers that use them, not preloaded by the
+    # serve.py master, so they are checked every DECK_CHECK_INTERVAL seconds
+    # even when VOCAB_CHECK_INTERVAL is infinite.
+    app.config.setdefault('DECKS_DIR', DECKS_DIR)
+    app.config.setdefault('DECK_CHECK_INTERVAL', min(app.config['VOCAB_CHECK_INTERVAL'], 1.0))
+    app.config.setdefault('DECK_CACHE_SIZE', 4)
+    app.config.setdefault('DECK_CACHE_BYTES', 256 * 1024 * 1024)
+    deck_registry = DeckRegistry(
+        app.config['DECKS_DIR'],
+        app.config['DECK_CHECK_INTERVAL'],
+        app.config['DECK_CACHE_SIZE'],
+        app.config['DECK_CACHE_BYTES'],
+    )
+    app.extensions['deck_registry'] = deck_registry
+
+    # Warm-up: load the deck and its indexes, compile the templates and open
+    # a database connection before the first request, which would otherwise
+    # pay for all of it.  STARTUP_BUDGET (seconds, 0 for none) only logs a
+    # warning; the timings are reported by /ready and /metrics.  A phase
+    # that fails is logged and retried by the first request that needs it.
+    app.config.setdefault('WARMUP', True)
+    app.config.setdefault('STARTUP_BUDGET', 0)
+    startup = {'import_seconds': IMPORT_SECONDS, 'phases': {}, 'total_seconds': None}
+    app.extensions['startup'] = startup
+
+    # Latency histograms and counters, served at /metrics.
+    app.config.setdefault('METRICS_ENABLED', True)
+    if app.config['METRICS_ENABLED']:
+        metrics = init_metrics(app, vocab_store)
+        for name, help in (
+            ('hits', 'Deck requests served from a loaded deck.'),
+            ('misses', 'Deck requests that loaded the deck.'),
+            ('evictions', 'Decks dropped to stay within the cache budget.'),
+        ):
+            metrics.registry.add(CallbackCounter(
+                'deck_cache_%s_total' % name, help, lambda name=name: getattr(deck_registry, name)
+            ))
+
+    # Templates link static files through the content-hashed asset manifest
+    # (see assets.py); fingerprinted files are served as immutable.
+    init_assets(app, app.config['VOCAB_CHECK_INTERVAL'])
+
+    hasher = PasswordHasher(
+        app.config['PASSWORD_HASH_METHOD'],
+        app.config['PASSWORD_HASH_WORKERS'],
+        app.config['PASSWORD_HASH_MAX_PENDING'],
+    )
+    app.extensions['password_hasher'] = hasher
+
+    # Review events are buffered and written in batches; see progress.py.
+    app.config.setdefault('PROGRESS_FLUSH_INTERVAL', 1.0)
+    app.config.setdefault('PROGRESS_MAX_BATCH', 500)
+    progress_buffer = ProgressBuffer(
+        lambda: connect_db(
+            app.config['DATABASE'],
+            app.extensions['metrics'].connection_class if 'metrics' in app.extensions else sqlite3.Connection,
+        ),
+        flush_interval=app.config['PROGRESS_FLUSH_INTERVAL'],
+    )
+    app.extensions['progress_buffer'] = progress_buffer
+
+    def busy_response(template):
+        # All hashing slots are taken; fail fast rather than tie up a worker.
+        flash('The server is busy. Please try again in a moment.', 'danger')
+        response = app.make_response((render_template(template), 503))
+        response.headers['Retry-After'] = '1'
+        return response
 
     @app.teardown_appcontext
-    def close_connection(exception):
+    def release_connection(exception):
+        # Connections stay open for the next request on this thread; just
+        # make sure a failed request does not leave a transaction behind.
         db = getattr(g, '_database', None)
-        if db is not None:
-            db.close()
+        if db is not None and db.in_transaction:
+            db.rollback()
 
     @app.route('/')
     def index():
@@ -109,29 +348,39 @@ def create_app():
             username = request.form.get('username', '').strip()
             password = request.form.get('password', '').strip()
             code = request.form.get('code', '').strip()
-            # For demonstration purposes, the purchase code is hardcoded.
-            # In a real application this should be validated via your order
-            # fulfilment logic (e.g. verifying that the user actually bought
-            # access).
-            VALID_CODE = 'ACCESS2025'
+            invalid_code = 'Invalid purchase code. Please enter the correct code from your purchase receipt.'
+            db = get_db()
             if not username or not password or not code:
                 flash('Please fill in all fields.', 'danger')
-            elif code != VALID_CODE:
-                flash('Invalid purchase code. Please enter the correct code from your purchase receipt.', 'danger')
+            elif not code_available(db, code):
+                # Checked before hashing so that guessing codes is cheap for
+                # the server; the redemption below is what counts.
+                flash(invalid_code, 'danger')
             else:
-                db = get_db()
-                cursor = db.cursor()
                 try:
-                    cursor.execute(
+                    pwhash = hasher.hash(password)
+                except HasherBusy:
+                    return busy_response('register.html')
+                # The account and the redemption are one transaction: the
+                # code is only used up if the account is created, and the
+                # conditional UPDATE lets exactly one of several concurrent
+                # sign-ups with the same code succeed.
+                try:
+                    cursor = db.execute(
                         'INSERT INTO users (username, password) VALUES (?, ?)',
-                        (username, generate_password_hash(password))
+                        (username, pwhash)
                     )
-                    db.commit()
+                    redeemed = redeem_code(db, code, cursor.lastrowid)
                 except sqlite3.IntegrityError:
+                    db.rollback()
                     flash('Username is already taken.', 'danger')
                 else:
-                    flash('Registration successful. Please log in.', 'success')
-                    return redirect(url_for('login'))
+                    if redeemed:
+                        db.commit()
+                        flash('Registration successful. Please log in.', 'success')
+                        return redirect(url_for('login'))
+                    db.rollback()
+                    flash(invalid_code, 'danger')
         return render_template('register.html')
 
     @app.route('/login', methods=['GET', 'POST'])
@@ -142,7 +391,22 @@ def create_app():
             db = get_db()
             cursor = db.execute('SELECT id, username, password FROM users WHERE username = ?', (username,))
             user = cursor.fetchone()
-            if user and check_password_hash(user['password'], password):
+            try:
+                valid = user is not None and hasher.verify(user['password'], password)
+            except HasherBusy:
+                return busy_response('login.html')
+            if valid:
+                if hasher.needs_rehash(user['password']):
+                    # Upgrade hashes made with an older method or cost now
+                    # that the plain password is at hand.  If the hasher is
+                    # busy the upgrade simply waits for a later login.
+                    try:
+                        pwhash = hasher.hash(password)
+                    except HasherBusy:
+                        pass
+                    else:
+                        db.execute('UPDATE users SET password = ? WHERE id = ?', (pwhash, user['id']))
+                        db.commit()
                 session['user_id'] = user['id']
                 session['username'] = user['username']
                 return redirect(url_for('dashboard'))
@@ -154,26 +418,448 @@ def create_app():
         session.clear()
         return redirect(url_for('login'))
 
+    # The SQLite deck is only written by the import above, so its facet
+    # index and full-deck payloads are built once, on first use.
+    sqlite_facets = {}
+    sqlite_payloads = {}
+    sqlite_payload_lock = threading.Lock()
+
+    def sqlite_payload(kind):
+        # The whole deck from the vocab tables as a VocabPayload, like
+        # VocabSnapshot.payload(): serialized and compressed once, then
+        # served with an ETag.  The lock keeps concurrent first requests
+        # from each building the deck.
+        payload = sqlite_payloads.get(kind)
+        if payload is None:
+            with sqlite_payload_lock:
+                payload = sqlite_payloads.get(kind)
+                if payload is None:
+                    entries = iter_vocab(get_db())
+                    data = normalize_entries(entries) if kind == 'normalized' else list(entries)
+                    payload = sqlite_payloads[kind] = VocabPayload(data)
+        return payload
+
+    def current_facets():
+        # Returns the facet index and the cached /api/facets payload.
+        if not use_sqlite_vocab:
+            snapshot = vocab_store.snapshot()
+            return snapshot.facets, snapshot.payload('facets')
+        if not sqlite_facets:
+            facets = vocab_facets(get_db())
+            sqlite_facets['payload'] = VocabPayload(facets.summary())
+            sqlite_facets['index'] = facets
+        return sqlite_facets['index'], sqlite_facets['payload']
+
     @app.route('/dashboard')
     @login_required
     def dashboard():
-        # Read categories from the vocab file for filtering
-        with open(VOCAB_PATH, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        categories = sorted({entry.get('category', 'Misc') for entry in data})
-        return render_template('dashboard.html', categories=categories)
+        # Category counts come from the facet index built at load time.
+        facets = current_facets()[0]
+        return render_template(
+            'dashboard.html',
+            categories=facets.counts('category'),
+            total=facets.total,
+            api_url=url_for('api_vocab'),
+            changes_url=url_for('api_vocab_changes'),
+            deck=None,
+        )
+
+    def get_deck(deck):
+        store = deck_registry.get(deck)
+        if store is None:
+            abort(404)
+        return store
+
+    @app.route('/decks/<deck>')
+    @login_required
+    def deck_dashboard(deck):
+        facets = get_deck(deck).snapshot().facets
+        return render_template(
+            'dashboard.html',
+            categories=facets.counts('category'),
+            total=facets.total,
+            api_url=url_for('api_deck_vocab', deck=deck),
+            changes_url=url_for('api_deck_vocab_changes', deck=deck),
+            deck=deck,
+        )
+
+    def payload_response(payload, version=None):
+        # The body is serialized and compressed once per dataset version;
+        # clients that already hold the current version get a 304.
+        coding, body, etag = payload.select(request.accept_encodings)
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+        else:
+            response = Response(body, mimetype='application/json')
+            if coding != 'identity':
+                response.headers['Content-Encoding'] = coding
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'private, no-cache'
+        response.vary.add('Accept-Encoding')
+        if version is not None:
+            response.headers['X-Vocab-Version'] = str(version)
+        return response
+
+    def ndjson_response(entries):
+        # Entries are encoded one at a time and flushed in chunks, so the
+        # worker never holds more than one chunk of the export in memory.
+        chunk_size = app.config['VOCAB_STREAM_CHUNK']
+
+        def generate():
+            buffer = []
+            size = 0
+            for entry in entries:
+                line = json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n'
+                buffer.append(line)
+                size += len(line)
+                if size >= chunk_size:
+                    yield ''.join(buffer).encode('utf-8')
+                    buffer = []
+                    size = 0
+            if buffer:
+                yield ''.join(buffer).encode('utf-8')
+
+        response = Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+        response.headers['Cache-Control'] = 'private, no-store'
+        return response
+
+    def lookup_vocab(ids):
+        # Single entries are read from the binary deck when there is one, so
+        # looking up a card does not load the parsed deck into this worker.
+        # The binary is only trusted while it was built from the deck file
+        # being served; the SQLite backend never uses it.
+        if use_sqlite_vocab:
+            return get_vocab(get_db(), ids)
+        binary = binary_store.current()
+        if binary is not None:
+            try:
+                current = binary.source_stamp == vocab_store.stamp()
+            except OSError:
+                current = False
+            if current:
+                return binary.get_many(ids)
+        snapshot = vocab_store.snapshot()
+        return [entry for entry in map(snapshot.get, ids) if entry is not None]
+
+    def snapshot_lookup(store):
+        def lookup(ids):
+            snapshot = store.snapshot()
+            return [entry for entry in map(snapshot.get, ids) if entry is not None]
+        return lookup
+
+    @app.route('/api/vocab/<int:entry_id>')
+    @login_required
+    def api_vocab_entry(entry_id):
+        entries = lookup_vocab([entry_id])
+        if not entries:
+            return jsonify({'error': 'no such entry'}), 404
+        return jsonify(entries[0])
 
     @app.route('/api/vocab')
     @login_required
     def api_vocab():
-        with open(VOCAB_PATH, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return jsonify(data)
+        return vocab_response(vocab_store, use_sqlite_vocab, lookup_vocab)
+
+    @app.route('/api/decks/<deck>/vocab')
+    @login_required
+    def api_deck_vocab(deck):
+        store = get_deck(deck)
+        return vocab_response(store, False, snapshot_lookup(store))
+
+    def vocab_response(store, sqlite, lookup):
+        # The body of /api/vocab for a deck held by ``store``, or for the
+        # vocab tables when ``sqlite`` is set.  ``lookup`` fetches entries
+        # by id.
+        if 'ids' in request.args:
+            # Batch lookup: ids=1,2,3 returns the entries that exist, in the
+            # requested order.
+            try:
+                ids = [int(value) for value in request.args['ids'].split(',') if value.strip()]
+            except ValueError:
+                return jsonify({'error': 'ids must be a comma-separated list of integers'}), 400
+            if len(ids) > app.config['VOCAB_MAX_PAGE_SIZE']:
+                return jsonify({'error': 'at most %d ids per request' % app.config['VOCAB_MAX_PAGE_SIZE']}), 400
+            return jsonify({'items': lookup(ids)})
+        if request.args.get('format') == 'ndjson':
+            # Streaming export of the whole deck (or one category) for bulk
+            # consumers, one JSON entry per line.
+            category = request.args.get('category', '')
+            if category == 'All':
+                category = ''
+            if sqlite:
+                return ndjson_response(iter_vocab(get_db(), category))
+            return ndjson_response(store.snapshot().iter_entries(category))
+        search_params = ('q', 'category', 'limit', 'cursor')
+        if not any(name in request.args for name in search_params):
+            # Without search parameters the whole deck is returned, which is
+            # what the static export and older clients expect.
+            # format=normalized returns the deduplicated lexeme/row form
+            # which the client expands with expandVocab().
+            kind = 'normalized' if request.args.get('format') == 'normalized' else 'full'
+            if sqlite:
+                return payload_response(sqlite_payload(kind))
+            snapshot = store.snapshot()
+            return payload_response(snapshot.payload(kind), snapshot.version)
+        try:
+            limit = int(request.args.get('limit', app.config['VOCAB_PAGE_SIZE']))
+            cursor = int(request.args.get('cursor') or 0)
+        except ValueError:
+            return jsonify({'error': 'limit and cursor must be integers'}), 400
+        limit = max(1, min(limit, app.config['VOCAB_MAX_PAGE_SIZE']))
+        category = request.args.get('category', '')
+        if category == 'All':
+            category = ''
+        query = request.args.get('q', '')
+        if request.args.get('match') == 'fuzzy' and query.strip() and not sqlite:
+            # Typo-tolerant search ranked by relevance (substring search for
+            # queries of one or two characters).  The SQLite backend has no
+            # fuzzy index and uses its full-text search.
+            items, next_cursor = store.snapshot().fuzzy_search(
+                query, category, limit, max(cursor, 0)
+            )
+        elif sqlite:
+            items, next_cursor = search_vocab(get_db(), query, category, limit, max(cursor, 0))
+        else:
+            items, next_cursor = store.snapshot().search(query, category, limit, max(cursor, 0))
+        return jsonify({'items': items, 'next_cursor': next_cursor})
+
+    @app.route('/api/vocab/changes')
+    @login_required
+    def api_vocab_changes():
+        return changes_response(vocab_store, use_sqlite_vocab)
+
+    @app.route('/api/decks/<deck>/vocab/changes')
+    @login_required
+    def api_deck_vocab_changes(deck):
+        return changes_response(get_deck(deck), False)
+
+    def changes_response(store, sqlite):
+        # Delta sync: the entries changed and the ids deleted since the
+        # client's version.  "reset" tells the client to download the whole
+        # deck (with format=normalized) instead.
+        try:
+            since = int(request.args.get('since') or 0)
+        except ValueError:
+            return jsonify({'error': 'since must be an integer'}), 400
+        if sqlite:
+            # The SQLite backend keeps no version history.
+            return jsonify({'version': None, 'reset': True})
+        snapshot, changed, deleted = store.changes_since(since)
+        if changed is None or len(changed) > len(snapshot) // 2:
+            body = {'version': snapshot.version, 'reset': True}
+        else:
+            body = {
+                'version': snapshot.version,
+                'reset': False,
+                'changed': [entry for entry in map(snapshot.get, changed) if entry is not None],
+                'deleted': deleted,
+            }
+        response = jsonify(body)
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response
+
+    @app.route('/api/vocab/usages')
+    @login_required
+    def api_vocab_usages():
+        return usages_response(vocab_store, use_sqlite_vocab)
+
+    @app.route('/api/decks/<deck>/vocab/usages')
+    @login_required
+    def api_deck_vocab_usages(deck):
+        return usages_response(get_deck(deck), False)
+
+    def usages_response(store, sqlite):
+        # Cards whose collocations or example sentence contain ``term``,
+        # found through the reverse index rather than by scanning the deck.
+        term = request.args.get('term', '')
+        if not term.strip():
+            return jsonify({'error': 'term is required'}), 400
+        try:
+            limit = int(request.args.get('limit', app.config['VOCAB_PAGE_SIZE']))
+            cursor = int(request.args.get('cursor') or 0)
+        except ValueError:
+            return jsonify({'error': 'limit and cursor must be integers'}), 400
+        limit = max(1, min(limit, app.config['VOCAB_MAX_PAGE_SIZE']))
+        if sqlite:
+            items, next_cursor = vocab_usages(get_db(), term, limit, max(cursor, 0))
+        else:
+            items, next_cursor = store.snapshot().usage_search(term, limit, max(cursor, 0))
+        return jsonify({'items': items, 'next_cursor': next_cursor})
+
+    @app.route('/api/facets')
+    @login_required
+    def api_facets():
+        return payload_response(current_facets()[1])
+
+    @app.route('/api/quiz')
+    @login_required
+    def api_quiz():
+        return quiz_response(current_facets()[0], lookup_vocab)
+
+    @app.route('/api/decks/<deck>/quiz')
+    @login_required
+    def api_deck_quiz(deck):
+        store = get_deck(deck)
+        return quiz_response(store.snapshot().facets, snapshot_lookup(store))
+
+    def quiz_response(facets, lookup):
+        # n random cards of a category with multiple-choice translations;
+        # see quiz.py.
+        try:
+            n = int(request.args.get('n', 10))
+            choices = int(request.args.get('choices', 4))
+        except ValueError:
+            return jsonify({'error': 'n and choices must be integers'}), 400
+        n = max(1, min(n, app.config['QUIZ_MAX_QUESTIONS']))
+        choices = max(2, min(choices, app.config['QUIZ_MAX_CHOICES']))
+        category = request.args.get('category', '')
+        if category == 'All':
+            category = ''
+        response = jsonify({'items': build_quiz(facets, lookup, n, category, choices)})
+        response.headers['Cache-Control'] = 'private, no-store'
+        return response
+
+    @app.route('/api/progress', methods=['POST'])
+    @login_required
+    def api_progress():
+        # Accepts many review events at once, either as a list or as
+        # {"reviews": [...]}, and queues them for the next batch write.
+        data = request.get_json(silent=True)
+        if isinstance(data, dict):
+            data = data.get('reviews')
+        if not isinstance(data, list):
+            return jsonify({'error': 'expected a list of reviews'}), 400
+        if len(data) > app.config['PROGRESS_MAX_BATCH']:
+            return jsonify({'error': 'at most %d reviews per request' % app.config['PROGRESS_MAX_BATCH']}), 400
+        try:
+            rows = review_rows(session['user_id'], data)
+        except ValueError as exc:
+            return jsonify({'error': str(exc)}), 400
+        ids = {row['vocab_id'] for row in rows}
+        unknown = ids.difference(entry['id'] for entry in lookup_vocab(sorted(ids)))
+        if unknown:
+            return jsonify({'error': 'no such entry: %d' % min(unknown)}), 400
+        try:
+            progress_buffer.add(rows)
+        except sqlite3.Error:
+            # The buffer is full and the database cannot take the events.
+            response = jsonify({'error': 'progress could not be saved, try again'})
+            response.headers['Retry-After'] = '1'
+            return response, 503
+        return jsonify({'accepted': len(rows)}), 202
+
+    @app.route('/api/progress/due')
+    @login_required
+    def api_progress_due():
+        try:
+            limit = int(request.args.get('limit', 20))
+        except ValueError:
+            return jsonify({'error': 'limit must be an integer'}), 400
+        limit = max(1, min(limit, app.config['VOCAB_MAX_PAGE_SIZE']))
+        user_id = session['user_id']
+        if progress_buffer.pending_for(user_id):
+            # Make the user's own recent reviews visible; if the database
+            # is unavailable they stay queued and show up later.
+            try:
+                progress_buffer.flush()
+            except sqlite3.Error:
+                pass
+        cards = due_cards(get_db(), user_id, limit=limit)
+        entries = {entry['id']: entry for entry in lookup_vocab([card['vocab_id'] for card in cards])}
+        for card in cards:
+            card['entry'] = entries.get(card['vocab_id'])
+        return jsonify({'items': cards})
+
+    @app.route('/api/vocab/stats')
+    @login_required
+    def api_vocab_stats():
+        return jsonify(vocab_store.stats())
+
+    @app.route('/api/decks')
+    @login_required
+    def api_decks():
+        return jsonify({'decks': deck_registry.names()})
+
+    @app.route('/api/decks/stats')
+    @login_required
+    def api_decks_stats():
+        return jsonify(deck_registry.stats())
+
+    @app.route('/ready')
+    def ready():
+        # Readiness probe: 503 while the deck cannot be loaded (the file is
+        # missing or corrupt) or the database cannot be reached.  The body
+        # is the startup report with the reasons.
+        problems = []
+        try:
+            if use_sqlite_vocab:
+                current_facets()
+            else:
+                vocab_store.snapshot()
+        except (OSError, ValueError, sqlite3.Error) as exc:
+            problems.append('vocab: %s' % exc)
+        try:
+            get_db().execute('SELECT 1')
+        except sqlite3.Error as exc:
+            problems.append('database: %s' % exc)
+        response = jsonify(dict(startup, ready=not problems, problems=problems))
+        response.headers['Cache-Control'] = 'no-store'
+        return response, 503 if problems else 200
+
+    def warm_up():
+        phases = startup['phases']
+
+        def timed(phase, func):
+            phase_started = time.perf_counter()
+            try:
+                func()
+            except (OSError, ValueError, sqlite3.Error) as exc:
+                app.logger.warning('Warm-up of %s failed: %s', phase, exc)
+            phases[phase] = time.perf_counter() - phase_started
+
+        def load_vocab():
+            if use_sqlite_vocab:
+                with app.app_context():
+                    current_facets()
+            else:
+                vocab_store.snapshot().payload('facets')
+            binary_store.current()
+            app.extensions['assets'].assets()
+            deck_registry.names()
+
+        def compile_templates():
+            # Compiled templates stay in the environment's cache.
+            for name in app.jinja_env.list_templates(extensions=('html',)):
+                app.jinja_env.get_template(name)
+
+        timed('vocab', load_vocab)
+        timed('templates', compile_templates)
+        timed('database', lambda: warm_connection(app))
+
+    if app.config['WARMUP']:
+        warm_up()
+    startup['total_seconds'] = time.perf_counter() - started
+    budget = app.config['STARTUP_BUDGET']
+    if budget and startup['total_seconds'] > budget:
+        app.logger.warning(
+            'Startup took %.3f s, over the budget of %.3f s: %r',
+            startup['total_seconds'], budget, startup['phases'],
+        )
+    if 'metrics' in app.extensions:
+        registry = app.extensions['metrics'].registry
+        registry.add(Gauge('startup_seconds', 'Seconds create_app() took, warm-up included.',
+                           lambda: startup['total_seconds']))
+        registry.add(Gauge('startup_import_seconds', 'Seconds spent importing the application modules.',
+                           lambda: startup['import_seconds']))
+        for phase in startup['phases']:
+            registry.add(Gauge('startup_%s_seconds' % phase, 'Seconds spent warming up: %s.' % phase,
+                               lambda phase=phase: startup['phases'][phase]))
 
     return app
 
 
 if __name__ == '__main__':
     app = create_app()
-    # Running the app in debug mode for development; remove debug=True in production.
+    # Running the app in debug mode for development; use serve.py in
+    # production.
     app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
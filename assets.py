@@ -0,0 +1,222 @@
+"""
+Content-hashed static assets.
+
+A browser can only keep a file without revalidating it if the URL changes
+whenever the file does.  :func:`fingerprint_assets` therefore copies each
+asset to a name carrying a hash of its content (``vocab.js`` becomes
+``vocab.<hash>.js``) and records the mapping in ``assets.json`` next to
+the files.  ``generate_vocab.py`` calls it after writing the deck; for the
+hand-written assets run this module directly::
+
+    python assets.py static vocab.js script.js style.css
+
+:func:`init_assets` makes the application resolve asset names through the
+manifest: templates call ``asset_url('script.js')``, which falls back to the
+plain name for assets that have not been fingerprinted or were edited since.  Fingerprinted files
+are served with ``Cache-Control: public, max-age=31536000, immutable``, so a
+repeat visit loads them from the browser cache without a request.
+
+The plain files are left in place for pages that reference them directly
+(such as the static ``index.html``).  Fingerprinted copies that neither the
+current nor the previous manifest refers to are deleted, so pages rendered
+just before a regeneration can still load their assets.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import threading
+import time
+
+from flask import request, url_for
+
+
+MANIFEST_NAME = 'assets.json'
+
+# Hex digits of the SHA-256 hash kept in fingerprinted names.
+HASH_LENGTH = 16
+
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+_FINGERPRINTED = re.compile(r'\.[0-9a-f]{%d}(\.[^./]+)?$' % HASH_LENGTH)
+
+
+def fingerprinted_name(name, digest):
+    """Return ``name`` with ``digest`` inserted before its extension."""
+    stem, ext = os.path.splitext(name)
+    return '%s.%s%s' % (stem, digest[:HASH_LENGTH], ext)
+
+
+def is_fingerprinted(name):
+    """Return whether ``name`` looks like a fingerprinted asset."""
+    return _FINGERPRINTED.search(name) is not None
+
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def read_manifest(static_dir):
+    """Return the asset manifest in ``static_dir`` (empty if there is none)."""
+    try:
+        with open(os.path.join(static_dir, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            return json.load(f).get('assets', {})
+    except FileNotFoundError:
+        return {}
+
+
+def fingerprint_assets(static_dir, names):
+    """Fingerprint the assets ``names`` found in ``static_dir`` and update
+    the manifest.  Returns the new manifest mapping.
+
+    Assets are copied rather than linked: the generator rewrites the plain
+    files in place, which must never change a fingerprinted file.
+    """
+    previous = read_manifest(static_dir)
+    assets = dict(previous)
+    for name in names:
+        path = os.path.join(static_dir, name)
+        if not os.path.exists(path):
+            continue
+        hashed = fingerprinted_name(name, _file_sha256(path))
+        hashed_path = os.path.join(static_dir, hashed)
+        if not os.path.exists(hashed_path):
+            shutil.copyfile(path, hashed_path + '.tmp')
+            os.replace(hashed_path + '.tmp', hashed_path)
+        assets[name] = hashed
+
+    tmp_path = os.path.join(static_dir, MANIFEST_NAME + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as out:
+        json.dump({'assets': assets}, out, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, os.path.join(static_dir, MANIFEST_NAME))
+
+    # Drop fingerprinted copies that are more than one version old.
+    keep = set(assets.values()) | set(previous.values())
+    for name in assets:
+        stem, ext = os.path.splitext(name)
+        pattern = re.compile(r'%s\.[0-9a-f]{%d}%s$' % (re.escape(stem), HASH_LENGTH, re.escape(ext)))
+        for existing in os.listdir(static_dir):
+            if pattern.match(existing) and existing not in keep:
+                os.remove(os.path.join(static_dir, existing))
+    return assets
+
+
+class AssetManifest:
+    """Process-wide view of the asset manifest in ``static_dir``.
+
+    Like :class:`vocab_store.VocabStore` the manifest file is checked for
+    changes at most once per ``check_interval`` seconds, so a regenerated
+    deck is picked up without a restart.  The plain files are checked too:
+    an asset edited since it was fingerprinted (say ``script.js`` during
+    development) no longer matches its fingerprinted copy and is served
+    under its plain name until it is fingerprinted again.
+    """
+
+    def __init__(self, static_dir, check_interval=1.0):
+        self.static_dir = static_dir
+        self.path = os.path.join(static_dir, MANIFEST_NAME)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._manifest = {}
+        self._stamp = None
+        # name -> (stamp of the plain file, fingerprinted name, match)
+        self._current = {}
+        self._assets = {}
+        self._next_check = 0.0
+
+    def check(self):
+        """Check the manifest now, whatever the interval, and return the
+        current mapping.
+        """
+        self._next_check = 0.0
+        return self.assets()
+
+    def assets(self):
+        """Return the mapping from asset names to fingerprinted names."""
+        now = time.monotonic()
+        if now < self._next_check:
+            return self._assets
+        with self._lock:
+            if now < self._next_check:
+                return self._assets
+            self._next_check = now + self.check_interval
+            try:
+                st = os.stat(self.path)
+            except FileNotFoundError:
+                self._manifest, self._stamp = {}, None
+            else:
+                if (st.st_mtime_ns, st.st_size) != self._stamp:
+                    try:
+                        self._manifest = read_manifest(self.static_dir)
+                        self._stamp = (st.st_mtime_ns, st.st_size)
+                    except (OSError, ValueError):
+                        # Keep the last good manifest while the file is rewritten.
+                        pass
+            current = {}
+            for name, hashed in self._manifest.items():
+                current[name] = self._matches(name, hashed)
+            # Build a new mapping only when it changed, so that callers can
+            # compare mappings by identity.
+            if current != self._current:
+                self._current = current
+                self._assets = {
+                    name: hashed for name, hashed in self._manifest.items() if current[name][2]
+                }
+            return self._assets
+
+    def _matches(self, name, hashed):
+        # Returns (stamp of the plain file, hashed, whether the plain file
+        # still has the content of its fingerprinted copy); the file is
+        # only read when its stamp or the manifest entry changed.
+        path = os.path.join(self.static_dir, name)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None, hashed, True
+        stamp = (st.st_mtime_ns, st.st_size)
+        previous = self._current.get(name)
+        if previous is not None and previous[:2] == (stamp, hashed):
+            return previous
+        return stamp, hashed, fingerprinted_name(name, _file_sha256(path)) == hashed
+
+    def resolve(self, name):
+        """Return the file name to serve for asset ``name``."""
+        return self.assets().get(name, name)
+
+
+def init_assets(app, check_interval=1.0):
+    """Resolve asset URLs through the manifest in ``app``'s static folder
+    and serve fingerprinted assets as immutable.  Returns the
+    :class:`AssetManifest`.
+    """
+    manifest = AssetManifest(app.static_folder, check_interval)
+    app.extensions['assets'] = manifest
+
+    @app.template_global()
+    def asset_url(name):
+        return url_for('static', filename=manifest.resolve(name))
+
+    @app.after_request
+    def cache_fingerprinted_assets(response):
+        filename = (request.view_args or {}).get('filename', '')
+        if request.endpoint == 'static' and response.status_code == 200 and is_fingerprinted(filename):
+            response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+        return response
+
+    return manifest
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 3:
+        sys.exit('usage: python assets.py STATIC_DIR ASSET...')
+    assets = fingerprint_assets(sys.argv[1], sys.argv[2:])
+    for name in sys.argv[2:]:
+        if name in assets:
+            print(f"{name} -> {assets[name]}")
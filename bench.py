@@ -0,0 +1,236 @@
+"""
+Benchmark suite for the application routes.
+
+Each route is exercised through the Flask test client against synthetic
+datasets of increasing size, built with ``generate_vocab.py`` and cached in
+``bench_data/<size>``.  Every (route, size) pair runs in a fresh Python
+process so that its peak resident set size is measured in isolation.  The
+results (p50/p95/p99 latency, throughput and peak RSS) are written to a JSON
+file which can be compared against a saved baseline::
+
+    python bench.py                                  # all routes and sizes
+    python bench.py --sizes 1000 10000 --requests 200
+    python bench.py --output new.json --baseline bench_baseline.json
+
+When a baseline is given the exit status is 1 if any route regressed by more
+than ``--tolerance`` (20% by default) in p95 latency, throughput or peak RSS,
+so the suite can be used as a regression gate.
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_ROOT = os.path.join(BASE_DIR, 'bench_data')
+
+DEFAULT_SIZES = (1000, 10000, 100000, 1000000)
+DEFAULT_REQUESTS = 100
+# The password routes are dominated by the hash cost, so they run fewer
+# requests by default.
+PASSWORD_ROUTE_REQUESTS = 20
+
+# Route name -> (method, path).  Routes marked with a path of None build
+# their request in run_route().
+ROUTES = {
+    'dashboard': ('GET', '/dashboard'),
+    'api_vocab': ('GET', '/api/vocab'),
+    'api_vocab_search': ('GET', '/api/vocab?q=gakkou&limit=50'),
+    'api_vocab_fuzzy': ('GET', '/api/vocab?q=gakko&match=fuzzy&limit=50'),
+    'api_vocab_category': ('GET', '/api/vocab?category=Education&limit=50'),
+    'api_quiz': ('GET', '/api/quiz?category=Education&n=20'),
+    'login': ('POST', None),
+    'register': ('POST', None),
+}
+PASSWORD_ROUTES = ('login', 'register')
+
+# Metrics compared against the baseline and whether higher is better.
+COMPARED_METRICS = (
+    ('p95_ms', False),
+    ('throughput_rps', True),
+    ('peak_rss_kb', False),
+)
+
+
+def dataset_dir(size):
+    """Return the directory holding the dataset of ``size`` entries,
+    generating it first if necessary.
+    """
+    directory = os.path.join(DATA_ROOT, str(size))
+    if not os.path.exists(os.path.join(directory, 'data', 'vocab.json')):
+        from generate_vocab import generate_vocab
+
+        generate_vocab(count=size, output_dir=directory, pretty=False, jobs=os.cpu_count() or 1)
+    return directory
+
+
+def percentile(sorted_values, fraction):
+    """Return the nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def run_route(route, size, requests, warmup, hash_method):
+    """Benchmark one route against one dataset in the current process."""
+    from app import create_app
+    from purchase_codes import import_codes
+
+    directory = dataset_dir(size)
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app({
+            'TESTING': True,
+            'DATABASE': os.path.join(tmp, 'bench.db'),
+            'VOCAB_PATH': os.path.join(directory, 'data', 'vocab.json'),
+            'PASSWORD_HASH_METHOD': hash_method,
+        })
+        # Every registration uses up a purchase code.
+        db = sqlite3.connect(app.config['DATABASE'])
+        import_codes(db, ('BENCH-%d' % i for i in range(requests + warmup + 1)))
+        db.close()
+        client = app.test_client()
+        client.post('/register', data={'username': 'bench', 'password': 'bench', 'code': 'BENCH-%d' % (requests + warmup)})
+        if route not in PASSWORD_ROUTES:
+            client.post('/login', data={'username': 'bench', 'password': 'bench'})
+
+        counter = iter(range(requests + warmup))
+
+        def request_once():
+            method, path = ROUTES[route]
+            if route == 'login':
+                return client.post('/login', data={'username': 'bench', 'password': 'bench'})
+            if route == 'register':
+                i = next(counter)
+                return client.post('/register', data={'username': 'bench-%d' % i, 'password': 'bench', 'code': 'BENCH-%d' % i})
+            return client.open(path, method=method)
+
+        for _ in range(warmup):
+            request_once()
+
+        latencies = []
+        response_bytes = 0
+        started = time.perf_counter()
+        for _ in range(requests):
+            t0 = time.perf_counter()
+            response = request_once()
+            response_bytes += len(response.get_data())
+            latencies.append((time.perf_counter() - t0) * 1000.0)
+            if response.status_code >= 400:
+                raise RuntimeError('%s returned %d' % (route, response.status_code))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'requests': requests,
+        'p50_ms': percentile(latencies, 0.50),
+        'p95_ms': percentile(latencies, 0.95),
+        'p99_ms': percentile(latencies, 0.99),
+        'mean_ms': sum(latencies) / len(latencies),
+        'throughput_rps': requests / elapsed,
+        'mean_response_bytes': response_bytes / requests,
+        'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def run_isolated(route, size, requests, warmup, hash_method):
+    """Run :func:`run_route` in a child process and return its result."""
+    output = subprocess.check_output([
+        sys.executable, os.path.abspath(__file__), '--run-one',
+        '--routes', route, '--sizes', str(size),
+        '--requests', str(requests), '--warmup', str(warmup),
+        '--hash-method', hash_method,
+    ], cwd=BASE_DIR)
+    return json.loads(output.decode('utf-8').splitlines()[-1])
+
+
+def compare(results, baseline, tolerance):
+    """Print the differences to ``baseline`` and return the regressions."""
+    regressions = []
+    for route, sizes in results['results'].items():
+        for size, metrics in sizes.items():
+            base = baseline.get('results', {}).get(route, {}).get(size)
+            if not base:
+                continue
+            for metric, higher_is_better in COMPARED_METRICS:
+                old, new = base[metric], metrics[metric]
+                if not old:
+                    continue
+                change = (new - old) / old
+                worse = -change if higher_is_better else change
+                flag = ''
+                if worse > tolerance:
+                    flag = '  REGRESSION'
+                    regressions.append((route, size, metric, old, new))
+                print(f"{route:<20} {size:>8} {metric:<15} {old:12.2f} -> {new:12.2f} ({change:+.1%}){flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--routes', nargs='+', choices=sorted(ROUTES), default=list(ROUTES))
+    parser.add_argument('--sizes', nargs='+', type=int, default=list(DEFAULT_SIZES))
+    parser.add_argument('--requests', type=int, default=DEFAULT_REQUESTS)
+    parser.add_argument('--warmup', type=int, default=5)
+    parser.add_argument(
+        '--hash-method', default='pbkdf2:sha256:600000',
+        help='password hash method used for the login and register routes',
+    )
+    parser.add_argument('--output', default='bench_results.json')
+    parser.add_argument('--baseline', help='results file to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    parser.add_argument('--run-one', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.run_one:
+        result = run_route(args.routes[0], args.sizes[0], args.requests, args.warmup, args.hash_method)
+        print(json.dumps(result))
+        return 0
+
+    results = {
+        'meta': {
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'hash_method': args.hash_method,
+        },
+        'results': {},
+    }
+    for size in args.sizes:
+        dataset_dir(size)
+        for route in args.routes:
+            requests = args.requests
+            if route in PASSWORD_ROUTES:
+                requests = min(requests, PASSWORD_ROUTE_REQUESTS)
+            metrics = run_isolated(route, size, requests, args.warmup, args.hash_method)
+            results['results'].setdefault(route, {})[str(size)] = metrics
+            print(
+                f"{route:<20} {size:>8}  p50 {metrics['p50_ms']:8.2f} ms  p95 {metrics['p95_ms']:8.2f} ms  "
+                f"p99 {metrics['p99_ms']:8.2f} ms  {metrics['throughput_rps']:9.1f} req/s  "
+                f"rss {metrics['peak_rss_kb'] / 1024:7.1f} MB"
+            )
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"Wrote {args.output}.")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}.")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+Registry of the vocabulary decks on sale.
+
+Every ``<name>.json`` or ``<name>.ndjson`` file in the decks directory
+(``data/decks`` by default) is a deck called ``<name>``, for example
+``jlpt-n5.json`` or ``business.json``.  The directory is rescanned at most
+once per ``check_interval`` seconds, so a deck can be added without a
+restart.
+
+A deck is parsed and indexed the first time it is asked for, by a
+:class:`vocab_store.VocabStore` of its own that then reloads it on change
+like the main deck.  Loaded decks are kept in least-recently-used order
+and the least recently used ones are dropped once more than ``max_decks``
+are loaded or their files add up to more than ``max_bytes``.  The file size
+stands in for the memory a deck takes: a parsed deck takes a few times its
+file size, whatever the deck, so the budget scales the same way.  A deck
+that is dropped is loaded again on its next use; requests still holding
+its snapshot finish with it.
+
+Each worker process has its own registry, so a worker only holds the decks
+its own requests used recently.  :meth:`DeckRegistry.stats` reports the
+hits, misses and evictions for sizing the budget.
+"""
+
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from vocab_store import VocabStore
+
+
+DECK_EXTENSIONS = ('.json', '.ndjson')
+
+# Deck names appear in URLs, so they are restricted to a safe alphabet.
+DECK_NAME = re.compile(r'^[A-Za-z0-9][A-Za-z0-9_-]*$')
+
+
+class DeckRegistry:
+    """Lazily loaded decks with a least-recently-used budget.
+
+    ``max_decks`` or ``max_bytes`` of 0 disables that limit.  The most
+    recently requested deck is never evicted, even if it alone exceeds the
+    budget.
+    """
+
+    def __init__(self, directory, check_interval=1.0, max_decks=4, max_bytes=0):
+        self.directory = directory
+        self.check_interval = check_interval
+        self.max_decks = max_decks
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # name -> (path, file size)
+        self._available = {}
+        self._next_scan = 0.0
+        # name -> (VocabStore, file size), least recently used first
+        self._loaded = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _scan(self):
+        now = time.monotonic()
+        if now < self._next_scan:
+            return self._available
+        available = {}
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            names = []
+        for filename in sorted(names):
+            name, ext = os.path.splitext(filename)
+            if ext in DECK_EXTENSIONS and DECK_NAME.match(name) and name not in available:
+                path = os.path.join(self.directory, filename)
+                try:
+                    available[name] = (path, os.path.getsize(path))
+                except OSError:
+                    continue
+        self._available = available
+        self._next_scan = now + self.check_interval
+        return available
+
+    def names(self):
+        """Return the sorted names of the available decks."""
+        with self._lock:
+            return sorted(self._scan())
+
+    def get(self, name):
+        """Return the :class:`VocabStore` of deck ``name`` with its snapshot
+        loaded, or ``None`` if there is no such deck.
+        """
+        with self._lock:
+            deck = self._scan().get(name)
+            if deck is None:
+                return None
+            path, size = deck
+            loaded = self._loaded.get(name)
+            if loaded is not None and loaded[0].path == path:
+                self._loaded.move_to_end(name)
+                self.hits += 1
+                store = loaded[0]
+            else:
+                self.misses += 1
+                store = VocabStore(path, self.check_interval)
+                self._loaded[name] = (store, size)
+                self._evict()
+        # Parse outside the registry lock so that a large deck does not hold
+        # up requests for decks that are already loaded; concurrent first
+        # requests for the same deck wait on the store's own lock.
+        store.snapshot()
+        return store
+
+    def _evict(self):
+        while len(self._loaded) > 1 and (
+            (self.max_decks and len(self._loaded) > self.max_decks)
+            or (self.max_bytes and self._loaded_bytes() > self.max_bytes)
+        ):
+            self._loaded.popitem(last=False)
+            self.evictions += 1
+
+    def _loaded_bytes(self):
+        return sum(size for _, size in self._loaded.values())
+
+    def stats(self):
+        """Return the cache counters and the loaded decks, least recently
+        used first.
+        """
+        with self._lock:
+            return {
+                'available': len(self._scan()),
+                'loaded': list(self._loaded),
+                'loaded_bytes': self._loaded_bytes(),
+                'max_decks': self.max_decks,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
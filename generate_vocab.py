@@ -1,17 +1,837 @@
+"""
+Generator for the synthetic vocabulary dataset.
+
+Run ``python generate_vocab.py --help`` for the command line options.  The
+defaults reproduce the bundled 1000-entry ``data/vocab.json`` and
+``static/vocab.js``; ``--count``, ``--seed`` and ``--jobs`` produce large
+load-test fixtures quickly.
+"""
+
+import argparse
+import hashlib
 import json
+import multiprocessing
 import os
+import random
+import re
+import shutil
+import sqlite3
+import struct
+import tempfile
+
+from assets import fingerprint_assets
+from vocab_binary import BinaryVocabWriter, encode_record, source_stamp
+from vocab_db import REBUILD_USAGE_FTS, entry_row, init_vocab_schema
+from vocab_store import LEXEME_FIELDS, NORMALIZED_FORMAT
+
+
+# Base vocabulary entries.  Each dictionary defines:
+#   - word: The Japanese expression in kanji/hiragana/katakana
+#   - reading: The pronunciation in romaji
+#   - translation: A short English translation or gloss
+#   - part: Part of speech (noun, verb, adjective, expression, etc.)
+#   - collocations: A list of common collocations or compound forms
+#   - example: A sample sentence using the word
+#   - category: A default thematic category
+BASE_ENTRIES = [
+    {
+        "word": "こんにちは",
+        "reading": "konnichiwa",
+        "translation": "Hello",
+        "part": "expression",
+        "collocations": ["こんにちは、元気ですか？", "こんにちはと言う"],
+        "example": "彼は私にこんにちはと言いました。",
+        "category": "Greetings",
+    },
+    {
+        "word": "おはようございます",
+        "reading": "ohayou gozaimasu",
+        "translation": "Good morning",
+        "part": "expression",
+        "collocations": ["おはよう", "おはようございます"],
+        "example": "朝起きて家族におはようございますと言います。",
+        "category": "Greetings",
+    },
+    {
+        "word": "こんばんは",
+        "reading": "konbanwa",
+        "translation": "Good evening",
+        "part": "expression",
+        "collocations": ["こんばんは、と挨拶する"],
+        "example": "夜に友達に会ってこんばんはと言いました。",
+        "category": "Greetings",
+    },
+    {
+        "word": "ありがとう",
+        "reading": "arigatou",
+        "translation": "Thank you",
+        "part": "expression",
+        "collocations": ["ありがとうございます", "本当にありがとう"],
+        "example": "助けてくれてありがとう。",
+        "category": "Social",
+    },
+    {
+        "word": "ごめんなさい",
+        "reading": "gomen nasai",
+        "translation": "Sorry",
+        "part": "expression",
+        "collocations": ["ごめん", "ごめんなさいと言う"],
+        "example": "遅れてごめんなさい。",
+        "category": "Social",
+    },
+    {
+        "word": "すみません",
+        "reading": "sumimasen",
+        "translation": "Excuse me / I'm sorry",
+        "part": "expression",
+        "collocations": ["すみませんが", "すみませんと言う"],
+        "example": "店員さんにすみませんと声をかけました。",
+        "category": "Social",
+    },
+    {
+        "word": "はい",
+        "reading": "hai",
+        "translation": "Yes",
+        "part": "expression",
+        "collocations": ["はい、そうです", "はい、と答える"],
+        "example": "質問に対してはいと答えました。",
+        "category": "Conversation",
+    },
+    {
+        "word": "いいえ",
+        "reading": "iie",
+        "translation": "No",
+        "part": "expression",
+        "collocations": ["いいえ、違います", "いいえ、と答える"],
+        "example": "それは違いますか？いいえ、と言いました。",
+        "category": "Conversation",
+    },
+    {
+        "word": "わかりません",
+        "reading": "wakarimasen",
+        "translation": "I don't understand",
+        "part": "expression",
+        "collocations": ["わかりません、と答える"],
+        "example": "この漢字の意味がわかりません。",
+        "category": "Conversation",
+    },
+    {
+        "word": "助けてください",
+        "reading": "tasukete kudasai",
+        "translation": "Please help me",
+        "part": "expression",
+        "collocations": ["助けて", "助けてくださいと叫ぶ"],
+        "example": "危険な状況で助けてくださいと言いました。",
+        "category": "Emergencies",
+    },
+    {
+        "word": "名前",
+        "reading": "namae",
+        "translation": "Name",
+        "part": "noun",
+        "collocations": ["名前を書く", "名前を聞く"],
+        "example": "初対面のときに相手の名前を聞きます。",
+        "category": "Personal",
+    },
+    {
+        "word": "学校",
+        "reading": "gakkou",
+        "translation": "School",
+        "part": "noun",
+        "collocations": ["学校へ行く", "学校の先生"],
+        "example": "明日学校に行きます。",
+        "category": "Education",
+    },
+    {
+        "word": "学生",
+        "reading": "gakusei",
+        "translation": "Student",
+        "part": "noun",
+        "collocations": ["大学生", "学生生活"],
+        "example": "私は大学の学生です。",
+        "category": "Education",
+    },
+    {
+        "word": "先生",
+        "reading": "sensei",
+        "translation": "Teacher",
+        "part": "noun",
+        "collocations": ["英語の先生", "先生に質問する"],
+        "example": "先生に宿題を見てもらいました。",
+        "category": "Education",
+    },
+    {
+        "word": "愛",
+        "reading": "ai",
+        "translation": "Love",
+        "part": "noun",
+        "collocations": ["愛する", "愛を感じる"],
+        "example": "家族への愛は深い。",
+        "category": "Emotions",
+    },
+    {
+        "word": "猫",
+        "reading": "neko",
+        "translation": "Cat",
+        "part": "noun",
+        "collocations": ["黒い猫", "猫が鳴く"],
+        "example": "猫が庭で遊んでいる。",
+        "category": "Animals",
+    },
+    {
+        "word": "犬",
+        "reading": "inu",
+        "translation": "Dog",
+        "part": "noun",
+        "collocations": ["犬を散歩させる", "大型犬"],
+        "example": "毎朝犬と散歩します。",
+        "category": "Animals",
+    },
+    {
+        "word": "食べる",
+        "reading": "taberu",
+        "translation": "to eat",
+        "part": "verb",
+        "collocations": ["ご飯を食べる", "昼食を食べる"],
+        "example": "昼ご飯に何を食べますか？",
+        "category": "Food & Drink",
+    },
+    {
+        "word": "飲む",
+        "reading": "nomu",
+        "translation": "to drink",
+        "part": "verb",
+        "collocations": ["水を飲む", "お茶を飲む"],
+        "example": "運動した後に水を飲みます。",
+        "category": "Food & Drink",
+    },
+    {
+        "word": "行く",
+        "reading": "iku",
+        "translation": "to go",
+        "part": "verb",
+        "collocations": ["学校へ行く", "旅行に行く"],
+        "example": "週末に友達と映画館へ行きます。",
+        "category": "Travel & Transportation",
+    },
+    {
+        "word": "見る",
+        "reading": "miru",
+        "translation": "to see / to watch",
+        "part": "verb",
+        "collocations": ["映画を見る", "景色を見る"],
+        "example": "夜空の星を見るのが好きです。",
+        "category": "Leisure",
+    },
+    {
+        "word": "話す",
+        "reading": "hanasu",
+        "translation": "to speak",
+        "part": "verb",
+        "collocations": ["日本語で話す", "友達と話す"],
+        "example": "友達と電話で話す。",
+        "category": "Conversation",
+    },
+    {
+        "word": "聞く",
+        "reading": "kiku",
+        "translation": "to listen / to ask",
+        "part": "verb",
+        "collocations": ["音楽を聞く", "質問を聞く"],
+        "example": "授業で先生の話を聞く。",
+        "category": "Conversation",
+    },
+    {
+        "word": "来る",
+        "reading": "kuru",
+        "translation": "to come",
+        "part": "verb",
+        "collocations": ["家に来る", "友達が来る"],
+        "example": "今夜、友達が家に来ます。",
+        "category": "Travel & Transportation",
+    },
+    {
+        "word": "する",
+        "reading": "suru",
+        "translation": "to do",
+        "part": "verb",
+        "collocations": ["勉強する", "運動する"],
+        "example": "週末に掃除をする。",
+        "category": "Daily Life",
+    },
+    {
+        "word": "作る",
+        "reading": "tsukuru",
+        "translation": "to make / to create",
+        "part": "verb",
+        "collocations": ["料理を作る", "作品を作る"],
+        "example": "母は毎日おいしい料理を作ります。",
+        "category": "Daily Life",
+    },
+    {
+        "word": "読む",
+        "reading": "yomu",
+        "translation": "to read",
+        "part": "verb",
+        "collocations": ["本を読む", "新聞を読む"],
+        "example": "寝る前に本を読むのが習慣です。",
+        "category": "Education",
+    },
+    {
+        "word": "書く",
+        "reading": "kaku",
+        "translation": "to write",
+        "part": "verb",
+        "collocations": ["手紙を書く", "日記を書く"],
+        "example": "毎日日記を書くようにしています。",
+        "category": "Education",
+    },
+    {
+        "word": "買う",
+        "reading": "kau",
+        "translation": "to buy",
+        "part": "verb",
+        "collocations": ["買い物をする", "本を買う"],
+        "example": "明日新しい靴を買います。",
+        "category": "Shopping",
+    },
+    {
+        "word": "売る",
+        "reading": "uru",
+        "translation": "to sell",
+        "part": "verb",
+        "collocations": ["商品を売る", "高く売る"],
+        "example": "古い自転車を売りました。",
+        "category": "Shopping",
+    },
+    {
+        "word": "好き",
+        "reading": "suki",
+        "translation": "like / fond of",
+        "part": "adjective",
+        "collocations": ["好きな食べ物", "好きになる"],
+        "example": "私は寿司が好きです。",
+        "category": "Emotions",
+    },
+    {
+        "word": "嫌い",
+        "reading": "kirai",
+        "translation": "dislike / hate",
+        "part": "adjective",
+        "collocations": ["嫌いな食べ物", "嫌いになる"],
+        "example": "私は運動が嫌いではありません。",
+        "category": "Emotions",
+    },
+    {
+        "word": "美しい",
+        "reading": "utsukushii",
+        "translation": "beautiful",
+        "part": "adjective",
+        "collocations": ["美しい景色", "美しい花"],
+        "example": "春には桜がとても美しい。",
+        "category": "Nature",
+    },
+    {
+        "word": "大きい",
+        "reading": "ookii",
+        "translation": "big / large",
+        "part": "adjective",
+        "collocations": ["大きい家", "大きいサイズ"],
+        "example": "その犬はとても大きい。",
+        "category": "Description",
+    },
+    {
+        "word": "小さい",
+        "reading": "chiisai",
+        "translation": "small",
+        "part": "adjective",
+        "collocations": ["小さい村", "小さい子ども"],
+        "example": "彼の手は小さい。",
+        "category": "Description",
+    },
+    {
+        "word": "高い",
+        "reading": "takai",
+        "translation": "high / tall / expensive",
+        "part": "adjective",
+        "collocations": ["高い山", "値段が高い"],
+        "example": "この時計はとても高いです。",
+        "category": "Description",
+    },
+    {
+        "word": "安い",
+        "reading": "yasui",
+        "translation": "cheap / inexpensive",
+        "part": "adjective",
+        "collocations": ["安い商品", "値段が安い"],
+        "example": "この店は安い服が多い。",
+        "category": "Shopping",
+    },
+    {
+        "word": "新しい",
+        "reading": "atarashii",
+        "translation": "new",
+        "part": "adjective",
+        "collocations": ["新しい車", "新しいアイデア"],
+        "example": "昨日新しい本を買いました。",
+        "category": "Description",
+    },
+    {
+        "word": "古い",
+        "reading": "furui",
+        "translation": "old",
+        "part": "adjective",
+        "collocations": ["古い建物", "古い友人"],
+        "example": "これは古い写真です。",
+        "category": "Description",
+    },
+    {
+        "word": "早い",
+        "reading": "hayai",
+        "translation": "fast / early",
+        "part": "adjective",
+        "collocations": ["早い電車", "時間が早い"],
+        "example": "彼は早い時間に起きます。",
+        "category": "Description",
+    },
+    {
+        "word": "遅い",
+        "reading": "osoi",
+        "translation": "late / slow",
+        "part": "adjective",
+        "collocations": ["遅い時間", "動きが遅い"],
+        "example": "今日は遅い電車に乗りました。",
+        "category": "Description",
+    },
+    {
+        "word": "便利",
+        "reading": "benri",
+        "translation": "convenient",
+        "part": "adjective",
+        "collocations": ["便利な道具", "便利な場所"],
+        "example": "このアプリはとても便利です。",
+        "category": "Description",
+    },
+    {
+        "word": "大丈夫",
+        "reading": "daijoubu",
+        "translation": "it's okay / I'm fine",
+        "part": "expression",
+        "collocations": ["大丈夫ですか", "大丈夫と言う"],
+        "example": "怪我はありませんか？大丈夫です。",
+        "category": "Conversation",
+    },
+    {
+        "word": "お願いします",
+        "reading": "onegaishimasu",
+        "translation": "please",
+        "part": "expression",
+        "collocations": ["よろしくお願いします", "お願いしますと頼む"],
+        "example": "注文をお願いします。",
+        "category": "Conversation",
+    },
+    {
+        "word": "どこ",
+        "reading": "doko",
+        "translation": "where",
+        "part": "pronoun",
+        "collocations": ["どこですか？", "どこにありますか？"],
+        "example": "駅はどこですか？",
+        "category": "Directions",
+    },
+    {
+        "word": "いくら",
+        "reading": "ikura",
+        "translation": "how much",
+        "part": "interrogative",
+        "collocations": ["いくらですか", "値段はいくら"],
+        "example": "このリンゴはいくらですか？",
+        "category": "Shopping",
+    },
+]
+
+# Define a list of categories to cycle through when generating duplicates.
+CATEGORIES = [
+    "Greetings", "Daily Life", "Food & Drink", "Travel", "Shopping",
+    "Office", "Health", "Family", "Emotions", "Fitness", "Leisure",
+    "Technology", "Education", "Weather", "Hobbies", "Home", "Directions",
+    "Numbers", "Nature", "Animals", "Time", "Finance", "Grocery", "Tourism",
+    "Medical", "Social", "Business", "Media", "Hotel", "Misc"
+]
+# Entries are produced in chunks of this many ids.  With a seed, each chunk
+# draws from its own random generator, so the output does not depend on how
+# the work is split between processes.
+CHUNK_SIZE = 65536
+
+# Number of rows handed to executemany() at a time when writing to SQLite.
+SQLITE_BATCH = 5000
+
+DATA_FORMATS = ('json', 'ndjson')
+
+# (id, record length) pairs in the shard index of the binary deck.
+BINARY_INDEX = struct.Struct("<qI")
+
+# Files in static/ that are fingerprinted for the asset manifest (see
+# assets.py).  script.js and style.css are included when they are present.
+STATIC_ASSETS = ("vocab.js", "script.js", "style.css")
+
+
+def iter_layout(start, stop, count, seed=None):
+    """Yield ``(base_index, category_index)`` for entry positions
+    ``start`` to ``stop`` of a dataset of ``count`` entries.
+
+    Without a seed, each base entry is duplicated across consecutive ids and
+    the categories cycle through :data:`CATEGORIES`, which is the layout of
+    the bundled dataset.  With a seed, base entries and categories are drawn
+    at random.
+    """
+    if seed is None:
+        duplicate_factor = (count + len(BASE_ENTRIES) - 1) // len(BASE_ENTRIES)
+        for index in range(start, stop):
+            yield index // duplicate_factor, index % len(CATEGORIES)
+        return
+    chunk = start // CHUNK_SIZE
+    index = chunk * CHUNK_SIZE
+    while index < stop:
+        rng = random.Random('%s:%d' % (seed, chunk))
+        chunk_stop = min(index + CHUNK_SIZE, stop)
+        while index < chunk_stop:
+            pair = rng.randrange(len(BASE_ENTRIES)), rng.randrange(len(CATEGORIES))
+            if index >= start:
+                yield pair
+            index += 1
+        chunk += 1
+
+
+def make_entry(entry_id, base_index, category_index):
+    """Build the entry dictionary for one generated id."""
+    entry = BASE_ENTRIES[base_index].copy()
+    entry["id"] = entry_id
+    entry["category"] = CATEGORIES[category_index]
+    return entry
+
+
+class EntryTemplates:
+    """Pre-rendered JSON for every base entry.
+
+    Generated entries differ from their base entry only in ``category`` and
+    ``id``, so each base entry is serialized once with placeholders and every
+    entry is then produced by string concatenation instead of a full
+    ``json.dumps``.  The output is byte-for-byte what ``json.dump`` of the
+    entry list would produce.
+    """
+
+    def __init__(self, pretty):
+        self.categories = [json.dumps(c, ensure_ascii=False) for c in CATEGORIES]
+        self.pieces = []
+        for base in BASE_ENTRIES:
+            sample = dict(base, category="\0category\0", id="\0id\0")
+            if pretty:
+                text = json.dumps(sample, ensure_ascii=False, indent=2)
+                text = "\n".join("  " + line for line in text.split("\n"))
+            else:
+                text = json.dumps(sample, ensure_ascii=False, separators=(",", ":"))
+            head, _, rest = text.partition('"\\u0000category\\u0000"')
+            middle, _, tail = rest.partition('"\\u0000id\\u0000"')
+            self.pieces.append((head, middle, tail))
+
+    def render(self, entry_id, base_index, category_index):
+        head, middle, tail = self.pieces[base_index]
+        return head + self.categories[category_index] + middle + str(entry_id) + tail
+
+
+class FragmentWriter:
+    """Writes one shard of the output files into ``directory``.
+
+    The data file fragment holds the shard's entries (joined with the JSON
+    array separator, or one per line for NDJSON) and the three column
+    fragments hold the ids, lexeme refs and category refs of the normalized
+    ``vocab.js``.  The packed records of the binary deck (see
+    ``vocab_binary.py``) go to ``bin_records`` with their ids and lengths in
+    ``bin_index``.  Each category additionally gets its own id and lexeme ref
+    columns for the per-category chunks, and ``chunk_lexemes.json`` records
+    which base entries each category uses.  :func:`assemble` stitches the
+    fragments of all shards together.
+    """
+
+    def __init__(self, directory, data_format, pretty):
+        self.directory = directory
+        self.templates = EntryTemplates(pretty and data_format == 'json')
+        if data_format == 'ndjson':
+            self.separator = ''
+            self.terminator = '\n'
+        else:
+            self.separator = ',\n' if pretty else ','
+            self.terminator = ''
+        self.data = open(os.path.join(directory, 'data'), 'w', encoding='utf-8')
+        self.columns = [
+            open(os.path.join(directory, name), 'w', encoding='utf-8')
+            for name in ('ids', 'lexeme_refs', 'category_refs')
+        ]
+        self.records = open(os.path.join(directory, 'bin_records'), 'wb')
+        self.record_index = open(os.path.join(directory, 'bin_index'), 'wb')
+        # Packed records depend only on the base entry and the category.
+        self.record_cache = {}
+        self.chunks = {}
+        self.count = 0
+
+    def add(self, entry_id, base_index, category_index):
+        prefix = self.separator if self.count else ''
+        column_prefix = ',' if self.count else ''
+        self.data.write(prefix + self.templates.render(entry_id, base_index, category_index) + self.terminator)
+        ids, lexeme_refs, category_refs = self.columns
+        ids.write(column_prefix + str(entry_id))
+        lexeme_refs.write(column_prefix + str(base_index))
+        category_refs.write(column_prefix + str(category_index))
+        record = self.record_cache.get((base_index, category_index))
+        if record is None:
+            record = self.record_cache[base_index, category_index] = encode_record(
+                make_entry(entry_id, base_index, category_index)
+            )
+        self.records.write(record)
+        self.record_index.write(BINARY_INDEX.pack(entry_id, len(record)))
+        self.count += 1
+
+        chunk = self.chunks.get(category_index)
+        if chunk is None:
+            chunk = self.chunks[category_index] = [
+                open(os.path.join(self.directory, chunk_fragment(category_index, 'ids')), 'w', encoding='utf-8'),
+                open(os.path.join(self.directory, chunk_fragment(category_index, 'lexeme_refs')), 'w', encoding='utf-8'),
+                set(),
+                0,
+            ]
+        chunk_prefix = ',' if chunk[3] else ''
+        chunk[0].write(chunk_prefix + str(entry_id))
+        chunk[1].write(chunk_prefix + str(base_index))
+        chunk[2].add(base_index)
+        chunk[3] += 1
+
+    def close(self):
+        self.data.close()
+        for column in self.columns:
+            column.close()
+        self.records.close()
+        self.record_index.close()
+        used = {}
+        for category_index, (ids, lexeme_refs, bases, count) in self.chunks.items():
+            ids.close()
+            lexeme_refs.close()
+            used[category_index] = [sorted(bases), count]
+        with open(os.path.join(self.directory, 'chunk_lexemes.json'), 'w', encoding='utf-8') as f:
+            json.dump(used, f)
+
+
+def chunk_fragment(category_index, column):
+    """Return the fragment file name of a per-category column."""
+    return 'chunk%03d-%s' % (category_index, column)
+
+
+def chunk_file_name(category_index):
+    """Return the file name of a category's chunk below ``static/vocab``."""
+    slug = re.sub(r'[^a-z0-9]+', '-', CATEGORIES[category_index].lower()).strip('-')
+    return '%02d-%s.json' % (category_index, slug or 'category')
+
 
+class SqliteWriter:
+    """Streams entries into the ``vocab`` tables of a SQLite database.
 
-def generate_vocab():
+    All rows are written in one transaction, in batches of
+    :data:`SQLITE_BATCH`, and the full-text index is rebuilt once at the end.
     """
-    Generate a synthetic Japanese vocabulary dataset containing more than 1000
-    entries.  The dataset is built from a set of base entries which each
-    include a Japanese expression, its reading in romaji, an English (or
-    Chinese) translation, part‑of‑speech information, collocations, a sample
-    sentence and a thematic category.  Each base entry is duplicated across
-    multiple categories to produce a total of 1000 entries.  Duplicate
-    entries are assigned unique identifiers so that they can be referenced
-    individually.
+
+    def __init__(self, path):
+        self.db = sqlite3.connect(path)
+        init_vocab_schema(self.db)
+        self.db.execute('DELETE FROM vocab')
+        self.rows = []
+        self.count = 0
+
+    def add(self, entry_id, base_index, category_index):
+        self.rows.append(entry_row(make_entry(entry_id, base_index, category_index)))
+        if len(self.rows) >= SQLITE_BATCH:
+            self._flush()
+
+    def _flush(self):
+        self.db.executemany(
+            'INSERT INTO vocab (id, word, reading, translation, part, collocations, example, category) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            self.rows,
+        )
+        self.count += len(self.rows)
+        self.rows = []
+
+    def close(self):
+        self._flush()
+        self.db.execute("INSERT INTO vocab_fts (vocab_fts) VALUES ('rebuild')")
+        self.db.execute(REBUILD_USAGE_FTS)
+        self.db.commit()
+        self.db.close()
+
+
+def generate_range(start, stop, count, seed, writers):
+    """Feed entry positions ``start`` to ``stop`` to every writer."""
+    layout = iter_layout(start, stop, count, seed)
+    for index, (base_index, category_index) in enumerate(layout, start):
+        for writer in writers:
+            writer.add(index + 1, base_index, category_index)
+    for writer in writers:
+        writer.close()
+
+
+def _generate_shard(args):
+    directory, start, stop, count, seed, data_format, pretty = args
+    os.makedirs(directory, exist_ok=True)
+    generate_range(start, stop, count, seed, [FragmentWriter(directory, data_format, pretty)])
+    return directory
+
+
+def _copy_fragments(shards, name, out, separator):
+    first = True
+    for shard in shards:
+        path = os.path.join(shard, name)
+        if not os.path.getsize(path):
+            continue
+        if not first:
+            out.write(separator)
+        with open(path, 'r', encoding='utf-8') as f:
+            shutil.copyfileobj(f, out, 1024 * 1024)
+        first = False
+    return not first
+
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def assemble_binary(shards, binary_path, count, data_path):
+    """Write the binary deck from the shards' record fragments, stamped
+    with the data file they match.
+    """
+    writer = BinaryVocabWriter(binary_path, count, source_stamp(data_path))
+    for shard in shards:
+        with open(os.path.join(shard, 'bin_index'), 'rb') as index, \
+                open(os.path.join(shard, 'bin_records'), 'rb') as records:
+            while True:
+                block = index.read(BINARY_INDEX.size * 4096)
+                if not block:
+                    break
+                for entry_id, length in BINARY_INDEX.iter_unpack(block):
+                    writer.add(entry_id, records.read(length))
+    writer.close()
+
+
+def assemble(shards, data_path, vocab_js_path, chunk_dir, data_format, pretty):
+    """Concatenate the shard fragments into the final output files."""
+    with open(data_path, 'w', encoding='utf-8') as out:
+        if data_format == 'ndjson':
+            _copy_fragments(shards, 'data', out, '')
+        else:
+            out.write('[\n' if pretty else '[')
+            separator = ',\n' if pretty else ','
+            if _copy_fragments(shards, 'data', out, separator) and pretty:
+                out.write('\n]')
+            elif pretty:
+                out.seek(0)
+                out.truncate()
+                out.write('[]')
+            else:
+                out.write(']')
+
+    # The static site's copy of the deck is written in normalized form (see
+    # normalize_entries in vocab_store.py): each base entry once, plus compact
+    # id/lexeme/category columns that expandVocab() in script.js turns back
+    # into entries.
+    lexemes = [[base.get(field, '') for field in LEXEME_FIELDS] for base in BASE_ENTRIES]
+    header = {
+        'format': NORMALIZED_FORMAT,
+        'fields': list(LEXEME_FIELDS),
+        'lexemes': lexemes,
+        'categories': CATEGORIES,
+    }
+    with open(vocab_js_path, 'w', encoding='utf-8') as out:
+        out.write('const vocabNormalized = ')
+        out.write(json.dumps(header, ensure_ascii=False, separators=(',', ':'))[:-1])
+        for name in ('ids', 'lexeme_refs', 'category_refs'):
+            out.write(',"%s":[' % name)
+            _copy_fragments(shards, name, out, ',')
+            out.write(']')
+        out.write('};\n')
+
+    assemble_chunks(shards, chunk_dir, lexemes)
+
+
+def assemble_chunks(shards, chunk_dir, lexemes):
+    """Write one normalized chunk per category plus ``manifest.json``.
+
+    A chunk holds only its category's entries and the lexemes they use, keyed
+    by their index in :data:`BASE_ENTRIES`, so the dashboard can fetch the
+    category the user is looking at without downloading the whole deck.  The
+    manifest lists every chunk with its entry count and SHA-256 hash.
+    """
+    os.makedirs(chunk_dir, exist_ok=True)
+    used = {}
+    for shard in shards:
+        with open(os.path.join(shard, 'chunk_lexemes.json'), 'r', encoding='utf-8') as f:
+            for category_index, (bases, count) in json.load(f).items():
+                entry = used.setdefault(int(category_index), [set(), 0])
+                entry[0].update(bases)
+                entry[1] += count
+
+    chunks = {}
+    for category_index in sorted(used, key=lambda i: CATEGORIES[i]):
+        bases, count = used[category_index]
+        name = chunk_file_name(category_index)
+        path = os.path.join(chunk_dir, name)
+        header = {
+            'format': NORMALIZED_FORMAT,
+            'fields': list(LEXEME_FIELDS),
+            'lexemes': {str(i): lexemes[i] for i in sorted(bases)},
+            'categories': [CATEGORIES[category_index]],
+        }
+        with open(path, 'w', encoding='utf-8') as out:
+            out.write(json.dumps(header, ensure_ascii=False, separators=(',', ':'))[:-1])
+            for column in ('ids', 'lexeme_refs'):
+                out.write(',"%s":[' % column)
+                _copy_fragments(shards, chunk_fragment(category_index, column), out, ',')
+                out.write(']')
+            out.write('}')
+        chunks[CATEGORIES[category_index]] = {
+            'file': name,
+            'count': count,
+            'sha256': _file_sha256(path),
+        }
+
+    # Drop chunks left over from an earlier run with other categories.
+    current = {chunk['file'] for chunk in chunks.values()}
+    for name in os.listdir(chunk_dir):
+        if re.match(r'\d\d-.*\.json$', name) and name not in current:
+            os.remove(os.path.join(chunk_dir, name))
+
+    version = hashlib.sha256(''.join(chunk['sha256'] for chunk in chunks.values()).encode('ascii'))
+    manifest = {
+        'format': 'vocab-chunks-v1',
+        'version': version.hexdigest(),
+        'total': sum(chunk['count'] for chunk in chunks.values()),
+        'categories': chunks,
+    }
+    with open(os.path.join(chunk_dir, 'manifest.json'), 'w', encoding='utf-8') as out:
+        json.dump(manifest, out, ensure_ascii=False, indent=2)
+
+
+def generate_vocab(sqlite_path=None, count=1000, output_dir='.', seed=None,
+                   data_format='json', pretty=True, jobs=1):
+    """
+    Generate a synthetic Japanese vocabulary dataset.  The dataset is built
+    from a set of base entries which each include a Japanese expression, its
+    reading in romaji, an English (or Chinese) translation, part‑of‑speech
+    information, collocations, a sample sentence and a thematic category.
+    Each base entry is duplicated across multiple categories to produce a
+    total of ``count`` (by default 1000) entries.  Duplicate entries are
+    assigned unique identifiers so that they can be referenced individually.
 
     This script is run during development to build the ``vocab.json`` file
     consumed by the Flask application.  While the generated entries are
@@ -19,479 +839,110 @@ def generate_vocab():
     ``vocab.json`` with their own data (for example, a list of genuine
     Japanese expressions and translations) without modifying the application
     code.
+
+    Entries are streamed to every output as they are generated, so memory use
+    does not depend on ``count``.  The data file is written below
+    ``output_dir`` as ``data/vocab.json`` (a JSON array, ``pretty`` or
+    compact) or ``data/vocab.ndjson`` (one entry per line) depending on
+    ``data_format``, next to it the memory-mapped ``data/vocab.bin`` read by
+    ``/api/vocab/<id>`` (see ``vocab_binary.py``), and the static site's deck as ``static/vocab.js`` and
+    as one chunk per category in ``static/vocab/`` with a ``manifest.json``.
+    ``static/vocab.js`` and the other :data:`STATIC_ASSETS` are also copied
+    to content-hashed names listed in ``static/assets.json``.
+    With ``jobs`` greater than one the id range is split into shards that
+    are generated by separate processes and then concatenated.  ``seed``
+    switches from the fixed layout of the bundled dataset to randomly drawn
+    base entries and categories.  If ``sqlite_path`` is given, the entries
+    are also written straight into the ``vocab`` tables of that SQLite
+    database (see ``vocab_db.py``) in a single transaction.
     """
-    # Base vocabulary entries.  Each dictionary defines:
-    #   - word: The Japanese expression in kanji/hiragana/katakana
-    #   - reading: The pronunciation in romaji
-    #   - translation: A short English translation or gloss
-    #   - part: Part of speech (noun, verb, adjective, expression, etc.)
-    #   - collocations: A list of common collocations or compound forms
-    #   - example: A sample sentence using the word
-    #   - category: A default thematic category
-    base_entries = [
-        {
-            "word": "こんにちは",
-            "reading": "konnichiwa",
-            "translation": "Hello",
-            "part": "expression",
-            "collocations": ["こんにちは、元気ですか？", "こんにちはと言う"],
-            "example": "彼は私にこんにちはと言いました。",
-            "category": "Greetings",
-        },
-        {
-            "word": "おはようございます",
-            "reading": "ohayou gozaimasu",
-            "translation": "Good morning",
-            "part": "expression",
-            "collocations": ["おはよう", "おはようございます"],
-            "example": "朝起きて家族におはようございますと言います。",
-            "category": "Greetings",
-        },
-        {
-            "word": "こんばんは",
-            "reading": "konbanwa",
-            "translation": "Good evening",
-            "part": "expression",
-            "collocations": ["こんばんは、と挨拶する"],
-            "example": "夜に友達に会ってこんばんはと言いました。",
-            "category": "Greetings",
-        },
-        {
-            "word": "ありがとう",
-            "reading": "arigatou",
-            "translation": "Thank you",
-            "part": "expression",
-            "collocations": ["ありがとうございます", "本当にありがとう"],
-            "example": "助けてくれてありがとう。",
-            "category": "Social",
-        },
-        {
-            "word": "ごめんなさい",
-            "reading": "gomen nasai",
-            "translation": "Sorry",
-            "part": "expression",
-            "collocations": ["ごめん", "ごめんなさいと言う"],
-            "example": "遅れてごめんなさい。",
-            "category": "Social",
-        },
-        {
-            "word": "すみません",
-            "reading": "sumimasen",
-            "translation": "Excuse me / I'm sorry",
-            "part": "expression",
-            "collocations": ["すみませんが", "すみませんと言う"],
-            "example": "店員さんにすみませんと声をかけました。",
-            "category": "Social",
-        },
-        {
-            "word": "はい",
-            "reading": "hai",
-            "translation": "Yes",
-            "part": "expression",
-            "collocations": ["はい、そうです", "はい、と答える"],
-            "example": "質問に対してはいと答えました。",
-            "category": "Conversation",
-        },
-        {
-            "word": "いいえ",
-            "reading": "iie",
-            "translation": "No",
-            "part": "expression",
-            "collocations": ["いいえ、違います", "いいえ、と答える"],
-            "example": "それは違いますか？いいえ、と言いました。",
-            "category": "Conversation",
-        },
-        {
-            "word": "わかりません",
-            "reading": "wakarimasen",
-            "translation": "I don't understand",
-            "part": "expression",
-            "collocations": ["わかりません、と答える"],
-            "example": "この漢字の意味がわかりません。",
-            "category": "Conversation",
-        },
-        {
-            "word": "助けてください",
-            "reading": "tasukete kudasai",
-            "translation": "Please help me",
-            "part": "expression",
-            "collocations": ["助けて", "助けてくださいと叫ぶ"],
-            "example": "危険な状況で助けてくださいと言いました。",
-            "category": "Emergencies",
-        },
-        {
-            "word": "名前",
-            "reading": "namae",
-            "translation": "Name",
-            "part": "noun",
-            "collocations": ["名前を書く", "名前を聞く"],
-            "example": "初対面のときに相手の名前を聞きます。",
-            "category": "Personal",
-        },
-        {
-            "word": "学校",
-            "reading": "gakkou",
-            "translation": "School",
-            "part": "noun",
-            "collocations": ["学校へ行く", "学校の先生"],
-            "example": "明日学校に行きます。",
-            "category": "Education",
-        },
-        {
-            "word": "学生",
-            "reading": "gakusei",
-            "translation": "Student",
-            "part": "noun",
-            "collocations": ["大学生", "学生生活"],
-            "example": "私は大学の学生です。",
-            "category": "Education",
-        },
-        {
-            "word": "先生",
-            "reading": "sensei",
-            "translation": "Teacher",
-            "part": "noun",
-            "collocations": ["英語の先生", "先生に質問する"],
-            "example": "先生に宿題を見てもらいました。",
-            "category": "Education",
-        },
-        {
-            "word": "愛",
-            "reading": "ai",
-            "translation": "Love",
-            "part": "noun",
-            "collocations": ["愛する", "愛を感じる"],
-            "example": "家族への愛は深い。",
-            "category": "Emotions",
-        },
-        {
-            "word": "猫",
-            "reading": "neko",
-            "translation": "Cat",
-            "part": "noun",
-            "collocations": ["黒い猫", "猫が鳴く"],
-            "example": "猫が庭で遊んでいる。",
-            "category": "Animals",
-        },
-        {
-            "word": "犬",
-            "reading": "inu",
-            "translation": "Dog",
-            "part": "noun",
-            "collocations": ["犬を散歩させる", "大型犬"],
-            "example": "毎朝犬と散歩します。",
-            "category": "Animals",
-        },
-        {
-            "word": "食べる",
-            "reading": "taberu",
-            "translation": "to eat",
-            "part": "verb",
-            "collocations": ["ご飯を食べる", "昼食を食べる"],
-            "example": "昼ご飯に何を食べますか？",
-            "category": "Food & Drink",
-        },
-        {
-            "word": "飲む",
-            "reading": "nomu",
-            "translation": "to drink",
-            "part": "verb",
-            "collocations": ["水を飲む", "お茶を飲む"],
-            "example": "運動した後に水を飲みます。",
-            "category": "Food & Drink",
-        },
-        {
-            "word": "行く",
-            "reading": "iku",
-            "translation": "to go",
-            "part": "verb",
-            "collocations": ["学校へ行く", "旅行に行く"],
-            "example": "週末に友達と映画館へ行きます。",
-            "category": "Travel & Transportation",
-        },
-        {
-            "word": "見る",
-            "reading": "miru",
-            "translation": "to see / to watch",
-            "part": "verb",
-            "collocations": ["映画を見る", "景色を見る"],
-            "example": "夜空の星を見るのが好きです。",
-            "category": "Leisure",
-        },
-        {
-            "word": "話す",
-            "reading": "hanasu",
-            "translation": "to speak",
-            "part": "verb",
-            "collocations": ["日本語で話す", "友達と話す"],
-            "example": "友達と電話で話す。",
-            "category": "Conversation",
-        },
-        {
-            "word": "聞く",
-            "reading": "kiku",
-            "translation": "to listen / to ask",
-            "part": "verb",
-            "collocations": ["音楽を聞く", "質問を聞く"],
-            "example": "授業で先生の話を聞く。",
-            "category": "Conversation",
-        },
-        {
-            "word": "来る",
-            "reading": "kuru",
-            "translation": "to come",
-            "part": "verb",
-            "collocations": ["家に来る", "友達が来る"],
-            "example": "今夜、友達が家に来ます。",
-            "category": "Travel & Transportation",
-        },
-        {
-            "word": "する",
-            "reading": "suru",
-            "translation": "to do",
-            "part": "verb",
-            "collocations": ["勉強する", "運動する"],
-            "example": "週末に掃除をする。",
-            "category": "Daily Life",
-        },
-        {
-            "word": "作る",
-            "reading": "tsukuru",
-            "translation": "to make / to create",
-            "part": "verb",
-            "collocations": ["料理を作る", "作品を作る"],
-            "example": "母は毎日おいしい料理を作ります。",
-            "category": "Daily Life",
-        },
-        {
-            "word": "読む",
-            "reading": "yomu",
-            "translation": "to read",
-            "part": "verb",
-            "collocations": ["本を読む", "新聞を読む"],
-            "example": "寝る前に本を読むのが習慣です。",
-            "category": "Education",
-        },
-        {
-            "word": "書く",
-            "reading": "kaku",
-            "translation": "to write",
-            "part": "verb",
-            "collocations": ["手紙を書く", "日記を書く"],
-            "example": "毎日日記を書くようにしています。",
-            "category": "Education",
-        },
-        {
-            "word": "買う",
-            "reading": "kau",
-            "translation": "to buy",
-            "part": "verb",
-            "collocations": ["買い物をする", "本を買う"],
-            "example": "明日新しい靴を買います。",
-            "category": "Shopping",
-        },
-        {
-            "word": "売る",
-            "reading": "uru",
-            "translation": "to sell",
-            "part": "verb",
-            "collocations": ["商品を売る", "高く売る"],
-            "example": "古い自転車を売りました。",
-            "category": "Shopping",
-        },
-        {
-            "word": "好き",
-            "reading": "suki",
-            "translation": "like / fond of",
-            "part": "adjective",
-            "collocations": ["好きな食べ物", "好きになる"],
-            "example": "私は寿司が好きです。",
-            "category": "Emotions",
-        },
-        {
-            "word": "嫌い",
-            "reading": "kirai",
-            "translation": "dislike / hate",
-            "part": "adjective",
-            "collocations": ["嫌いな食べ物", "嫌いになる"],
-            "example": "私は運動が嫌いではありません。",
-            "category": "Emotions",
-        },
-        {
-            "word": "美しい",
-            "reading": "utsukushii",
-            "translation": "beautiful",
-            "part": "adjective",
-            "collocations": ["美しい景色", "美しい花"],
-            "example": "春には桜がとても美しい。",
-            "category": "Nature",
-        },
-        {
-            "word": "大きい",
-            "reading": "ookii",
-            "translation": "big / large",
-            "part": "adjective",
-            "collocations": ["大きい家", "大きいサイズ"],
-            "example": "その犬はとても大きい。",
-            "category": "Description",
-        },
-        {
-            "word": "小さい",
-            "reading": "chiisai",
-            "translation": "small",
-            "part": "adjective",
-            "collocations": ["小さい村", "小さい子ども"],
-            "example": "彼の手は小さい。",
-            "category": "Description",
-        },
-        {
-            "word": "高い",
-            "reading": "takai",
-            "translation": "high / tall / expensive",
-            "part": "adjective",
-            "collocations": ["高い山", "値段が高い"],
-            "example": "この時計はとても高いです。",
-            "category": "Description",
-        },
-        {
-            "word": "安い",
-            "reading": "yasui",
-            "translation": "cheap / inexpensive",
-            "part": "adjective",
-            "collocations": ["安い商品", "値段が安い"],
-            "example": "この店は安い服が多い。",
-            "category": "Shopping",
-        },
-        {
-            "word": "新しい",
-            "reading": "atarashii",
-            "translation": "new",
-            "part": "adjective",
-            "collocations": ["新しい車", "新しいアイデア"],
-            "example": "昨日新しい本を買いました。",
-            "category": "Description",
-        },
-        {
-            "word": "古い",
-            "reading": "furui",
-            "translation": "old",
-            "part": "adjective",
-            "collocations": ["古い建物", "古い友人"],
-            "example": "これは古い写真です。",
-            "category": "Description",
-        },
-        {
-            "word": "早い",
-            "reading": "hayai",
-            "translation": "fast / early",
-            "part": "adjective",
-            "collocations": ["早い電車", "時間が早い"],
-            "example": "彼は早い時間に起きます。",
-            "category": "Description",
-        },
-        {
-            "word": "遅い",
-            "reading": "osoi",
-            "translation": "late / slow",
-            "part": "adjective",
-            "collocations": ["遅い時間", "動きが遅い"],
-            "example": "今日は遅い電車に乗りました。",
-            "category": "Description",
-        },
-        {
-            "word": "便利",
-            "reading": "benri",
-            "translation": "convenient",
-            "part": "adjective",
-            "collocations": ["便利な道具", "便利な場所"],
-            "example": "このアプリはとても便利です。",
-            "category": "Description",
-        },
-        {
-            "word": "大丈夫",
-            "reading": "daijoubu",
-            "translation": "it's okay / I'm fine",
-            "part": "expression",
-            "collocations": ["大丈夫ですか", "大丈夫と言う"],
-            "example": "怪我はありませんか？大丈夫です。",
-            "category": "Conversation",
-        },
-        {
-            "word": "お願いします",
-            "reading": "onegaishimasu",
-            "translation": "please",
-            "part": "expression",
-            "collocations": ["よろしくお願いします", "お願いしますと頼む"],
-            "example": "注文をお願いします。",
-            "category": "Conversation",
-        },
-        {
-            "word": "どこ",
-            "reading": "doko",
-            "translation": "where",
-            "part": "pronoun",
-            "collocations": ["どこですか？", "どこにありますか？"],
-            "example": "駅はどこですか？",
-            "category": "Directions",
-        },
-        {
-            "word": "いくら",
-            "reading": "ikura",
-            "translation": "how much",
-            "part": "interrogative",
-            "collocations": ["いくらですか", "値段はいくら"],
-            "example": "このリンゴはいくらですか？",
-            "category": "Shopping",
-        },
-    ]
-
-    # Define a list of categories to cycle through when generating duplicates.
-    categories = [
-        "Greetings", "Daily Life", "Food & Drink", "Travel", "Shopping",
-        "Office", "Health", "Family", "Emotions", "Fitness", "Leisure",
-        "Technology", "Education", "Weather", "Hobbies", "Home", "Directions",
-        "Numbers", "Nature", "Animals", "Time", "Finance", "Grocery", "Tourism",
-        "Medical", "Social", "Business", "Media", "Hotel", "Misc"
-    ]
-
-    entries = []
-    entry_id = 1
-    # Determine how many times to duplicate each base entry to reach at least 1000
-    duplicate_factor = (1000 + len(base_entries) - 1) // len(base_entries)
-    for i, base in enumerate(base_entries):
-        for j in range(duplicate_factor):
-            # Copy base entry and assign unique ID and possibly adjust the
-            # category.  Use modulo to pick a category from the predefined
-            # categories so that duplicates get distributed across topics.
-            new_entry = base.copy()
-            new_entry["id"] = entry_id
-            new_entry["category"] = categories[(i * duplicate_factor + j) % len(categories)]
-            entries.append(new_entry)
-            entry_id += 1
-            if entry_id > 1000:
-                break
-        if entry_id > 1000:
-            break
-
-    # Ensure output directories exist
-    os.makedirs('data', exist_ok=True)
-    os.makedirs('static', exist_ok=True)
-
-    # Write to vocab.json
-    with open('data/vocab.json', 'w', encoding='utf-8') as f_json:
-        json.dump(entries, f_json, ensure_ascii=False, indent=2)
-
-    # Also generate a JavaScript file that defines a constant containing
-    # the vocabulary array.  This allows the static site to load the
-    # vocabulary without requiring a web server or cross‑origin requests.
-    vocab_js_path = os.path.join('static', 'vocab.js')
-    with open(vocab_js_path, 'w', encoding='utf-8') as f_js:
-        f_js.write('const vocab = ')
-        json.dump(entries, f_js, ensure_ascii=False, indent=2)
-        f_js.write(';\n')
-
-    print(f"Generated {len(entries)} vocabulary entries and wrote data/vocab.json and static/vocab.js.")
+    if data_format not in DATA_FORMATS:
+        raise ValueError('unknown data format: %r' % data_format)
+    data_dir = os.path.join(output_dir, 'data')
+    static_dir = os.path.join(output_dir, 'static')
+    os.makedirs(data_dir, exist_ok=True)
+    os.makedirs(static_dir, exist_ok=True)
+    data_path = os.path.join(data_dir, 'vocab.' + data_format)
+    binary_path = os.path.join(data_dir, 'vocab.bin')
+    vocab_js_path = os.path.join(static_dir, 'vocab.js')
+    chunk_dir = os.path.join(static_dir, 'vocab')
+
+    jobs = max(1, min(jobs, (count + CHUNK_SIZE - 1) // CHUNK_SIZE or 1))
+    # Shard boundaries are multiples of CHUNK_SIZE so that seeded output is
+    # identical whatever the number of jobs.
+    chunks = (count + CHUNK_SIZE - 1) // CHUNK_SIZE
+    per_shard = max(1, (chunks + jobs - 1) // jobs) * CHUNK_SIZE
+    with tempfile.TemporaryDirectory(dir=output_dir, prefix='.vocab-') as tmp:
+        shards = [
+            (os.path.join(tmp, '%05d' % i), start, min(start + per_shard, count), count, seed, data_format, pretty)
+            for i, start in enumerate(range(0, count, per_shard))
+        ] or [(os.path.join(tmp, '00000'), 0, 0, count, seed, data_format, pretty)]
+        sqlite_writer = SqliteWriter(sqlite_path) if sqlite_path else None
+        if jobs == 1:
+            # Single pass: one loop feeds the files and the database.
+            os.makedirs(shards[0][0])
+            writers = [FragmentWriter(shards[0][0], data_format, pretty)]
+            if sqlite_writer:
+                writers.append(sqlite_writer)
+            generate_range(0, count, count, seed, writers)
+        else:
+            with multiprocessing.Pool(jobs) as pool:
+                pending = pool.map_async(_generate_shard, shards)
+                # SQLite takes one writer at a time, so the database is fed
+                # from this process while the workers produce the files.
+                if sqlite_writer:
+                    generate_range(0, count, count, seed, [sqlite_writer])
+                pending.get()
+        shard_dirs = [shard[0] for shard in shards]
+        assemble(shard_dirs, data_path, vocab_js_path, chunk_dir, data_format, pretty)
+        assemble_binary(shard_dirs, binary_path, count, data_path)
+    assets = fingerprint_assets(static_dir, STATIC_ASSETS)
+
+    print(f"Generated {count} vocabulary entries and wrote {data_path}, {binary_path}, "
+          f"{vocab_js_path} (as {assets['vocab.js']}) and {chunk_dir}/.")
+    if sqlite_writer:
+        print(f"Imported {sqlite_writer.count} vocabulary entries into {sqlite_path}.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the synthetic vocabulary dataset.")
+    parser.add_argument("--count", type=int, default=1000, help="number of entries to generate")
+    parser.add_argument(
+        "--seed",
+        help="draw base entries and categories at random from this seed instead of the fixed layout",
+    )
+    parser.add_argument(
+        "--format", dest="data_format", choices=DATA_FORMATS, default="json",
+        help="data file format: a JSON array (data/vocab.json) or NDJSON (data/vocab.ndjson)",
+    )
+    style = parser.add_mutually_exclusive_group()
+    style.add_argument("--pretty", dest="pretty", action="store_true", default=True,
+                       help="indent the JSON data file (default)")
+    style.add_argument("--compact", dest="pretty", action="store_false",
+                       help="write the JSON data file without whitespace")
+    parser.add_argument(
+        "--jobs", type=int, default=1,
+        help="number of processes to generate with (0 for one per CPU)",
+    )
+    parser.add_argument(
+        "--output-dir", default=".",
+        help="directory below which data/ and static/ are written",
+    )
+    parser.add_argument(
+        "--sqlite", metavar="DATABASE",
+        help="also write the entries into the vocab tables of this SQLite database",
+    )
+    args = parser.parse_args(argv)
+    generate_vocab(
+        sqlite_path=args.sqlite,
+        count=args.count,
+        output_dir=args.output_dir,
+        seed=args.seed,
+        data_format=args.data_format,
+        pretty=args.pretty,
+        jobs=args.jobs or os.cpu_count() or 1,
+    )
 
 
 if __name__ == '__main__':
-    generate_vocab()
\ No newline at end of file
+    main()
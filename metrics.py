@@ -0,0 +1,309 @@
+"""
+Request, template, vocabulary and database instrumentation.
+
+:func:`init_metrics` installs hooks on a Flask application that record
+
+* the latency of every request, labelled by endpoint, method and status,
+* the time spent rendering each template,
+* the time taken to load and index the vocabulary file,
+* the latency of every SQLite statement and the number of statements run
+  per request,
+
+as Prometheus histograms and counters, and serves them in the Prometheus
+text exposition format at ``/metrics``.  Metrics are kept per process.
+
+Slow requests can optionally be profiled: with ``PROFILE_SAMPLE_RATE`` set
+above zero, that fraction of requests runs under :mod:`cProfile`, and the
+profile of any sampled request slower than ``PROFILE_SLOW_SECONDS`` is
+written to ``PROFILE_DIR`` for inspection with :mod:`pstats` or snakeviz.
+"""
+
+import os
+import random
+import sqlite3
+import threading
+import time
+
+from flask import Response, before_render_template, g, has_app_context, request, template_rendered
+
+
+REQUEST_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names, values, extra=None):
+    pairs = ['%s="%s"' % (name, _escape(value)) for name, value in zip(names, values)]
+    if extra:
+        pairs.append('%s="%s"' % extra)
+    return '{%s}' % ','.join(pairs) if pairs else ''
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """A monotonically increasing counter with optional labels."""
+
+    type = 'counter'
+
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount=1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        for label_values, value in items:
+            yield self.name + _format_labels(self.labels, label_values), value
+
+
+class Histogram:
+    """A cumulative histogram with fixed buckets and optional labels."""
+
+    type = 'histogram'
+
+    def __init__(self, name, help, labels=(), buckets=REQUEST_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets) + (float('inf'),)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *label_values):
+        with self._lock:
+            state = self._values.get(label_values)
+            if state is None:
+                state = self._values[label_values] = [[0] * len(self.buckets), 0.0, 0]
+            counts = state[0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            state[1] += value
+            state[2] += 1
+
+    def samples(self):
+        with self._lock:
+            items = sorted((k, (list(v[0]), v[1], v[2])) for k, v in self._values.items())
+        for label_values, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                yield (
+                    self.name + '_bucket'
+                    + _format_labels(self.labels, label_values, ('le', _format_value(bound))),
+                    cumulative,
+                )
+            yield self.name + '_sum' + _format_labels(self.labels, label_values), total
+            yield self.name + '_count' + _format_labels(self.labels, label_values), count
+
+
+class Gauge:
+    """A value read from a callback at scrape time."""
+
+    type = 'gauge'
+
+    def __init__(self, name, help, callback):
+        self.name = name
+        self.help = help
+        self.callback = callback
+
+    def samples(self):
+        yield self.name, self.callback()
+
+
+class CallbackCounter(Gauge):
+    """A counter whose total is read from a callback at scrape time, for
+    counts kept by another object.  ``name`` should end in ``_total``.
+    """
+
+    type = 'counter'
+
+
+class Registry:
+    """The set of metrics exported by one process."""
+
+    def __init__(self):
+        self.metrics = []
+
+    def add(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def render(self):
+        """Return all metrics in the Prometheus text exposition format."""
+        lines = []
+        for metric in self.metrics:
+            lines.append('# HELP %s %s' % (metric.name, metric.help))
+            lines.append('# TYPE %s %s' % (metric.name, metric.type))
+            for name, value in metric.samples():
+                lines.append('%s %s' % (name, _format_value(value)))
+        return '\n'.join(lines) + '\n'
+
+
+class AppMetrics:
+    """The metrics recorded for one application.
+
+    ``connection_class`` is the :class:`sqlite3.Connection` subclass to
+    open database connections with so that their statements are timed.
+    """
+
+    def __init__(self):
+        self.registry = Registry()
+        add = self.registry.add
+        self.request_seconds = add(Histogram(
+            'http_request_duration_seconds', 'Time spent handling requests.',
+            ('endpoint', 'method', 'status'),
+        ))
+        self.template_seconds = add(Histogram(
+            'template_render_duration_seconds', 'Time spent rendering templates.', ('template',),
+        ))
+        self.vocab_load_seconds = add(Histogram(
+            'vocab_load_duration_seconds', 'Time spent parsing and indexing the vocabulary file.',
+            buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0),
+        ))
+        self.db_seconds = add(Histogram(
+            'db_statement_duration_seconds', 'Time spent executing SQLite statements.',
+            ('statement',), buckets=DB_BUCKETS,
+        ))
+        self.db_statements = add(Histogram(
+            'db_statements_per_request', 'Number of SQLite statements executed per request.',
+            buckets=COUNT_BUCKETS,
+        ))
+        self.db_errors = add(Counter(
+            'db_statement_errors_total', 'SQLite statements that raised an error.', ('statement',),
+        ))
+        self.profiles = add(Counter(
+            'slow_request_profiles_total', 'Profiles written for slow sampled requests.', ('endpoint',),
+        ))
+
+    def observe_statement(self, sql, seconds, failed=False):
+        kind = sql.lstrip().split(None, 1)[0].upper() if sql.strip() else 'EMPTY'
+        self.db_seconds.observe(seconds, kind)
+        if failed:
+            self.db_errors.inc(kind)
+        if has_app_context():
+            g._db_statements = getattr(g, '_db_statements', 0) + 1
+
+
+def connection_factory(metrics):
+    """Return a :class:`sqlite3.Connection` subclass that times every
+    statement executed through it (directly or through its cursors).
+    """
+
+    def timed(method):
+        def run(self, *args, **kwargs):
+            started = time.perf_counter()
+            try:
+                result = method(self, *args, **kwargs)
+            except Exception:
+                metrics.observe_statement(args[0] if args else '', time.perf_counter() - started, failed=True)
+                raise
+            metrics.observe_statement(args[0] if args else '', time.perf_counter() - started)
+            return result
+        return run
+
+    class InstrumentedCursor(sqlite3.Cursor):
+        execute = timed(sqlite3.Cursor.execute)
+        executemany = timed(sqlite3.Cursor.executemany)
+
+    class InstrumentedConnection(sqlite3.Connection):
+        execute = timed(sqlite3.Connection.execute)
+        executemany = timed(sqlite3.Connection.executemany)
+
+        def cursor(self, factory=InstrumentedCursor):
+            return super().cursor(factory)
+
+    return InstrumentedConnection
+
+
+def init_metrics(app, vocab_store=None):
+    """Install the instrumentation hooks and the ``/metrics`` route on
+    ``app`` and return its :class:`AppMetrics`.
+    """
+    app.config.setdefault('PROFILE_SAMPLE_RATE', 0.0)
+    app.config.setdefault('PROFILE_SLOW_SECONDS', 0.5)
+    app.config.setdefault('PROFILE_DIR', os.path.join(app.instance_path, 'profiles'))
+    metrics = AppMetrics()
+    metrics.connection_class = connection_factory(metrics)
+    app.extensions['metrics'] = metrics
+
+    if vocab_store is not None:
+        vocab_store.on_load = lambda seconds: metrics.vocab_load_seconds.observe(seconds)
+        add = metrics.registry.add
+        add(Gauge('vocab_entries', 'Entries in the current vocabulary snapshot.',
+                  lambda: vocab_store.stats()['entries']))
+        add(CallbackCounter('vocab_reloads_total', 'Times the vocabulary file has been loaded.',
+                            lambda: vocab_store.reloads))
+        add(CallbackCounter('vocab_reload_errors_total', 'Failed attempts to reload the vocabulary file.',
+                            lambda: vocab_store.reload_errors))
+
+    @app.before_request
+    def start_timer():
+        g._request_started = time.perf_counter()
+        rate = app.config['PROFILE_SAMPLE_RATE']
+        if rate and random.random() < rate:
+            # Imported here so that processes that never profile skip it.
+            import cProfile
+            g._profiler = cProfile.Profile()
+            g._profiler.enable()
+
+    @app.after_request
+    def record_request(response):
+        started = getattr(g, '_request_started', None)
+        if started is None:
+            return response
+        elapsed = time.perf_counter() - started
+        endpoint = request.endpoint or 'unmatched'
+        metrics.request_seconds.observe(elapsed, endpoint, request.method, response.status_code)
+        metrics.db_statements.observe(getattr(g, '_db_statements', 0))
+        profiler = g.pop('_profiler', None)
+        if profiler is not None:
+            profiler.disable()
+            if elapsed >= app.config['PROFILE_SLOW_SECONDS']:
+                directory = app.config['PROFILE_DIR']
+                os.makedirs(directory, exist_ok=True)
+                name = '%s-%d-%s.prof' % (time.strftime('%Y%m%d-%H%M%S'), os.getpid(), endpoint)
+                profiler.dump_stats(os.path.join(directory, name))
+                metrics.profiles.inc(endpoint)
+        return response
+
+    @app.teardown_request
+    def stop_profiler(exception):
+        # Requests that raised never reach after_request.
+        profiler = g.pop('_profiler', None)
+        if profiler is not None:
+            profiler.disable()
+
+    def template_started(sender, template, context, **extra):
+        g.setdefault('_template_started', []).append(time.perf_counter())
+
+    def template_finished(sender, template, context, **extra):
+        stack = g.get('_template_started')
+        if stack:
+            metrics.template_seconds.observe(time.perf_counter() - stack.pop(), template.name)
+
+    before_render_template.connect(template_started, app, weak=False)
+    template_rendered.connect(template_finished, app, weak=False)
+
+    @app.route('/metrics')
+    def metrics_endpoint():
+        return Response(metrics.registry.render(), mimetype='text/plain; version=0.0.4')
+
+    return metrics
@@ -0,0 +1,139 @@
+"""
+Password hashing off the request thread.
+
+Hashing a password is deliberately expensive.  Done inline, a burst of logins
+occupies every worker thread and the vocabulary routes queue up behind it.
+:class:`PasswordHasher` runs the hashing in a small thread pool (the
+``hashlib`` key derivation functions release the GIL while they work) and
+bounds the number of hashes in flight or waiting.  When the bound is reached
+it raises :class:`HasherBusy` immediately instead of queueing, and the views
+turn that into a fast ``503 Service Unavailable``.
+
+The hash method and cost are configurable.  Stored hashes created with a
+different method are upgraded on the next successful login, see
+:meth:`PasswordHasher.needs_rehash`.
+
+Run this module directly to measure how many logins per second one core can
+verify at each cost setting::
+
+    python passwords.py
+    python passwords.py pbkdf2:sha256:600000 scrypt:32768:8:1
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+
+DEFAULT_METHOD = 'scrypt:32768:8:1'
+
+# Cost settings compared by the microbenchmark when none are given.
+BENCHMARK_METHODS = (
+    'pbkdf2:sha256:100000',
+    'pbkdf2:sha256:300000',
+    'pbkdf2:sha256:600000',
+    'scrypt:16384:8:1',
+    'scrypt:32768:8:1',
+    'scrypt:65536:8:1',
+)
+
+
+class HasherBusy(Exception):
+    """Raised when too many password hashes are already in flight, or when
+    a hash did not finish within the hasher's timeout.
+    """
+
+
+class PasswordHasher:
+    """Bounded executor for password hashing and verification.
+
+    ``method`` is a Werkzeug hash method string such as
+    ``'scrypt:32768:8:1'`` or ``'pbkdf2:sha256:600000'``.  At most
+    ``workers`` hashes run at once and at most ``max_pending`` are accepted
+    in total (running plus queued); beyond that :class:`HasherBusy` is raised.
+    """
+
+    def __init__(self, method=DEFAULT_METHOD, workers=None, max_pending=None, timeout=30.0):
+        self.method = method
+        # Werkzeug expands short method names ('scrypt', 'pbkdf2:sha256')
+        # with its default cost parameters, and stores the expanded form in
+        # the hash.  Take the stored form from one hash so that
+        # needs_rehash() compares like with like.  This also rejects an
+        # invalid method at startup.
+        self.stored_method = generate_password_hash('', method).split('$', 1)[0]
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 4 * self.workers
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._executor = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self.rejected = 0
+
+    def _get_executor(self):
+        # Threads do not survive fork(), so a worker process that inherited
+        # an executor from its parent starts a fresh one.
+        pid = os.getpid()
+        if self._executor is None or self._pid != pid:
+            with self._lock:
+                if self._executor is None or self._pid != pid:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers, thread_name_prefix='password-hash'
+                    )
+                    self._slots = threading.BoundedSemaphore(self.max_pending)
+                    self._pid = pid
+        return self._executor
+
+    def _run(self, func, *args):
+        executor = self._get_executor()
+        slots = self._slots
+        if not slots.acquire(blocking=False):
+            self.rejected += 1
+            raise HasherBusy()
+        try:
+            future = executor.submit(func, *args)
+        except BaseException:
+            slots.release()
+            raise
+        future.add_done_callback(lambda f: slots.release())
+        try:
+            return future.result(self.timeout)
+        except TimeoutError:
+            # The hash keeps its slot until it finishes; the caller gets the
+            # same fast failure as when the queue is full.
+            self.rejected += 1
+            raise HasherBusy() from None
+
+    def hash(self, password):
+        """Return a new hash of ``password`` using the configured method."""
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, pwhash, password):
+        """Return whether ``password`` matches the stored ``pwhash``."""
+        return self._run(check_password_hash, pwhash, password)
+
+    def needs_rehash(self, pwhash):
+        """Return whether ``pwhash`` was created with a different method."""
+        return pwhash.split('$', 1)[0] != self.stored_method
+
+
+def benchmark(methods=BENCHMARK_METHODS, seconds=1.0):
+    """Print the single-core login verification rate for each method."""
+    for method in methods:
+        pwhash = generate_password_hash('correct horse battery staple', method)
+        count = 0
+        started = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < seconds:
+            check_password_hash(pwhash, 'correct horse battery staple')
+            count += 1
+            elapsed = time.perf_counter() - started
+        print(f"{method:<24} {count / elapsed:8.1f} logins/s per core  ({elapsed / count * 1000:.1f} ms each)")
+
+
+if __name__ == '__main__':
+    benchmark(sys.argv[1:] or BENCHMARK_METHODS)
@@ -0,0 +1,294 @@
+"""
+Per-user study progress.
+
+Every (user, vocabulary entry) pair that has been reviewed has a row in the
+``progress`` table with its SM-2 scheduling state: the ease factor, the
+current interval, when the card is next due and how often it was reviewed
+and forgotten.  The ``progress_due`` index on ``(user_id, due)`` lets
+:func:`due_cards` return a user's next cards by reading just those index
+entries, without scanning the user's history.
+
+Review events are not written one by one.  :class:`ProgressBuffer` collects
+them in memory and a background thread applies them in batches, with one
+``executemany`` call in a single transaction per flush.  The new schedule is
+computed by the upsert itself (see :data:`REVIEW_UPSERT`), so a flush never
+has to read the rows it updates.  Events still in the buffer are lost if the
+process is killed; a clean shutdown flushes them.
+"""
+
+import atexit
+import os
+import sqlite3
+import threading
+import time
+
+from vocab_db import MAX_INTEGER, MIN_INTEGER
+
+
+SCHEMA = (
+    '''CREATE TABLE IF NOT EXISTS progress (
+        user_id INTEGER NOT NULL,
+        vocab_id INTEGER NOT NULL,
+        ease REAL NOT NULL DEFAULT 2.5,
+        interval_days REAL NOT NULL DEFAULT 0,
+        due INTEGER NOT NULL,
+        reviews INTEGER NOT NULL DEFAULT 0,
+        lapses INTEGER NOT NULL DEFAULT 0,
+        last_review INTEGER NOT NULL,
+        PRIMARY KEY (user_id, vocab_id)
+    ) WITHOUT ROWID''',
+    'CREATE INDEX IF NOT EXISTS progress_due ON progress (user_id, due)',
+)
+
+# Grades follow SM-2: 0-2 means the card was forgotten, 3-5 that it was
+# recalled with decreasing effort.
+MIN_GRADE = 0
+MAX_GRADE = 5
+PASSING_GRADE = 3
+MIN_EASE = 1.3
+DAY = 86400
+
+# Applies one review event, given as a row from review_rows().  Events that
+# are not newer than the card's last review are ignored, so that a replayed
+# event (a client retrying a request) is not counted twice.  A first review
+# schedules the card one day ahead; after that a forgotten card starts over
+# at one day and a recalled card's interval grows to six days and then by
+# its ease factor.
+REVIEW_UPSERT = '''
+    INSERT INTO progress (user_id, vocab_id, ease, interval_days, due, reviews, lapses, last_review)
+    VALUES (:user_id, :vocab_id,
+            max(%(min_ease)s, 2.5 + 0.1 - (5 - :grade) * (0.08 + (5 - :grade) * 0.02)),
+            1, :reviewed_at + %(day)d, 1, :grade < %(passing)d, :reviewed_at)
+    ON CONFLICT (user_id, vocab_id) DO UPDATE SET
+        interval_days = CASE
+            WHEN :grade < %(passing)d THEN 1
+            WHEN progress.interval_days < 6 THEN 6
+            ELSE progress.interval_days * progress.ease
+        END,
+        due = :reviewed_at + %(day)d * CASE
+            WHEN :grade < %(passing)d THEN 1
+            WHEN progress.interval_days < 6 THEN 6
+            ELSE progress.interval_days * progress.ease
+        END,
+        ease = max(%(min_ease)s, progress.ease + 0.1 - (5 - :grade) * (0.08 + (5 - :grade) * 0.02)),
+        reviews = progress.reviews + 1,
+        lapses = progress.lapses + (:grade < %(passing)d),
+        last_review = :reviewed_at
+    WHERE :reviewed_at > progress.last_review
+''' % {'min_ease': MIN_EASE, 'day': DAY, 'passing': PASSING_GRADE}
+
+DUE_COLUMNS = ('vocab_id', 'ease', 'interval_days', 'due', 'reviews', 'lapses', 'last_review')
+
+
+def review_rows(user_id, events, now=None):
+    """Validate review ``events`` and return them as parameter dictionaries
+    for :data:`REVIEW_UPSERT`.
+
+    Each event is a mapping with the vocabulary ``id``, a ``grade`` from 0
+    to 5 and optionally ``reviewed_at`` (seconds since the epoch, defaulting
+    to ``now``).  Raises :class:`ValueError` for a malformed event, including
+    ids and times SQLite cannot store.
+    """
+    now = int(now if now is not None else time.time())
+    rows = []
+    for event in events:
+        if not isinstance(event, dict):
+            raise ValueError('each review must be an object')
+        try:
+            vocab_id = int(event['id'])
+            grade = int(event['grade'])
+            reviewed_at = int(event.get('reviewed_at') or now)
+        except (KeyError, TypeError, ValueError):
+            raise ValueError('each review needs an integer id and grade') from None
+        if not MIN_INTEGER <= vocab_id <= MAX_INTEGER:
+            raise ValueError('no such entry: %d' % vocab_id)
+        if not MIN_GRADE <= grade <= MAX_GRADE:
+            raise ValueError('grade must be between %d and %d' % (MIN_GRADE, MAX_GRADE))
+        # Clients may replay old events, but not schedule from the future.
+        rows.append({
+            'user_id': user_id,
+            'vocab_id': vocab_id,
+            'grade': grade,
+            'reviewed_at': max(0, min(reviewed_at, now)),
+        })
+    return rows
+
+
+def apply_reviews(db, rows):
+    """Apply review rows to ``db`` in one transaction."""
+    with db:
+        db.executemany(REVIEW_UPSERT, rows)
+
+
+def due_cards(db, user_id, now=None, limit=20):
+    """Return up to ``limit`` of the user's cards due at ``now``, the most
+    overdue first, as dictionaries of :data:`DUE_COLUMNS`.
+    """
+    now = int(now if now is not None else time.time())
+    rows = db.execute(
+        'SELECT %s FROM progress WHERE user_id = ? AND due <= ? ORDER BY due LIMIT ?'
+        % ', '.join(DUE_COLUMNS),
+        (user_id, now, limit),
+    )
+    return [dict(zip(DUE_COLUMNS, row)) for row in rows]
+
+
+class ProgressBuffer:
+    """Write-behind buffer for review events.
+
+    :meth:`add` only appends to an in-memory list.  A background thread
+    flushes the list every ``flush_interval`` seconds, or as soon as
+    ``batch_size`` events are waiting.  If more than ``max_pending`` events
+    pile up (the database is locked or slow), :meth:`add` flushes in the
+    calling thread first, which slows the writers down rather than letting
+    the buffer grow without bound.  A failed flush keeps its events for the
+    next one; only when the buffer is full and cannot be flushed does
+    :meth:`add` refuse new events.  ``connect`` is called to open a
+    connection in each thread that flushes.
+    """
+
+    def __init__(self, connect, flush_interval=1.0, batch_size=500, max_pending=10000):
+        self.connect = connect
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self._rows = []
+        self._users = set()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._local = threading.local()
+        self._thread = None
+        self._pid = None
+        self._closed = False
+        self.flushes = 0
+        self.flushed = 0
+        self.errors = 0
+        self.rejected = 0
+        self.dropped = 0
+        atexit.register(self.close)
+
+    def _ensure_thread(self):
+        # Like PasswordHasher: threads do not survive fork(), so a worker
+        # that inherited the buffer starts its own flusher.
+        pid = os.getpid()
+        if self._pid != pid:
+            with self._lock:
+                if self._pid != pid:
+                    if self._pid is not None:
+                        self._rows = []
+                        self._users = set()
+                        self._local = threading.local()
+                    self._thread = threading.Thread(
+                        target=self._run, name='progress-flush', daemon=True
+                    )
+                    self._pid = pid
+                    self._thread.start()
+
+    def add(self, rows):
+        """Queue review rows (see :func:`review_rows`).
+
+        Raises :class:`sqlite3.Error` without queuing ``rows`` if the buffer
+        is full and flushing it failed.
+        """
+        self._ensure_thread()
+        if len(self._rows) + len(rows) > self.max_pending:
+            try:
+                self.flush()
+            except sqlite3.Error:
+                self.rejected += len(rows)
+                raise
+        with self._lock:
+            self._rows.extend(rows)
+            self._users.update(row['user_id'] for row in rows)
+            pending = len(self._rows)
+        if pending >= self.batch_size:
+            self._wakeup.set()
+
+    def pending_for(self, user_id):
+        """Return whether events of ``user_id`` are waiting to be written."""
+        return user_id in self._users
+
+    def flush(self):
+        """Write every queued event now.  Returns the number written.
+
+        If the database fails the events stay queued and the
+        :class:`sqlite3.Error` is raised.  Events the database cannot take
+        at all (which :func:`review_rows` should have rejected) are dropped
+        and counted in ``dropped``, so that they cannot block the others.
+        """
+        with self._flush_lock:
+            with self._lock:
+                rows, self._rows = self._rows, []
+                self._users = set()
+            if not rows:
+                return 0
+            db = getattr(self._local, 'db', None)
+            try:
+                if db is None:
+                    db = self._local.db = self.connect()
+                apply_reviews(db, rows)
+            except sqlite3.Error:
+                self.errors += 1
+                self._requeue(rows)
+                raise
+            except Exception:
+                # Some row cannot be bound; write the rows one at a time to
+                # find it.
+                self.errors += 1
+                if db is None:
+                    self._requeue(rows)
+                    raise
+                written = 0
+                for i, row in enumerate(rows):
+                    try:
+                        apply_reviews(db, [row])
+                    except sqlite3.Error:
+                        self._requeue(rows[i:])
+                        raise
+                    except Exception:
+                        self.dropped += 1
+                    else:
+                        written += 1
+            else:
+                written = len(rows)
+            self.flushes += 1
+            self.flushed += written
+            return written
+
+    def _requeue(self, rows):
+        # Put the events back in front of any newer ones and retry on the
+        # next flush.
+        with self._lock:
+            self._rows[:0] = rows
+            self._users.update(row['user_id'] for row in rows)
+
+    def _run(self):
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                # Whatever went wrong, keep flushing: this thread is the
+                # only one that writes the events in the background.
+                pass
+
+    def close(self):
+        """Flush the remaining events and stop the background thread."""
+        self._closed = True
+        self._wakeup.set()
+        try:
+            self.flush()
+        except sqlite3.Error:
+            pass
+
+    def stats(self):
+        return {
+            'pending': len(self._rows),
+            'flushes': self.flushes,
+            'flushed': self.flushed,
+            'errors': self.errors,
+            'rejected': self.rejected,
+            'dropped': self.dropped,
+        }
@@ -0,0 +1,155 @@
+"""
+Purchase codes issued by the order system.
+
+Each purchase comes with its own registration code.  Codes live in the
+``purchase_codes`` table, whose primary key doubles as the unique index, so
+looking a code up costs one B-tree search however many codes are loaded.
+A code is redeemed by a single conditional ``UPDATE`` (see
+:func:`redeem_code`), which SQLite applies atomically: when two sign-ups race
+for the same code exactly one of them changes the row.
+
+Codes are loaded from the CSV exports of the order system, in chunked
+transactions so that millions of codes can be imported without holding
+the write lock for the whole file::
+
+    python purchase_codes.py codes.csv users.db
+    python purchase_codes.py --batch-size 50000 codes-2025-06.csv users.db
+"""
+
+import os
+import sqlite3
+import sys
+import time
+
+
+SCHEMA = (
+    '''CREATE TABLE IF NOT EXISTS purchase_codes (
+        code TEXT PRIMARY KEY,
+        batch TEXT NOT NULL DEFAULT '',
+        created_at INTEGER NOT NULL,
+        redeemed_at INTEGER,
+        user_id INTEGER
+    ) WITHOUT ROWID''',
+)
+
+# Codes inserted per transaction by the importer.
+IMPORT_BATCH = 10000
+
+
+def normalize_code(code):
+    """Return the stored form of ``code``: surrounding whitespace removed
+    and upper case, so that codes typed by hand still match.
+    """
+    return code.strip().upper()
+
+
+def code_available(db, code):
+    """Return whether ``code`` exists and has not been redeemed."""
+    row = db.execute(
+        'SELECT 1 FROM purchase_codes WHERE code = ? AND redeemed_at IS NULL',
+        (normalize_code(code),),
+    ).fetchone()
+    return row is not None
+
+
+def redeem_code(db, code, user_id, now=None):
+    """Mark ``code`` as redeemed by ``user_id`` and return whether it was
+    still available.
+
+    This runs in the caller's transaction, so the redemption is undone if
+    the caller rolls back (for example because the username is taken).
+    """
+    cursor = db.execute(
+        'UPDATE purchase_codes SET redeemed_at = ?, user_id = ? '
+        'WHERE code = ? AND redeemed_at IS NULL',
+        (int(now if now is not None else time.time()), user_id, normalize_code(code)),
+    )
+    return cursor.rowcount == 1
+
+
+def import_codes(db, codes, batch='', batch_size=IMPORT_BATCH):
+    """Insert ``codes`` (any iterable of strings) into ``db``.
+
+    Codes are committed ``batch_size`` at a time.  Codes that already exist
+    are left untouched, so an export can be imported again safely.  Returns
+    the number of new codes.
+    """
+    now = int(time.time())
+    imported = 0
+    chunk = []
+
+    def flush():
+        with db:
+            before = db.total_changes
+            db.executemany(
+                'INSERT OR IGNORE INTO purchase_codes (code, batch, created_at) VALUES (?, ?, ?)',
+                ((code, batch, now) for code in chunk),
+            )
+            return db.total_changes - before
+
+    for code in codes:
+        code = normalize_code(code)
+        if code:
+            chunk.append(code)
+        if len(chunk) >= batch_size:
+            imported += flush()
+            chunk = []
+    if chunk:
+        imported += flush()
+    return imported
+
+
+def read_csv_codes(f, column='code'):
+    """Yield the codes in an open CSV file.
+
+    If the first row has a ``column`` header the codes are read from that
+    column; otherwise every row's first field is a code.
+    """
+    import csv  # only needed by the importer, not by the application
+    reader = csv.reader(f)
+    first = next(reader, None)
+    if first is None:
+        return
+    headers = [name.strip().lower() for name in first]
+    if column in headers:
+        index = headers.index(column)
+    else:
+        index = 0
+        yield first[0]
+    for row in reader:
+        if len(row) > index:
+            yield row[index]
+
+
+def import_csv(csv_path, db_path, batch_size=IMPORT_BATCH):
+    """Import the codes in the CSV file at ``csv_path`` into the database
+    at ``db_path``, labelled with the file name.  Returns the number of
+    new codes.
+    """
+    db = sqlite3.connect(db_path)
+    try:
+        for statement in SCHEMA:
+            db.execute(statement)
+        with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+            return import_codes(db, read_csv_codes(f), os.path.basename(csv_path), batch_size)
+    finally:
+        db.close()
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description='Import purchase codes from a CSV file.')
+    parser.add_argument('csv', help="CSV export with a 'code' column (or codes in the first column)")
+    parser.add_argument('database', help='application database')
+    parser.add_argument('--batch-size', type=int, default=IMPORT_BATCH,
+                        help='codes committed per transaction')
+    args = parser.parse_args(argv)
+    started = time.perf_counter()
+    count = import_csv(args.csv, args.database, args.batch_size)
+    print(f"Imported {count} new purchase codes into {args.database} "
+          f"in {time.perf_counter() - started:.1f} s.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""
+Multiple-choice quizzes drawn from the facet index.
+
+A quiz is ``n`` random cards, each with its own translation and
+``choices - 1`` wrong translations taken from cards of the same part of
+speech, so that the wrong answers are plausible.  The cards are sampled
+from the id arrays of :class:`vocab_store.FacetIndex`, which are built once
+when the deck is loaded, with :func:`random.sample` over index ranges: the
+work per quiz depends on ``n`` and ``choices``, not on the size of the deck,
+and only the sampled entries are fetched.
+"""
+
+import bisect
+import random
+
+
+# Distractor candidates drawn per wrong answer needed.  Entries of the same
+# lexeme repeat across categories, so some candidates share a translation
+# with the card or with each other.
+DISTRACTOR_OVERSAMPLE = 3
+
+
+def sample_ids(arrays, k, rng):
+    """Return ``k`` distinct ids (or all of them, if there are fewer)
+    drawn uniformly from the concatenation of ``arrays``.
+    """
+    arrays = [ids for ids in arrays if ids]
+    offsets = []
+    total = 0
+    for ids in arrays:
+        offsets.append(total)
+        total += len(ids)
+    picked = []
+    for index in rng.sample(range(total), min(k, total)):
+        i = bisect.bisect_right(offsets, index) - 1
+        picked.append(arrays[i][index - offsets[i]])
+    return picked
+
+
+def build_quiz(facets, lookup, n=10, category=None, choices=4, rng=None):
+    """Return up to ``n`` quiz questions for ``category`` (or the whole
+    deck).
+
+    ``facets`` is the deck's :class:`vocab_store.FacetIndex` and ``lookup``
+    fetches a list of entries by id.  Each question is the card's entry with
+    ``choices``, a shuffled list of translations, and ``answer``, the index
+    of the card's own translation in it.  Fewer wrong answers are offered
+    when the deck does not have enough distinct translations.
+    """
+    rng = rng or random
+    categories = facets.ids['category']
+    if category:
+        pool = [categories.get(category, ())]
+    else:
+        pool = [categories[value] for value in sorted(categories)]
+    cards = lookup(sample_ids(pool, n, rng))
+
+    # Draw every candidate in one batch: first from the card's part of
+    # speech, then from the whole deck in case the part is too small.
+    wanted = choices - 1
+    everything = [categories[value] for value in sorted(categories)]
+    candidates = []
+    for card in cards:
+        same_part = facets.ids['part'].get(card.get('part', ''), ())
+        candidates.append((
+            sample_ids([same_part], wanted * DISTRACTOR_OVERSAMPLE, rng),
+            sample_ids(everything, wanted, rng),
+        ))
+    needed = {entry_id for pair in candidates for ids in pair for entry_id in ids}
+    translations = {entry['id']: entry['translation'] for entry in lookup(sorted(needed))}
+
+    questions = []
+    for card, (same_part, anywhere) in zip(cards, candidates):
+        options = [card['translation']]
+        for entry_id in same_part + anywhere:
+            translation = translations.get(entry_id)
+            if len(options) > wanted:
+                break
+            if translation and translation not in options:
+                options.append(translation)
+        rng.shuffle(options)
+        question = dict(card)
+        question['choices'] = options
+        question['answer'] = options.index(card['translation'])
+        questions.append(question)
+    return questions
@@ -1,73 +1,339 @@
 // JavaScript for the Japanese learning dashboard
 function initDashboard() {
   // Copy the global `vocab` array into a local variable.  When served as a
-  // static site, `vocab` is defined in static/vocab.js.  The script tags in
+  // static site, static/vocab.js defines the deck in normalized form as
+  // `vocabNormalized` (older builds define a plain `vocab` array).  The script tags in
   // dashboard.html load `vocab.js` before this script, so `vocab` will be
-  // available here.  If the site is extended to use an API, this fallback
-  // can be replaced with a fetch call similar to the commented code below.
-  let vocabData = typeof vocab !== 'undefined' ? Array.from(vocab) : [];
+  // available here.  The Flask dashboard queries /api/vocab instead, and a
+  // static page that does not include vocab.js loads per-category chunks.
+  let vocabData = [];
+  if (typeof vocab !== 'undefined') {
+    vocabData = Array.from(vocab);
+  } else if (typeof vocabNormalized !== 'undefined') {
+    vocabData = expandVocab(vocabNormalized);
+  }
   const searchInput = document.getElementById('searchInput');
   const cardsContainer = document.getElementById('cardsContainer');
+  const loadMoreBtn = document.getElementById('loadMore');
   const categoryButtons = document.querySelectorAll('.category-btn');
   let selectedCategory = 'All';
 
-  // Uncomment the following block if serving data via API
-  /*
-  fetch('/api/vocab')
-    .then((response) => response.json())
-    .then((data) => {
-      vocabData = data;
-      renderCards();
-    })
-    .catch((err) => {
-      console.error('Failed to load vocabulary:', err);
-    });
-  */
+  // When the dashboard is served by Flask, the container carries the URL of
+  // the search API.  Filtering and pagination then happen on the server and
+  // only one page of cards is transferred at a time.
+  const apiUrl = cardsContainer ? cardsContainer.dataset.apiUrl : '';
+  const pageSize = 60;
+  let nextCursor = null;
+  let requestSeq = 0;
+  let pageLoading = false;
+
+  // The container also carries the URL of the delta sync API.  The deck is
+  // then kept in IndexedDB and brought up to date with the changes since
+  // the stored version; browsing without a query uses the local copy.
+  const changesUrl = cardsContainer ? cardsContainer.dataset.changesUrl || '' : '';
+  const deckName = cardsContainer ? cardsContainer.dataset.deck || '' : '';
+  let localDeck = null;
+
+  // Without the API or an inline deck, the deck is read from the
+  // per-category chunks written by generate_vocab.py.  Only the chunk of the
+  // selected category is fetched, and fetched chunks are kept for reuse.
+  let manifestUrl = cardsContainer ? cardsContainer.dataset.manifestUrl || '' : '';
+  if (!apiUrl && !manifestUrl && !vocabData.length) {
+    manifestUrl = 'static/vocab/manifest.json';
+  }
+  const chunkCache = new Map();
+  let manifestPromise = null;
+
+  // Cards are virtualized: `results` holds every matching entry, but only
+  // the rows around the viewport are mounted.  The container's top and
+  // bottom padding stand in for the rows that are not mounted.
+  let results = [];
+  let mountedRange = [-1, -1];
+  let windowScheduled = false;
+  const overscanRows = 4;
+  const searchDelay = 150;
+  let searchTimer = null;
+
+  // Lowercased search text per entry, computed once on first use.
+  const searchKeys = new WeakMap();
+  function searchKeyOf(item) {
+    let key = searchKeys.get(item);
+    if (key === undefined) {
+      key = `${item.word}\n${item.reading}\n${item.translation}`.toLowerCase();
+      searchKeys.set(item, key);
+    }
+    return key;
+  }
 
   // Initial render
   renderCards();
+  if (apiUrl && changesUrl) {
+    syncDeck(changesUrl, apiUrl, deckName)
+      .then((entries) => {
+        localDeck = entries;
+        if (localDeck && !(searchInput && searchInput.value.trim())) renderCards();
+      })
+      .catch((err) => {
+        console.warn('Vocabulary sync failed, using the server:', err);
+      });
+  }
 
-  // Event: search input
+  // Event: search input, debounced so typing does not re-filter per key
   if (searchInput) {
     searchInput.addEventListener('input', () => {
-      renderCards();
+      clearTimeout(searchTimer);
+      searchTimer = setTimeout(renderCards, searchDelay);
     });
   }
 
   // Event: category buttons
-  categoryButtons.forEach((btn) => {
+  categoryButtons.forEach(bindCategoryButton);
+
+  function bindCategoryButton(btn) {
     btn.addEventListener('click', () => {
-      categoryButtons.forEach((b) => b.classList.remove('active'));
+      document.querySelectorAll('.category-btn').forEach((b) => b.classList.remove('active'));
       btn.classList.add('active');
       selectedCategory = btn.dataset.category;
       renderCards();
     });
-  });
+  }
+
+  // Event: load the next page of server results
+  if (loadMoreBtn) {
+    loadMoreBtn.addEventListener('click', () => {
+      if (nextCursor !== null) fetchPage(nextCursor);
+    });
+  }
+
+  // Event: one delegated handler for every card
+  if (cardsContainer) {
+    cardsContainer.addEventListener('click', (event) => {
+      const card = event.target.closest('.card');
+      if (card && cardsContainer.contains(card)) {
+        showDetails(results[Number(card.dataset.index)]);
+      }
+    });
+  }
+
+  // Event: remount the visible window when scrolling or resizing
+  window.addEventListener('scroll', scheduleWindow, { passive: true });
+  window.addEventListener('resize', scheduleWindow);
 
   // Render cards based on search and selected category
   function renderCards() {
     if (!cardsContainer) return;
+    clearCards();
+    const query = searchInput ? searchInput.value.trim().toLowerCase() : '';
+    if (apiUrl && !(localDeck && !query)) {
+      fetchPage(0);
+      return;
+    }
+    if (apiUrl) {
+      ++requestSeq;
+      nextCursor = null;
+      if (loadMoreBtn) loadMoreBtn.style.display = 'none';
+      addCards(localDeck.filter((item) => selectedCategory === 'All' || item.category === selectedCategory));
+      return;
+    }
+    if (manifestUrl) {
+      renderChunks();
+      return;
+    }
+    addCards(
+      vocabData.filter(
+        (item) =>
+          (selectedCategory === 'All' || item.category === selectedCategory) &&
+          matchesQuery(item, query)
+      )
+    );
+  }
+
+  function matchesQuery(item, query) {
+    return !query || searchKeyOf(item).includes(query);
+  }
+  function loadManifest() {
+    if (!manifestPromise) {
+      manifestPromise = fetch(manifestUrl)
+        .then((response) => response.json())
+        .then((manifest) => {
+          addCategoryButtons(manifest.categories);
+          return manifest;
+        });
+    }
+    return manifestPromise;
+  }
+
+  // Static pages have only the "All" button; add one per chunk, with the
+  // entry count from the manifest.
+  function addCategoryButtons(chunks) {
+    const allButton = document.querySelector('.category-btn');
+    if (!allButton || document.querySelectorAll('.category-btn').length > 1) return;
+    Object.keys(chunks).forEach((name) => {
+      const btn = document.createElement('button');
+      btn.className = 'category-btn';
+      btn.dataset.category = name;
+      btn.textContent = `${name} `;
+      const count = document.createElement('span');
+      count.className = 'category-count';
+      count.textContent = chunks[name].count;
+      btn.appendChild(count);
+      allButton.parentNode.appendChild(btn);
+      bindCategoryButton(btn);
+    });
+  }
+
+  // Return a promise for the entries of one category.  The chunk URL carries
+  // the content hash from the manifest so a regenerated chunk is refetched.
+  function loadChunk(manifest, name) {
+    if (!chunkCache.has(name)) {
+      const info = manifest.categories[name];
+      const base = new URL(manifestUrl, window.location.href);
+      const url = new URL(info.file, base);
+      url.searchParams.set('v', info.sha256.slice(0, 16));
+      const chunk = fetch(url)
+        .then((response) => response.json())
+        .then(expandVocab)
+        .catch((err) => {
+          chunkCache.delete(name);
+          throw err;
+        });
+      chunkCache.set(name, chunk);
+    }
+    return chunkCache.get(name);
+  }
+
+  // Render the selected category (or, for "All", every category one chunk
+  // after another) from the cached chunks.  Superseded renders stop early.
+  function renderChunks() {
+    const seq = ++requestSeq;
     const query = searchInput ? searchInput.value.trim().toLowerCase() : '';
-    cardsContainer.innerHTML = '';
-    vocabData.forEach((item) => {
-      const matchesCategory =
-        selectedCategory === 'All' || item.category === selectedCategory;
-      const matchesSearch =
-        item.word.toLowerCase().includes(query) ||
-        item.reading.toLowerCase().includes(query) ||
-        item.translation.toLowerCase().includes(query);
-      if (matchesCategory && matchesSearch) {
-        const card = document.createElement('div');
-        card.className = 'card';
-        card.innerHTML = `
-          <div class="card-title">${item.word}</div>
-          <div class="card-subtitle">${item.translation}</div>
-          <div class="card-category">${item.category}</div>
-        `;
-        card.addEventListener('click', () => showDetails(item));
-        cardsContainer.appendChild(card);
+    loadManifest()
+      .then((manifest) => {
+        const names =
+          selectedCategory === 'All'
+            ? Object.keys(manifest.categories)
+            : [selectedCategory].filter((name) => name in manifest.categories);
+        return names.reduce(
+          (previous, name) =>
+            previous.then(() => {
+              if (seq !== requestSeq) return null;
+              return loadChunk(manifest, name).then((entries) => {
+                if (seq !== requestSeq) return;
+                addCards(entries.filter((item) => matchesQuery(item, query)));
+              });
+            }),
+          Promise.resolve()
+        );
+      })
+      .catch((err) => {
+        console.error('Failed to load vocabulary:', err);
+      });
+  }
+
+  // Fetch one page of results from the server and append its cards.
+  // Responses to superseded queries are dropped.
+  function fetchPage(cursor) {
+    const seq = ++requestSeq;
+    pageLoading = true;
+    // Queries use the server's typo-tolerant search, ranked by relevance.
+    const params = new URLSearchParams({
+      q: searchInput ? searchInput.value.trim() : '',
+      match: 'fuzzy',
+      category: selectedCategory,
+      limit: pageSize,
+      cursor: cursor,
+    });
+    fetch(`${apiUrl}?${params}`)
+      .then((response) => response.json())
+      .then((page) => {
+        if (seq !== requestSeq) return;
+        if (cursor === 0) clearCards();
+        nextCursor = page.next_cursor;
+        addCards(page.items);
+        if (loadMoreBtn) {
+          loadMoreBtn.style.display = nextCursor === null ? 'none' : '';
+        }
+      })
+      .catch((err) => {
+        console.error('Failed to load vocabulary:', err);
+      })
+      .then(() => {
+        if (seq === requestSeq) pageLoading = false;
+      });
+  }
+
+  function clearCards() {
+    results = [];
+    mountedRange = [-1, -1];
+    cardsContainer.replaceChildren();
+    cardsContainer.style.paddingTop = '';
+    cardsContainer.style.paddingBottom = '';
+  }
+
+  function addCards(items) {
+    if (!items.length) return;
+    results = results.concat(items);
+    scheduleWindow();
+  }
+
+  function scheduleWindow() {
+    if (windowScheduled) return;
+    windowScheduled = true;
+    window.requestAnimationFrame(() => {
+      windowScheduled = false;
+      updateWindow();
+    });
+  }
+
+  // Mount the cards of the rows that intersect the viewport, plus a few
+  // rows of overscan on either side.  Every row has the same height (see
+  // .cards-container in style.css), so the visible rows follow directly
+  // from the scroll position.
+  function updateWindow() {
+    if (!cardsContainer) return;
+    const style = window.getComputedStyle(cardsContainer);
+    const columns = Math.max(1, style.gridTemplateColumns.split(' ').filter(Boolean).length);
+    const rowGap = parseFloat(style.rowGap) || 0;
+    const rowHeight = (parseFloat(style.gridAutoRows) || 120) + rowGap;
+    const rows = Math.ceil(results.length / columns);
+    const top = cardsContainer.getBoundingClientRect().top;
+    const first = Math.max(0, Math.floor(-top / rowHeight) - overscanRows);
+    const last = Math.min(rows, Math.ceil((window.innerHeight - top) / rowHeight) + overscanRows);
+    const start = Math.min(first * columns, results.length);
+    const end = Math.min(Math.max(last, first) * columns, results.length);
+
+    if (start !== mountedRange[0] || end !== mountedRange[1]) {
+      const fragment = document.createDocumentFragment();
+      for (let i = start; i < end; i++) {
+        fragment.appendChild(buildCard(results[i], i));
       }
+      cardsContainer.replaceChildren(fragment);
+      mountedRange = [start, end];
+    }
+    cardsContainer.style.paddingTop = `${first * rowHeight}px`;
+    cardsContainer.style.paddingBottom = `${Math.max(0, rows - Math.max(last, first)) * rowHeight}px`;
+
+    // Fetch the next server page once the end of the results is in view.
+    if (apiUrl && end === results.length && nextCursor !== null && !pageLoading) {
+      fetchPage(nextCursor);
+    }
+  }
+
+  function buildCard(item, index) {
+    const card = document.createElement('div');
+    card.className = 'card';
+    card.dataset.index = index;
+    [
+      ['card-title', item.word],
+      ['card-subtitle', item.translation],
+      ['card-category', item.category],
+    ].forEach(([className, text]) => {
+      const div = document.createElement('div');
+      div.className = className;
+      div.textContent = text;
+      card.appendChild(div);
     });
+    return card;
   }
 
   // Modal elements
@@ -134,6 +400,116 @@ function initDashboard() {
   window.initDashboard = initDashboard;
 }
 
+// Expand the normalized deck format (see normalize_entries in
+// vocab_store.py) into a list of entry objects.  Entries built from the same
+// lexeme share its collocations array.  Per-category chunks key `lexemes`
+// by ref and omit `category_refs`.
+function expandVocab(data) {
+  const lexemes = {};
+  Object.keys(data.lexemes).forEach((ref) => {
+    const lexeme = {};
+    data.fields.forEach((field, i) => {
+      lexeme[field] = data.lexemes[ref][i];
+    });
+    lexemes[ref] = lexeme;
+  });
+  const categoryRefs = data.category_refs;
+  return data.ids.map((id, i) =>
+    Object.assign({}, lexemes[data.lexeme_refs[i]], {
+      category: data.categories[categoryRefs ? categoryRefs[i] : 0],
+      id: id,
+    })
+  );
+}
+
+// Open the IndexedDB database holding a synced deck: `entries` keyed by
+// id, and `meta` with the dataset version the entries belong to.  Each deck
+// has a database of its own; the main deck's name is empty.
+function openDeckDb(deckName) {
+  return new Promise((resolve, reject) => {
+    const request = window.indexedDB.open(deckName ? `vocab-deck-${deckName}` : 'vocab-deck', 1);
+    request.onupgradeneeded = () => {
+      request.result.createObjectStore('entries', { keyPath: 'id' });
+      request.result.createObjectStore('meta');
+    };
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+}
+
+function requestResult(request) {
+  return new Promise((resolve, reject) => {
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+}
+
+function transactionDone(tx) {
+  return new Promise((resolve, reject) => {
+    tx.oncomplete = () => resolve();
+    tx.onerror = tx.onabort = () => reject(tx.error);
+  });
+}
+
+// Bring the deck stored in IndexedDB up to date and resolve to its entries
+// in id order, or to null when the deck cannot be kept locally.  Only the
+// entries changed since the stored version are downloaded; the whole deck
+// is fetched (in normalized form) on the first visit or when the server
+// answers with a reset.
+function syncDeck(changesUrl, deckUrl, deckName) {
+  if (!window.indexedDB) return Promise.resolve(null);
+  return openDeckDb(deckName).then((db) => {
+    const tx = db.transaction(['entries', 'meta'], 'readonly');
+    return Promise.all([
+      requestResult(tx.objectStore('meta').get('version')),
+      requestResult(tx.objectStore('entries').getAll()),
+    ]).then(([version, entries]) =>
+      fetch(`${changesUrl}?${new URLSearchParams({ since: version || 0 })}`)
+        .then((response) => response.json())
+        .then((changes) => {
+          if (changes.reset) {
+            // A null version means the server keeps no history to sync from.
+            return changes.version === null ? null : replaceDeck(db, deckUrl);
+          }
+          return applyChanges(db, entries, changes);
+        })
+    );
+  });
+}
+
+function replaceDeck(db, deckUrl) {
+  return fetch(`${deckUrl}?format=normalized`).then((response) => {
+    const version = Number(response.headers.get('X-Vocab-Version'));
+    return response.json().then((data) => {
+      const entries = expandVocab(data).sort((a, b) => a.id - b.id);
+      if (!version) return entries;
+      const tx = db.transaction(['entries', 'meta'], 'readwrite');
+      const store = tx.objectStore('entries');
+      store.clear();
+      entries.forEach((entry) => store.put(entry));
+      tx.objectStore('meta').put(version, 'version');
+      return transactionDone(tx).then(() => entries);
+    });
+  });
+}
+
+function applyChanges(db, entries, changes) {
+  if (!changes.changed.length && !changes.deleted.length) return Promise.resolve(entries);
+  const byId = new Map(entries.map((entry) => [entry.id, entry]));
+  const tx = db.transaction(['entries', 'meta'], 'readwrite');
+  const store = tx.objectStore('entries');
+  changes.changed.forEach((entry) => {
+    store.put(entry);
+    byId.set(entry.id, entry);
+  });
+  changes.deleted.forEach((id) => {
+    store.delete(id);
+    byId.delete(id);
+  });
+  tx.objectStore('meta').put(changes.version, 'version');
+  return transactionDone(tx).then(() => Array.from(byId.values()).sort((a, b) => a.id - b.id));
+}
+
 // Run dashboard initialisation on DOMContentLoaded if present
 document.addEventListener('DOMContentLoaded', function () {
   if (document.getElementById('cardsContainer')) {
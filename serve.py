@@ -0,0 +1,340 @@
+"""
+Production entry point: a prefork server around :func:`app.create_app`.
+
+The master process creates the application and loads the vocabulary and
+everything derived from it (search index, facet index, cached payloads,
+the binary deck mapping) before forking the workers.  The workers inherit
+those objects and, because nobody writes to them, share their memory pages
+copy-on-write with the master and with each other.  :func:`gc.freeze` moves
+the preloaded objects out of the collector's reach so that garbage
+collection in a worker does not touch, and thereby copy, those pages.
+
+Each worker accepts connections on the shared listening socket and handles
+them on a fixed pool of threads.  A worker exits after ``--max-requests``
+requests (with some jitter so that workers do not all restart at once) and
+the master forks a replacement from its preloaded state.
+
+The workers never check the vocabulary file or the asset manifest
+themselves.  The master checks them every ``--reload-interval`` seconds and
+on ``SIGHUP``; when either changed, the master loads the new deck, forks a
+new generation of workers and then stops the old ones, which finish the
+requests they are handling first.  The additional decks of ``decks.py``
+are the exception: each worker loads them on first use and checks them
+itself every ``DECK_CHECK_INTERVAL`` seconds.
+``SIGTERM`` or ``SIGINT`` shut the whole server down the same way::
+
+    python serve.py --bind 0.0.0.0:8000 --workers 4 --threads 8
+"""
+
+import argparse
+import gc
+import os
+import queue
+import random
+import signal
+import socket
+import sys
+import threading
+import time
+
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+
+import app as app_module
+
+
+# Seconds an idle keep-alive connection may hold a worker thread.
+KEEPALIVE_TIMEOUT = 5
+# Seconds a stopping worker gets to finish its requests before it is killed.
+GRACEFUL_TIMEOUT = 30
+# Seconds between two passes of the master loop.
+MASTER_TICK = 0.5
+
+
+class RequestHandler(WSGIRequestHandler):
+    timeout = KEEPALIVE_TIMEOUT
+
+
+class PooledWSGIServer(BaseWSGIServer):
+    """A WSGI server that handles connections on a fixed pool of threads.
+
+    The threads live as long as the worker, so per-thread state such as the
+    pooled database connections is set up once: ``on_thread_start`` is
+    called in each thread before it takes its first connection.  Accepting
+    blocks while every thread is busy, so waiting connections stay in the
+    shared listen queue where an idle worker can take them.
+    ``on_request`` is called after each connection is handled.
+    """
+
+    multithread = True
+
+    def __init__(self, host, port, app, threads, fd, on_request=None, on_thread_start=None):
+        super().__init__(host, port, app, handler=RequestHandler, fd=fd)
+        self.slots = threading.BoundedSemaphore(threads)
+        self.on_request = on_request
+        self.on_thread_start = on_thread_start
+        self.requests = queue.SimpleQueue()
+        self.threads = [
+            threading.Thread(target=self._run_thread, name='request-%d' % i, daemon=True)
+            for i in range(threads)
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    def process_request(self, request, client_address):
+        self.slots.acquire()
+        self.requests.put((request, client_address))
+
+    def _run_thread(self):
+        if self.on_thread_start is not None:
+            try:
+                self.on_thread_start()
+            except Exception:
+                # The thread's first request sets up what is missing.
+                pass
+        while True:
+            item = self.requests.get()
+            if item is None:
+                return
+            self._handle(*item)
+
+    def _handle(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self.slots.release()
+            if self.on_request is not None:
+                self.on_request()
+
+    def wait_for_requests(self, timeout):
+        # Each thread exits when it reaches its None, after the connections
+        # queued before it.
+        for _ in self.threads:
+            self.requests.put(None)
+        deadline = time.monotonic() + timeout
+        for thread in self.threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+
+
+def preload(application):
+    """Load the vocabulary, its derived data and the asset manifest into
+    ``application``.
+
+    Called in the master before forking and again whenever the dataset
+    changes, so that the workers inherit a fully built snapshot.  With
+    ``VOCAB_BACKEND = 'sqlite'`` the deck is read from the database, so
+    neither the JSON deck nor the binary deck is loaded.
+    """
+    extensions = application.extensions
+    snapshot = binary = None
+    if not uses_sqlite(application):
+        snapshot = extensions['vocab_store'].check()
+        snapshot.payload('facets')
+        binary = extensions['vocab_binary'].check()
+    assets = extensions['assets'].check()
+    return snapshot, binary, assets
+
+
+def preloaded(application):
+    """Return what :func:`preload` last loaded, without checking the files."""
+    extensions = application.extensions
+    snapshot = binary = None
+    if not uses_sqlite(application):
+        snapshot = extensions['vocab_store'].snapshot()
+        binary = extensions['vocab_binary'].current()
+    return snapshot, binary, extensions['assets'].assets()
+
+
+def uses_sqlite(application):
+    return application.config['VOCAB_BACKEND'] == 'sqlite'
+
+
+def run_worker(application, listener, host, port, threads, max_requests):
+    """Serve requests in a forked worker until told to stop."""
+    for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+        signal.signal(signum, signal.SIG_DFL)
+    random.seed()
+    app_module.reset_connections()
+
+    limit = max_requests + random.randint(0, max_requests // 10) if max_requests else 0
+    handled = [0]
+    stopping = threading.Event()
+
+    def stop():
+        if not stopping.is_set():
+            stopping.set()
+            threading.Thread(target=server.shutdown, daemon=True).start()
+
+    def count_request():
+        handled[0] += 1
+        if limit and handled[0] >= limit:
+            stop()
+
+    # Each request thread opens its database connection before it starts
+    # taking requests.
+    server = PooledWSGIServer(
+        host, port, application, threads, listener.fileno(), count_request,
+        lambda: app_module.warm_connection(application),
+    )
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop())
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    server.serve_forever(poll_interval=MASTER_TICK)
+    server.wait_for_requests(GRACEFUL_TIMEOUT)
+    # os._exit() skips atexit, so write buffered review events here.
+    application.extensions['progress_buffer'].close()
+    os._exit(0)
+
+
+class Master:
+    """Forks and supervises the workers."""
+
+    def __init__(self, application, listener, host, port, workers, threads, max_requests, reload_interval):
+        self.application = application
+        self.listener = listener
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.threads = threads
+        self.max_requests = max_requests
+        self.reload_interval = reload_interval
+        self.generation = 0
+        # pid -> generation
+        self.children = {}
+        # pid -> time SIGTERM was sent
+        self.stopping = {}
+        self.reload_requested = False
+        self.shutdown_requested = False
+
+    def spawn(self):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                run_worker(self.application, self.listener, self.host, self.port,
+                           self.threads, self.max_requests)
+            finally:
+                os._exit(1)
+        self.children[pid] = self.generation
+        return pid
+
+    def stop(self, pid):
+        if pid not in self.stopping:
+            self.stopping[pid] = time.monotonic()
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def reap(self):
+        while self.children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                break
+            self.children.pop(pid, None)
+            self.stopping.pop(pid, None)
+        # Kill workers that did not finish in time.
+        now = time.monotonic()
+        for pid, since in list(self.stopping.items()):
+            if now - since > GRACEFUL_TIMEOUT:
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+
+    def reload(self):
+        # Build the new snapshot before forking, so the new generation
+        # shares it; then retire the old generation.
+        loaded = preloaded(self.application)
+        requested, self.reload_requested = self.reload_requested, False
+        try:
+            snapshot, binary, assets = preload(self.application)
+        except (OSError, ValueError) as exc:
+            print(f"[master] reload failed, keeping the current workers: {exc}", file=sys.stderr)
+            return
+        if snapshot is loaded[0] and binary is loaded[1] and assets is loaded[2] and not requested:
+            return
+        gc.collect()
+        gc.freeze()
+        self.generation += 1
+        entries = f"{len(snapshot)} entries" if snapshot is not None else "SQLite deck"
+        print(f"[master] starting worker generation {self.generation} ({entries})")
+        for pid, generation in list(self.children.items()):
+            if generation < self.generation:
+                self.stop(pid)
+
+    def run(self):
+        signal.signal(signal.SIGHUP, self._request_reload)
+        signal.signal(signal.SIGTERM, self._request_shutdown)
+        signal.signal(signal.SIGINT, self._request_shutdown)
+        gc.collect()
+        gc.freeze()
+        next_check = time.monotonic() + self.reload_interval
+        while not self.shutdown_requested:
+            self.reap()
+            if self.reload_requested or (self.reload_interval and time.monotonic() >= next_check):
+                next_check = time.monotonic() + self.reload_interval
+                self.reload()
+            current = [pid for pid, generation in self.children.items()
+                       if generation == self.generation and pid not in self.stopping]
+            for _ in range(self.workers - len(current)):
+                self.spawn()
+            time.sleep(MASTER_TICK)
+        for pid in list(self.children):
+            self.stop(pid)
+        while self.children:
+            self.reap()
+            time.sleep(0.1)
+
+    def _request_reload(self, signum, frame):
+        self.reload_requested = True
+
+    def _request_shutdown(self, signum, frame):
+        self.shutdown_requested = True
+
+
+def parse_bind(value):
+    host, _, port = value.rpartition(':')
+    return host.strip('[]') or '0.0.0.0', int(port)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve the application with prefork workers.')
+    parser.add_argument('--bind', default='127.0.0.1:8000', help='HOST:PORT to listen on')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='number of worker processes (default: one per CPU)')
+    parser.add_argument('--threads', type=int, default=4, help='request threads per worker')
+    parser.add_argument('--max-requests', type=int, default=10000,
+                        help='restart a worker after this many requests (0 to disable)')
+    parser.add_argument('--reload-interval', type=float, default=5.0,
+                        help='seconds between checks of the vocabulary file (0 to disable)')
+    parser.add_argument('--backlog', type=int, default=2048)
+    args = parser.parse_args(argv)
+
+    host, port = parse_bind(args.bind)
+    # Workers leave the file checks to the master.
+    application = app_module.create_app({'VOCAB_CHECK_INTERVAL': float('inf')})
+    preload(application)
+    startup = application.extensions['startup']
+    phases = ', '.join(f"{phase} {seconds:.3f} s" for phase, seconds in startup['phases'].items())
+    print(f"[master] started in {startup['import_seconds'] + startup['total_seconds']:.3f} s "
+          f"(imports {startup['import_seconds']:.3f} s, {phases or 'no warm-up'})")
+
+    family = socket.AF_INET6 if ':' in host else socket.AF_INET
+    listener = socket.create_server((host, port), family=family, backlog=args.backlog)
+    listener.set_inheritable(True)
+    print(f"[master] pid {os.getpid()} listening on {args.bind} with "
+          f"{args.workers} workers x {args.threads} threads")
+    Master(
+        application, listener, host, listener.getsockname()[1], args.workers,
+        args.threads, args.max_requests, args.reload_interval,
+    ).run()
+    listener.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
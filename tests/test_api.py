@@ -0,0 +1,53 @@
+import gzip
+import json
+
+import pytest
+
+import app as app_module
+
+
+ENTRIES = [
+    {'id': i, 'word': '語%d' % i, 'reading': 'go%d' % i, 'translation': 'Word %d' % i,
+     'part': 'noun', 'collocations': [], 'example': '', 'category': 'Misc'}
+    for i in range(1, 6)
+]
+
+
+@pytest.fixture(params=['json', 'sqlite'])
+def client(request, tmp_path):
+    deck = tmp_path / 'vocab.json'
+    deck.write_text(json.dumps(ENTRIES), encoding='utf-8')
+    application = app_module.create_app({
+        'DATABASE': str(tmp_path / 'users.db'),
+        'VOCAB_PATH': str(deck),
+        'VOCAB_BACKEND': request.param,
+        'WARMUP': False,
+    })
+    client = application.test_client()
+    with client.session_transaction() as session:
+        session['user_id'] = 1
+    return client
+
+
+def test_full_deck_is_cached_and_revalidated(client):
+    response = client.get('/api/vocab')
+    assert response.status_code == 200
+    assert json.loads(response.data) == ENTRIES
+    etag = response.headers['ETag']
+    assert client.get('/api/vocab', headers={'If-None-Match': etag}).status_code == 304
+
+    compressed = client.get('/api/vocab', headers={'Accept-Encoding': 'gzip'})
+    assert compressed.headers['Content-Encoding'] == 'gzip'
+    assert json.loads(gzip.decompress(compressed.data)) == ENTRIES
+
+    normalized = client.get('/api/vocab?format=normalized')
+    assert normalized.get_json()['format'] == 'normalized-v1'
+    assert normalized.headers['ETag'] != etag
+
+
+def test_weak_validators_match(client):
+    etag = client.get('/api/vocab').headers['ETag']
+    weak = client.get('/api/vocab', headers={'If-None-Match': 'W/' + etag})
+    assert weak.status_code == 304
+    assert client.get('/api/vocab', headers={'If-None-Match': '"other", W/' + etag}).status_code == 304
+    assert client.get('/api/vocab', headers={'If-None-Match': 'W/"other"'}).status_code == 200
@@ -0,0 +1,45 @@
+import os
+
+from assets import AssetManifest, fingerprint_assets, is_fingerprinted
+
+
+def write(path, text, step=0):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.utime(path, ns=(step * 10 ** 9, step * 10 ** 9))
+
+
+def test_fingerprint_and_resolve(tmp_path):
+    static = str(tmp_path)
+    write(os.path.join(static, 'script.js'), 'one')
+    manifest = AssetManifest(static, check_interval=0)
+    assert manifest.resolve('script.js') == 'script.js'
+    empty = manifest.assets()
+    assert manifest.assets() is empty
+
+    hashed = fingerprint_assets(static, ['script.js', 'missing.css'])['script.js']
+    assert is_fingerprinted(hashed)
+    assert os.path.exists(os.path.join(static, hashed))
+    assert manifest.resolve('script.js') == hashed
+    assets = manifest.assets()
+    assert manifest.assets() is assets
+
+
+def test_edited_asset_falls_back_to_its_plain_name(tmp_path):
+    static = str(tmp_path)
+    plain = os.path.join(static, 'script.js')
+    write(plain, 'one')
+    first = fingerprint_assets(static, ['script.js'])['script.js']
+    manifest = AssetManifest(static, check_interval=0)
+    assert manifest.resolve('script.js') == first
+
+    write(plain, 'two', 1)
+    assert manifest.resolve('script.js') == 'script.js'
+
+    second = fingerprint_assets(static, ['script.js'])['script.js']
+    assert second != first
+    assert manifest.resolve('script.js') == second
+    # Only the previous version is kept next to the current one.
+    write(plain, 'three', 2)
+    fingerprint_assets(static, ['script.js'])
+    assert not os.path.exists(os.path.join(static, first))
@@ -0,0 +1,58 @@
+import json
+import os
+
+import app as app_module
+from decks import DeckRegistry
+
+
+def write_deck(path, translation, step=0):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump([{'id': 1, 'word': '猫', 'reading': 'neko', 'translation': translation,
+                    'part': 'noun', 'category': 'Animals'}], f)
+    os.utime(path, ns=(step * 10 ** 9, step * 10 ** 9))
+
+
+def test_lru_eviction(tmp_path):
+    for name in ('a', 'b', 'c'):
+        write_deck(str(tmp_path / (name + '.json')), name)
+    registry = DeckRegistry(str(tmp_path), check_interval=0, max_decks=2)
+    assert registry.names() == ['a', 'b', 'c']
+    assert registry.get('nope') is None
+    registry.get('a')
+    registry.get('b')
+    registry.get('a')
+    registry.get('c')
+    stats = registry.stats()
+    assert stats['loaded'] == ['a', 'c']
+    assert (stats['hits'], stats['misses'], stats['evictions']) == (1, 3, 1)
+
+
+def test_decks_are_checked_under_the_prefork_settings(tmp_path):
+    decks = tmp_path / 'decks'
+    decks.mkdir()
+    application = app_module.create_app({
+        'DATABASE': str(tmp_path / 'users.db'),
+        'VOCAB_PATH': str(tmp_path / 'vocab.json'),
+        'VOCAB_CHECK_INTERVAL': float('inf'),
+        'DECK_CHECK_INTERVAL': 0,
+        'DECKS_DIR': str(decks),
+        'WARMUP': False,
+    })
+    registry = application.extensions['deck_registry']
+    assert registry.names() == []
+
+    write_deck(str(decks / 'n5.json'), 'Cat')
+    assert registry.names() == ['n5']
+    assert registry.get('n5').snapshot().get(1)['translation'] == 'Cat'
+    write_deck(str(decks / 'n5.json'), 'Kitty', 1)
+    assert registry.get('n5').snapshot().get(1)['translation'] == 'Kitty'
+
+
+def test_deck_interval_defaults_to_a_finite_value(tmp_path):
+    application = app_module.create_app({
+        'DATABASE': str(tmp_path / 'users.db'),
+        'VOCAB_PATH': str(tmp_path / 'vocab.json'),
+        'VOCAB_CHECK_INTERVAL': float('inf'),
+        'WARMUP': False,
+    })
+    assert application.extensions['deck_registry'].check_interval == 1.0
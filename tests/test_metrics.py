@@ -0,0 +1,16 @@
+import app as app_module
+
+
+def test_monotonic_values_are_exported_as_counters(tmp_path):
+    application = app_module.create_app({
+        'DATABASE': str(tmp_path / 'users.db'),
+        'VOCAB_PATH': str(tmp_path / 'vocab.json'),
+        'WARMUP': False,
+    })
+    text = application.test_client().get('/metrics').get_data(as_text=True)
+    for name in (
+        'vocab_reloads_total', 'vocab_reload_errors_total', 'deck_cache_hits_total',
+        'deck_cache_misses_total', 'deck_cache_evictions_total',
+    ):
+        assert '# TYPE %s counter\n' % name in text
+    assert '# TYPE vocab_entries gauge\n' in text
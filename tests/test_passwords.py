@@ -0,0 +1,32 @@
+import threading
+
+import pytest
+from werkzeug.security import generate_password_hash
+
+from passwords import HasherBusy, PasswordHasher
+
+
+@pytest.mark.parametrize('method', ['scrypt', 'pbkdf2', 'pbkdf2:sha256', 'pbkdf2:sha256:1000'])
+def test_hash_made_with_configured_method_needs_no_rehash(method):
+    hasher = PasswordHasher(method, workers=1)
+    assert not hasher.needs_rehash(hasher.hash('secret'))
+    assert not hasher.needs_rehash(generate_password_hash('secret', method))
+
+
+def test_hash_made_with_other_method_needs_rehash():
+    hasher = PasswordHasher('pbkdf2:sha256:1000', workers=1)
+    assert hasher.needs_rehash(generate_password_hash('secret', 'pbkdf2:sha256:2000'))
+
+
+def test_invalid_method_is_rejected_at_construction():
+    with pytest.raises(ValueError):
+        PasswordHasher('nonsense', workers=1)
+
+
+def test_timeout_raises_busy():
+    hasher = PasswordHasher('pbkdf2:sha256:1000', workers=1, timeout=0.01)
+    release = threading.Event()
+    with pytest.raises(HasherBusy):
+        hasher._run(release.wait, 5)
+    release.set()
+    assert hasher.rejected == 1
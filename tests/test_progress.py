@@ -0,0 +1,132 @@
+import sqlite3
+import time
+
+import pytest
+
+from progress import DAY, SCHEMA, ProgressBuffer, apply_reviews, review_rows
+
+
+NOW = 1700000000
+
+
+def connect(path):
+    db = sqlite3.connect(path)
+    for statement in SCHEMA:
+        db.execute(statement)
+    return db
+
+
+def card(db, vocab_id=1):
+    return db.execute(
+        'SELECT reviews, lapses, interval_days, due, last_review FROM progress'
+        ' WHERE user_id = 1 AND vocab_id = ?', (vocab_id,)
+    ).fetchone()
+
+
+def review(vocab_id, grade, reviewed_at):
+    return review_rows(1, [{'id': vocab_id, 'grade': grade, 'reviewed_at': reviewed_at}], NOW)
+
+
+def test_upsert_schedules_and_ignores_replays(tmp_path):
+    db = connect(str(tmp_path / 'db'))
+    apply_reviews(db, review(1, 4, NOW - 10 * DAY))
+    assert card(db) == (1, 0, 1, NOW - 9 * DAY, NOW - 10 * DAY)
+
+    # The same event again, and an older one, change nothing.
+    apply_reviews(db, review(1, 4, NOW - 10 * DAY))
+    apply_reviews(db, review(1, 1, NOW - 20 * DAY))
+    assert card(db) == (1, 0, 1, NOW - 9 * DAY, NOW - 10 * DAY)
+
+    apply_reviews(db, review(1, 5, NOW - 8 * DAY))
+    assert card(db) == (2, 0, 6, NOW - 2 * DAY, NOW - 8 * DAY)
+    apply_reviews(db, review(1, 2, NOW))
+    assert card(db) == (3, 1, 1, NOW + DAY, NOW)
+
+
+def test_review_rows_validates_and_clamps_future_events():
+    assert review_rows(1, [{'id': '3', 'grade': 5, 'reviewed_at': NOW + 60}], NOW) == [
+        {'user_id': 1, 'vocab_id': 3, 'grade': 5, 'reviewed_at': NOW},
+    ]
+    with pytest.raises(ValueError):
+        review_rows(1, [{'id': 1, 'grade': 6}], NOW)
+    with pytest.raises(ValueError):
+        review_rows(1, [{'grade': 3}], NOW)
+    with pytest.raises(ValueError):
+        review_rows(1, [{'id': 10 ** 20, 'grade': 3}], NOW)
+    assert review_rows(1, [{'id': 1, 'grade': 3, 'reviewed_at': -10 ** 20}], NOW)[0]['reviewed_at'] == 0
+
+
+class FlakyConnect:
+    def __init__(self, path):
+        self.path = path
+        self.failing = True
+
+    def __call__(self):
+        if self.failing:
+            raise sqlite3.OperationalError('unable to open database file')
+        return connect(self.path)
+
+
+def test_failed_flush_keeps_the_events(tmp_path):
+    path = str(tmp_path / 'db')
+    opener = FlakyConnect(path)
+    buffer = ProgressBuffer(opener, flush_interval=3600)
+    buffer.add(review(1, 4, NOW))
+    assert buffer.pending_for(1)
+    with pytest.raises(sqlite3.OperationalError):
+        buffer.flush()
+    assert buffer.stats()['pending'] == 1
+    assert buffer.pending_for(1)
+
+    opener.failing = False
+    assert buffer.flush() == 1
+    assert not buffer.pending_for(1)
+    assert card(connect(path))[0] == 1
+    assert buffer.stats() == {
+        'pending': 0, 'flushes': 1, 'flushed': 1, 'errors': 1, 'rejected': 0, 'dropped': 0,
+    }
+
+
+def test_full_buffer_refuses_events_it_cannot_flush(tmp_path):
+    opener = FlakyConnect(str(tmp_path / 'db'))
+    buffer = ProgressBuffer(opener, flush_interval=3600, max_pending=2)
+    buffer.add(review(1, 4, NOW) + review(2, 4, NOW))
+    with pytest.raises(sqlite3.OperationalError):
+        buffer.add(review(3, 4, NOW))
+    assert buffer.stats()['pending'] == 2
+    assert buffer.rejected == 1
+
+    opener.failing = False
+    buffer.add(review(3, 4, NOW))
+    assert buffer.stats()['pending'] == 1
+    assert buffer.flushed == 2
+
+
+def test_rows_the_database_cannot_take_are_dropped(tmp_path):
+    path = str(tmp_path / 'db')
+    buffer = ProgressBuffer(lambda: connect(path), flush_interval=3600)
+    bad = dict(review(2, 3, NOW)[0], vocab_id=10 ** 20)
+    buffer.add(review(1, 4, NOW) + [bad] + review(3, 4, NOW))
+    assert buffer.flush() == 2
+    assert buffer.dropped == 1
+    assert buffer.stats()['pending'] == 0
+    db = connect(path)
+    assert card(db, 1)[0] == card(db, 3)[0] == 1
+
+
+def test_flush_thread_survives_unexpected_errors(tmp_path):
+    path = str(tmp_path / 'db')
+    buffer = ProgressBuffer(lambda: connect(path), flush_interval=0.01)
+    buffer.add([dict(review(2, 3, NOW)[0], vocab_id=10 ** 20)])
+    buffer.add(review(1, 4, NOW))
+    deadline = time.monotonic() + 5
+    while buffer.flushed < 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert buffer._thread.is_alive()
+    assert buffer.flushed == 1
+    assert buffer.dropped == 1
+    buffer.add(review(3, 4, NOW))
+    while buffer.flushed < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert buffer.flushed == 2
+    buffer.close()
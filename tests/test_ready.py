@@ -0,0 +1,29 @@
+import json
+
+import app as app_module
+
+
+def test_ready_reflects_whether_the_deck_can_be_loaded(tmp_path):
+    deck = tmp_path / 'vocab.json'
+    application = app_module.create_app({
+        'DATABASE': str(tmp_path / 'users.db'),
+        'VOCAB_PATH': str(deck),
+        'VOCAB_CHECK_INTERVAL': 0,
+    })
+    client = application.test_client()
+
+    response = client.get('/ready')
+    assert response.status_code == 503
+    body = response.get_json()
+    assert body['ready'] is False
+    assert body['problems'][0].startswith('vocab:')
+    assert set(body['phases']) == {'vocab', 'templates', 'database'}
+
+    deck.write_text(json.dumps([{
+        'id': 1, 'word': '学校', 'reading': 'gakkou', 'translation': 'School',
+        'part': 'noun', 'category': 'Misc',
+    }]), encoding='utf-8')
+    response = client.get('/ready')
+    assert response.status_code == 200
+    assert response.get_json()['problems'] == []
+    assert response.headers['Cache-Control'] == 'no-store'
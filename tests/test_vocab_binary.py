@@ -0,0 +1,70 @@
+import json
+import os
+
+import pytest
+
+from vocab_binary import BinaryVocab, BinaryVocabStore, encode_record, source_stamp, write_binary
+
+
+def make_entry(entry_id, word='学校', collocations=('学校へ行く', '学校の先生')):
+    return {
+        'word': word,
+        'reading': 'gakkou',
+        'translation': 'School',
+        'part': 'noun',
+        'collocations': list(collocations),
+        'example': '明日学校に行きます。',
+        'category': 'Education',
+        'id': entry_id,
+    }
+
+
+@pytest.mark.parametrize('ids', [[1, 2, 3, 4], [3, 10, 11, 500]], ids=['dense', 'sparse'])
+def test_round_trip(tmp_path, ids):
+    entries = [make_entry(i, word='語%d' % i, collocations=['c%d' % j for j in range(i % 3)]) for i in ids]
+    path = str(tmp_path / 'vocab.bin')
+    assert write_binary(path, reversed(entries), (123, 456)) == len(entries)
+    vocab = BinaryVocab(path)
+    assert len(vocab) == len(entries)
+    assert vocab.dense == (ids == list(range(ids[0], ids[0] + len(ids))))
+    assert vocab.source_stamp == (123, 456)
+    for entry in entries:
+        assert vocab.get(entry['id']) == entry
+    assert vocab.get(ids[0] - 1) is None
+    assert vocab.get(ids[-1] + 1) is None
+    assert vocab.get_many([ids[-1], 999999, ids[0]]) == [entries[-1], entries[0]]
+
+
+def test_empty_file(tmp_path):
+    path = str(tmp_path / 'vocab.bin')
+    write_binary(path, [])
+    vocab = BinaryVocab(path)
+    assert len(vocab) == 0
+    assert vocab.get(1) is None
+
+
+def test_nul_is_rejected():
+    with pytest.raises(ValueError):
+        encode_record(make_entry(1, word='a\0b'))
+
+
+def test_source_stamp_matches_deck_file(tmp_path):
+    deck = tmp_path / 'vocab.json'
+    deck.write_text(json.dumps([make_entry(1)]), encoding='utf-8')
+    path = str(tmp_path / 'vocab.bin')
+    write_binary(path, [make_entry(1)], source_stamp(str(deck)))
+    assert BinaryVocab(path).source_stamp == source_stamp(str(deck))
+
+
+def test_store_keeps_last_good_mapping_and_rejects_old_format(tmp_path):
+    path = str(tmp_path / 'vocab.bin')
+    store = BinaryVocabStore(path, check_interval=0)
+    assert store.current() is None
+    write_binary(path, [make_entry(1)])
+    first = store.current()
+    assert first.get(1)['word'] == '学校'
+    with open(path, 'r+b') as f:
+        f.write(b'VOCABIN1')
+    os.utime(path, ns=(1, 1))
+    assert store.current() is first
+    assert store.reload_errors == 1
@@ -0,0 +1,132 @@
+import json
+import os
+
+import pytest
+
+import app as app_module
+from vocab_store import VocabStore
+
+
+SECOND = 10 ** 9
+START = 1700000000 * SECOND
+
+
+def entry(entry_id, translation=None):
+    return {
+        'id': entry_id,
+        'word': '語%d' % entry_id,
+        'reading': 'go%d' % entry_id,
+        'translation': translation or 'Word %d' % entry_id,
+        'part': 'noun',
+        'category': 'Misc',
+    }
+
+
+def write_deck(path, entries, step):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(entries, f, ensure_ascii=False)
+    # Distinct modification times, so that every write is a new version.
+    os.utime(path, ns=(START + step * SECOND, START + step * SECOND))
+
+
+@pytest.fixture
+def deck(tmp_path):
+    path = str(tmp_path / 'vocab.json')
+    write_deck(path, [entry(i) for i in range(1, 11)], 0)
+    return path
+
+
+def test_changes_merge_across_versions(deck):
+    store = VocabStore(deck)
+    v0 = store.check().version
+
+    entries = [entry(i) for i in range(1, 11)]
+    entries[0] = entry(1, 'First')
+    write_deck(deck, entries, 1)
+    v1 = store.check().version
+
+    # Delete 2 and 3, change 4, add 11.
+    entries = [e for e in entries if e['id'] not in (2, 3)] + [entry(11)]
+    entries[1] = entry(4, 'Fourth')
+    write_deck(deck, entries, 2)
+    v2 = store.check().version
+
+    # Bring 3 back and delete 11 again.
+    entries = entries[:1] + [entry(3)] + entries[1:-1]
+    write_deck(deck, entries, 3)
+    snapshot = store.check()
+    assert v0 < v1 < v2 < snapshot.version
+
+    # 11 was added and deleted after v0; deleting an id the client never
+    # had is harmless, so it may be reported.
+    assert store.changes_since(v0)[1:] == ([1, 3, 4], [2, 11])
+    assert store.changes_since(v1)[1:] == ([3, 4], [2, 11])
+    assert store.changes_since(v2)[1:] == ([3], [11])
+    assert store.changes_since(snapshot.version)[1:] == ([], [])
+
+
+def test_rewrite_without_changes_keeps_the_version(deck):
+    store = VocabStore(deck)
+    version = store.check().version
+    with open(deck, encoding='utf-8') as f:
+        entries = json.load(f)
+    write_deck(deck, entries, 5)
+    assert store.check().version == version
+    assert store.changes_since(version)[1:] == ([], [])
+
+
+def test_unknown_and_expired_versions(deck):
+    store = VocabStore(deck)
+    store.history_size = 2
+    v0 = store.check().version
+    for step in range(1, 4):
+        write_deck(deck, [entry(i, 'v%d' % step if i == 1 else None) for i in range(1, 11)], step)
+        store.check()
+    assert store.changes_since(v0)[1:] == (None, None)
+    assert store.changes_since(v0 + 1)[1:] == (None, None)
+    assert store.changes_since(store.snapshot().version + 1)[1:] == (None, None)
+
+
+@pytest.fixture
+def client(deck, tmp_path):
+    application = app_module.create_app({
+        'DATABASE': str(tmp_path / 'users.db'),
+        'VOCAB_PATH': deck,
+        'VOCAB_CHECK_INTERVAL': 0,
+        'WARMUP': False,
+    })
+    client = application.test_client()
+    with client.session_transaction() as session:
+        session['user_id'] = 1
+    return client
+
+
+def test_changes_endpoint(client, deck):
+    first = client.get('/api/vocab/changes?since=0').get_json()
+    assert first['reset'] is True
+    version = first['version']
+    assert client.get('/api/vocab/changes?since=%d' % version).get_json() == {
+        'version': version, 'reset': False, 'changed': [], 'deleted': [],
+    }
+
+    entries = [entry(i) for i in range(1, 11) if i != 2]
+    entries[0] = entry(1, 'First')
+    write_deck(deck, entries, 1)
+    body = client.get('/api/vocab/changes?since=%d' % version).get_json()
+    assert body['version'] > version
+    assert body['reset'] is False
+    assert [e['id'] for e in body['changed']] == [1]
+    assert body['changed'][0]['translation'] == 'First'
+    assert body['deleted'] == [2]
+
+    # A version this process never saw asks for a full download.
+    assert client.get('/api/vocab/changes?since=%d' % (version + 12345)).get_json()['reset'] is True
+    assert client.get('/api/vocab/changes?since=abc').status_code == 400
+
+
+def test_changes_endpoint_resets_when_most_of_the_deck_changed(client, deck):
+    version = client.get('/api/vocab/changes').get_json()['version']
+    write_deck(deck, [entry(i, 'New %d' % i) if i <= 6 else entry(i) for i in range(1, 11)], 1)
+    body = client.get('/api/vocab/changes?since=%d' % version).get_json()
+    assert body == {'version': body['version'], 'reset': True}
+    assert body['version'] > version
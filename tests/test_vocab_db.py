@@ -0,0 +1,65 @@
+import sqlite3
+
+import pytest
+
+from vocab_db import get_vocab, import_vocab, init_vocab_schema, search_vocab, vocab_usages
+
+
+def entry(entry_id, collocations, example=''):
+    return {
+        'id': entry_id, 'word': '語', 'reading': 'go', 'translation': 'word', 'part': 'noun',
+        'collocations': collocations, 'example': example, 'category': 'Misc',
+    }
+
+
+@pytest.fixture
+def db():
+    db = sqlite3.connect(':memory:')
+    db.row_factory = sqlite3.Row
+    init_vocab_schema(db)
+    import_vocab(db, [
+        entry(1, ['学校へ行く', '学校の先生']),
+        entry(2, ['駅へ行く', '駅前']),
+        entry(3, ['学校が好き'], '学校は楽しい。'),
+        entry(4, []),
+        entry(5, ['大学'], '大学の学校'),
+    ])
+    return db
+
+
+@pytest.mark.parametrize('term', ['",', '["', '", "', '[]'])
+def test_json_punctuation_does_not_match(db, term):
+    assert vocab_usages(db, term) == ([], None)
+
+
+def test_usages_and_pagination(db):
+    items, cursor = vocab_usages(db, '学校', limit=2)
+    assert [item['id'] for item in items] == [1, 3]
+    assert items[1]['usages'] == ['学校が好き', '学校は楽しい。']
+    items, cursor = vocab_usages(db, '学校', limit=2, cursor=cursor)
+    assert [item['id'] for item in items] == [5]
+    assert cursor is None
+
+
+def test_long_terms_use_the_full_text_index(db):
+    items, cursor = vocab_usages(db, '学校の', limit=1)
+    assert [(item['id'], item['usages']) for item in items] == [(1, ['学校の先生'])]
+    assert cursor is None
+    items, cursor = vocab_usages(db, '学校は楽', limit=1)
+    assert [(item['id'], item['usages']) for item in items] == [(3, ['学校は楽しい。'])]
+
+
+def test_get_vocab_skips_ids_sqlite_cannot_store(db):
+    assert [entry['id'] for entry in get_vocab(db, [10 ** 23, 3, -10 ** 23, 1])] == [3, 1]
+    assert get_vocab(db, [2 ** 63]) == []
+
+
+def test_search_cursor_beyond_the_integer_range(db):
+    assert search_vocab(db, 'go', cursor=10 ** 23) == ([], None)
+    assert search_vocab(db, 'x', cursor=10 ** 23) == ([], None)
+    assert [entry['id'] for entry in search_vocab(db, '', cursor=-10 ** 23)[0]] == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize('term', ['学', '学校の'])
+def test_usages_cursor_beyond_the_integer_range(db, term):
+    assert vocab_usages(db, term, cursor=10 ** 23) == ([], None)
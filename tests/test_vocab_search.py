@@ -0,0 +1,45 @@
+from vocab_search import FuzzyIndex
+from vocab_store import VocabSnapshot
+
+
+ENTRIES = [
+    {'id': 1, 'word': 'こんにちは', 'reading': 'konnichiwa', 'translation': 'Hello',
+     'part': 'expression', 'category': 'Greetings'},
+    {'id': 2, 'word': '学校', 'reading': 'gakkou', 'translation': 'School',
+     'part': 'noun', 'category': 'Education'},
+    {'id': 3, 'word': '小学校', 'reading': 'shougakkou', 'translation': 'Elementary school',
+     'part': 'noun', 'category': 'Education'},
+    {'id': 4, 'word': 'おはよう', 'reading': 'ohayou', 'translation': 'Good morning',
+     'part': 'expression', 'category': 'Greetings'},
+]
+
+
+def snapshot():
+    return VocabSnapshot(ENTRIES, (0, 0))
+
+
+def test_typo_tolerant():
+    items, _ = snapshot().fuzzy_search('konichiwa')
+    assert [item['id'] for item in items] == [1]
+
+
+def test_short_queries_use_substring_search():
+    index = FuzzyIndex(snapshot().lexemes)
+    for query in ('学', 'こ', 'k'):
+        assert not index.accepts(query)
+    assert index.accepts('gakko')
+    deck = snapshot()
+    assert [item['id'] for item in deck.fuzzy_search('学')[0]] == [2, 3]
+    assert [item['id'] for item in deck.fuzzy_search('k')[0]] == [1, 2, 3]
+
+
+def test_pages_concatenate_to_the_full_ranking():
+    deck = snapshot()
+    for query in ('gakko', 'school', '学'):
+        full = [item['id'] for item in deck.fuzzy_search(query, limit=100)[0]]
+        paged = []
+        cursor = 0
+        while cursor is not None:
+            items, cursor = deck.fuzzy_search(query, limit=1, offset=cursor)
+            paged.extend(item['id'] for item in items)
+        assert paged == full
@@ -0,0 +1,293 @@
+"""
+Memory-mapped binary vocabulary file.
+
+Looking up a single entry in ``data/vocab.json`` means parsing the whole
+file.  ``data/vocab.bin``, written by ``generate_vocab.py``, is laid out so
+that one entry can be read without touching the others:
+
+* a fixed-size header (:data:`HEADER`): magic, entry count, smallest id,
+  whether the ids are consecutive and the ``(mtime_ns, size)`` stamp of the
+  deck file the records were made from,
+* an offset table with one ``(id, offset)`` pair per entry in ascending id
+  order (:data:`TABLE_ENTRY`), followed by a sentinel whose offset is the end
+  of the last record,
+* the packed records: the UTF-8 encoded fields of each entry separated by NUL
+  characters, see :func:`encode_record`.
+
+:class:`BinaryVocab` maps the file with :mod:`mmap` and decodes a record only
+when it is asked for.  When the ids are consecutive the table slot of an id
+is computed directly; otherwise it is found by binary search.  The mapped
+pages are shared by every worker process through the page cache, so no
+worker holds a parsed copy of the deck.  The application only uses the file
+while its source stamp matches the deck file it serves (see
+:attr:`BinaryVocab.source_stamp`), so an edited deck is never answered from a
+stale binary.
+
+Run this module directly to convert an existing deck::
+
+    python vocab_binary.py data/vocab.json data/vocab.bin
+"""
+
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+
+from vocab_store import expand_normalized, read_vocab
+
+
+MAGIC = b'VOCABIN2'
+
+# magic, entry count, first id, 1 if ids are first_id, first_id + 1, ...,
+# source deck mtime_ns and size ((0, 0) if unknown)
+HEADER = struct.Struct('<8sQqQqQ')
+TABLE_ENTRY = struct.Struct('<qQ')
+
+# Fields stored before the collocations in every record.
+RECORD_FIELDS = ('word', 'reading', 'translation', 'part', 'example', 'category')
+
+# Table entries buffered by the writer before they are written out.
+TABLE_BUFFER = 4096
+
+
+def encode_record(entry):
+    """Return the packed record for ``entry``.
+
+    The fields of :data:`RECORD_FIELDS` are followed by the collocations, all
+    joined with NUL characters.  Text containing NUL cannot be stored.
+    """
+    values = [entry.get(field, '') for field in RECORD_FIELDS]
+    values.extend(entry.get('collocations') or ())
+    text = '\0'.join(values)
+    if text.count('\0') != len(values) - 1:
+        raise ValueError('entry %r contains a NUL character' % entry.get('id'))
+    return text.encode('utf-8')
+
+
+def decode_record(entry_id, record):
+    """Build the entry dictionary for ``entry_id`` from its packed record."""
+    word, reading, translation, part, example, category, *collocations = record.decode('utf-8').split('\0')
+    return {
+        'word': word,
+        'reading': reading,
+        'translation': translation,
+        'part': part,
+        'collocations': collocations,
+        'example': example,
+        'category': category,
+        'id': entry_id,
+    }
+
+
+class BinaryVocabWriter:
+    """Writes a binary vocabulary file of exactly ``count`` entries.
+
+    Records must be added in ascending id order.  The file is written next
+    to ``path`` and moved into place by :meth:`close`, so readers that have
+    the old file mapped keep a consistent view of it.  ``source_stamp`` is
+    the ``(mtime_ns, size)`` of the deck file the records come from, see
+    :func:`source_stamp`.
+    """
+
+    def __init__(self, path, count, source_stamp=(0, 0)):
+        self.path = path
+        self.count = count
+        self.source_stamp = source_stamp
+        self._tmp_path = path + '.tmp'
+        self._file = open(self._tmp_path, 'wb')
+        self._offset = HEADER.size + (count + 1) * TABLE_ENTRY.size
+        self._file.seek(self._offset)
+        self._table = bytearray()
+        self._table_written = 0
+        self._added = 0
+        self._first_id = 0
+        self._last_id = None
+        self._dense = True
+
+    def add(self, entry_id, record):
+        """Append the packed ``record`` (see :func:`encode_record`)."""
+        if self._added >= self.count:
+            raise ValueError('more than %d entries added' % self.count)
+        if self._last_id is None:
+            self._first_id = entry_id
+        elif entry_id <= self._last_id:
+            raise ValueError('ids must be added in ascending order (%d after %d)' % (entry_id, self._last_id))
+        elif entry_id != self._last_id + 1:
+            self._dense = False
+        self._last_id = entry_id
+        self._table += TABLE_ENTRY.pack(entry_id, self._offset)
+        self._file.write(record)
+        self._offset += len(record)
+        self._added += 1
+        if len(self._table) >= TABLE_BUFFER * TABLE_ENTRY.size:
+            self._flush_table()
+
+    def _flush_table(self):
+        position = self._file.tell()
+        self._file.seek(HEADER.size + self._table_written)
+        self._file.write(self._table)
+        self._file.seek(position)
+        self._table_written += len(self._table)
+        self._table = bytearray()
+
+    def close(self):
+        if self._added != self.count:
+            self._file.close()
+            os.remove(self._tmp_path)
+            raise ValueError('expected %d entries, got %d' % (self.count, self._added))
+        self._table += TABLE_ENTRY.pack(0, self._offset)
+        self._flush_table()
+        self._file.seek(0)
+        self._file.write(HEADER.pack(
+            MAGIC, self.count, self._first_id, int(self._dense), *self.source_stamp
+        ))
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+
+def source_stamp(path):
+    """Return the ``(mtime_ns, size)`` stamp of the deck file at ``path``,
+    the same pair :class:`vocab_store.VocabStore` tracks.
+    """
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def write_binary(path, entries, source_stamp=(0, 0)):
+    """Write ``entries`` (any iterable) to a binary vocabulary file.
+
+    The entries are sorted by id first, so they are held in memory; the
+    generator writes large decks with :class:`BinaryVocabWriter` directly.
+    Returns the number of entries written.
+    """
+    entries = sorted(entries, key=lambda entry: entry['id'])
+    writer = BinaryVocabWriter(path, len(entries), source_stamp)
+    for entry in entries:
+        writer.add(entry['id'], encode_record(entry))
+    writer.close()
+    return len(entries)
+
+
+class BinaryVocab:
+    """A read-only, memory-mapped binary vocabulary file."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            st = os.fstat(f.fileno())
+            self.stamp = (st.st_mtime_ns, st.st_size)
+            if st.st_size < HEADER.size:
+                raise ValueError('%s is not a binary vocabulary file' % path)
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, self.first_id, dense, mtime_ns, size = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError('%s is not a binary vocabulary file' % path)
+        # (mtime_ns, size) of the deck file the records were made from.
+        self.source_stamp = (mtime_ns, size)
+        if st.st_size < HEADER.size + (self.count + 1) * TABLE_ENTRY.size:
+            raise ValueError('%s is truncated' % path)
+        self.dense = bool(dense)
+
+    def __len__(self):
+        return self.count
+
+    def _slot(self, position):
+        return TABLE_ENTRY.unpack_from(self._map, HEADER.size + position * TABLE_ENTRY.size)
+
+    def _position(self, entry_id):
+        if self.dense:
+            position = entry_id - self.first_id
+            return position if 0 <= position < self.count else None
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._slot(mid)[0] < entry_id:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.count and self._slot(lo)[0] == entry_id:
+            return lo
+        return None
+
+    def get(self, entry_id):
+        """Return the entry with ``entry_id``, or ``None``."""
+        position = self._position(entry_id)
+        if position is None:
+            return None
+        start = self._slot(position)[1]
+        end = self._slot(position + 1)[1]
+        return decode_record(entry_id, self._map[start:end])
+
+    def get_many(self, ids):
+        """Return the entries for ``ids`` in the given order, skipping ids
+        that do not exist.
+        """
+        entries = []
+        for entry_id in ids:
+            entry = self.get(entry_id)
+            if entry is not None:
+                entries.append(entry)
+        return entries
+
+
+class BinaryVocabStore:
+    """Process-wide handle on a binary vocabulary file with hot reload.
+
+    Like :class:`vocab_store.VocabStore`, the file is checked for changes at
+    most once per ``check_interval`` seconds and a changed file is mapped
+    afresh.  :meth:`current` returns ``None`` while the file does not exist,
+    so callers can fall back to another source.
+    """
+
+    def __init__(self, path, check_interval=1.0):
+        self.path = path
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._vocab = None
+        self._next_check = 0.0
+        self.reloads = 0
+        self.reload_errors = 0
+
+    def check(self):
+        """Check the file now, whatever the interval, and return the current
+        :class:`BinaryVocab` or ``None``.
+        """
+        self._next_check = 0.0
+        return self.current()
+
+    def current(self):
+        """Return the current :class:`BinaryVocab`, or ``None``."""
+        vocab = self._vocab
+        now = time.monotonic()
+        if now < self._next_check:
+            return vocab
+        with self._lock:
+            if now < self._next_check:
+                return self._vocab
+            self._next_check = now + self.check_interval
+            try:
+                st = os.stat(self.path)
+            except FileNotFoundError:
+                self._vocab = None
+                return None
+            vocab = self._vocab
+            if vocab is None or (st.st_mtime_ns, st.st_size) != vocab.stamp:
+                try:
+                    vocab = self._vocab = BinaryVocab(self.path)
+                    self.reloads += 1
+                except (OSError, ValueError):
+                    # Keep the last good mapping while the file is rewritten.
+                    self.reload_errors += 1
+            return vocab
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        sys.exit('usage: python vocab_binary.py VOCAB_JSON VOCAB_BIN')
+    with open(sys.argv[1], 'r', encoding='utf-8') as f:
+        data = read_vocab(f, sys.argv[1])
+        if isinstance(data, dict):
+            data = expand_normalized(data)
+        count = write_binary(sys.argv[2], data, source_stamp(sys.argv[1]))
+    print(f"Wrote {count} vocabulary entries to {sys.argv[2]}.")
@@ -0,0 +1,298 @@
+"""
+SQLite storage for the vocabulary deck.
+
+The vocabulary can be kept in the same SQLite database as the user accounts
+instead of in ``data/vocab.json``.  Entries live in the ``vocab`` table, with
+indexes on ``category`` and ``part`` for filtering, and ``vocab_fts`` is an
+FTS5 index over the word, reading, translation and example sentence.  The
+FTS table uses the trigram tokenizer, which matches arbitrary substrings and
+therefore also works for Japanese text that has no spaces between words.
+``vocab_usage_fts`` indexes the collocations and example sentences the same
+way for :func:`vocab_usages`.
+
+Run this module directly to import a JSON deck into a database::
+
+    python vocab_db.py data/vocab.json users.db
+"""
+
+import json
+import sqlite3
+import sys
+
+from vocab_store import FacetIndex, expand_normalized, read_vocab
+
+
+SCHEMA = (
+    '''CREATE TABLE IF NOT EXISTS vocab (
+        id INTEGER PRIMARY KEY,
+        word TEXT NOT NULL,
+        reading TEXT NOT NULL,
+        translation TEXT NOT NULL,
+        part TEXT NOT NULL DEFAULT '',
+        collocations TEXT NOT NULL DEFAULT '[]',
+        example TEXT NOT NULL DEFAULT '',
+        category TEXT NOT NULL DEFAULT 'Misc'
+    )''',
+    'CREATE INDEX IF NOT EXISTS vocab_category ON vocab (category, id)',
+    'CREATE INDEX IF NOT EXISTS vocab_part ON vocab (part, id)',
+    '''CREATE VIRTUAL TABLE IF NOT EXISTS vocab_fts USING fts5(
+        word, reading, translation, example,
+        content='vocab', content_rowid='id', tokenize='trigram'
+    )''',
+)
+
+# Full-text index over the texts that show an entry in context.  Added by a
+# later migration than SCHEMA, see MIGRATIONS in app.py.
+USAGE_SCHEMA = (
+    '''CREATE VIRTUAL TABLE IF NOT EXISTS vocab_usage_fts USING fts5(
+        collocations, example,
+        content='vocab', content_rowid='id', tokenize='trigram'
+    )''',
+)
+REBUILD_USAGE_FTS = "INSERT INTO vocab_usage_fts (vocab_usage_fts) VALUES ('rebuild')"
+
+# SQLite integers are signed 64-bit; ids and cursors outside this range
+# cannot be bound as parameters.
+MIN_INTEGER = -2 ** 63
+MAX_INTEGER = 2 ** 63 - 1
+
+# Columns searched by the API; the example sentence is indexed as well but
+# only matched when explicitly requested.
+SEARCH_COLUMNS = ('word', 'reading', 'translation')
+
+# The trigram tokenizer cannot match queries shorter than three characters,
+# so those fall back to a LIKE scan.
+MIN_FTS_QUERY = 3
+
+
+def init_vocab_schema(db):
+    """Create the vocabulary tables and indexes if they do not exist."""
+    for statement in SCHEMA + USAGE_SCHEMA:
+        db.execute(statement)
+
+
+def entry_row(entry):
+    """Convert a vocabulary entry dictionary into a ``vocab`` table row."""
+    return (
+        entry['id'],
+        entry['word'],
+        entry['reading'],
+        entry['translation'],
+        entry.get('part', ''),
+        json.dumps(entry.get('collocations', []), ensure_ascii=False),
+        entry.get('example', ''),
+        entry.get('category', 'Misc'),
+    )
+
+
+def row_entry(row):
+    """Convert a ``vocab`` table row back into an entry dictionary."""
+    return {
+        'word': row['word'],
+        'reading': row['reading'],
+        'translation': row['translation'],
+        'part': row['part'],
+        'collocations': json.loads(row['collocations']),
+        'example': row['example'],
+        'category': row['category'],
+        'id': row['id'],
+    }
+
+
+def import_vocab(db, entries):
+    """Replace the vocabulary in ``db`` with ``entries``.
+
+    ``entries`` may be any iterable, so large decks can be streamed in.  The
+    whole import runs in a single transaction and the full-text index is
+    rebuilt once at the end rather than row by row.  Returns the number of
+    entries imported.
+    """
+    init_vocab_schema(db)
+    with db:
+        db.execute('DELETE FROM vocab')
+        cursor = db.executemany(
+            'INSERT INTO vocab (id, word, reading, translation, part, collocations, example, category) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (entry_row(entry) for entry in entries),
+        )
+        count = cursor.rowcount
+        db.execute("INSERT INTO vocab_fts (vocab_fts) VALUES ('rebuild')")
+        db.execute(REBUILD_USAGE_FTS)
+    return count
+
+
+def import_vocab_file(json_path, db_path):
+    """Import the deck at ``json_path`` into the database at ``db_path``.
+
+    The file may be a JSON list of entries, the normalized form, or NDJSON
+    (one entry per line, read as a stream).
+    """
+    db = sqlite3.connect(db_path)
+    try:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = read_vocab(f, json_path)
+            if isinstance(data, dict):
+                data = expand_normalized(data)
+            return import_vocab(db, data)
+    finally:
+        db.close()
+
+
+def vocab_count(db):
+    """Return the number of entries stored in ``db``."""
+    return db.execute('SELECT count(*) FROM vocab').fetchone()[0]
+
+
+def vocab_facets(db):
+    """Return a :class:`vocab_store.FacetIndex` of the stored entries."""
+    rows = db.execute('SELECT id, category, part FROM vocab ORDER BY id')
+    return FacetIndex.from_entries(
+        {'id': entry_id, 'category': category, 'part': part} for entry_id, category, part in rows
+    )
+
+
+def all_vocab(db):
+    """Return every entry in id order."""
+    return [row_entry(row) for row in db.execute('SELECT * FROM vocab ORDER BY id')]
+
+
+def get_vocab(db, ids):
+    """Return the entries for ``ids`` in the given order, skipping ids that
+    do not exist.
+    """
+    # Ids SQLite cannot store cannot exist either.
+    ids = [entry_id for entry_id in ids if MIN_INTEGER <= entry_id <= MAX_INTEGER]
+    if not ids:
+        return []
+    found = {}
+    # Stay below SQLite's limit on the number of host parameters.
+    for start in range(0, len(ids), 500):
+        batch = ids[start:start + 500]
+        rows = db.execute(
+            'SELECT * FROM vocab WHERE id IN (%s)' % ','.join('?' * len(batch)), batch
+        )
+        for row in rows:
+            found[row['id']] = row_entry(row)
+    return [found[entry_id] for entry_id in ids if entry_id in found]
+
+
+def iter_vocab(db, category=None, batch_size=500):
+    """Yield every entry (or every entry in ``category``) in id order.
+
+    Rows are fetched ``batch_size`` at a time, so memory use does not grow
+    with the size of the deck.
+    """
+    if category:
+        cursor = db.execute('SELECT * FROM vocab WHERE category = ? ORDER BY id', (category,))
+    else:
+        cursor = db.execute('SELECT * FROM vocab ORDER BY id')
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        for row in rows:
+            yield row_entry(row)
+
+
+def _fts_phrase(query):
+    # Quote the query as a single FTS5 string so that operators and
+    # punctuation in user input are matched literally.
+    return '"' + query.replace('"', '""') + '"'
+
+
+def _like_pattern(query):
+    escaped = query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return '%' + escaped + '%'
+
+
+def _clamp_integer(value):
+    # A cursor past either end of SQLite's integer range selects the same
+    # rows as the end itself.
+    return max(MIN_INTEGER, min(value, MAX_INTEGER))
+
+
+def search_vocab(db, query='', category=None, limit=50, cursor=0):
+    """Return one page of entries matching ``query`` and ``category``.
+
+    Mirrors :meth:`vocab_store.VocabSnapshot.search`: ``cursor`` is the
+    smallest id to return and the result is an ``(items, next_cursor)`` pair
+    where ``next_cursor`` is ``None`` after the last page.
+    """
+    query = query.strip()
+    params = [_clamp_integer(cursor)]
+    if query and len(query) >= MIN_FTS_QUERY:
+        sql = (
+            'SELECT vocab.* FROM vocab_fts JOIN vocab ON vocab.id = vocab_fts.rowid '
+            'WHERE vocab_fts MATCH ? AND vocab_fts.rowid >= ?'
+        )
+        params.insert(0, '{%s} : %s' % (' '.join(SEARCH_COLUMNS), _fts_phrase(query)))
+        order = 'vocab_fts.rowid'
+    else:
+        sql = 'SELECT * FROM vocab WHERE id >= ?'
+        order = 'id'
+        if query:
+            pattern = _like_pattern(query)
+            sql += ' AND (' + ' OR '.join("%s LIKE ? ESCAPE '\\'" % col for col in SEARCH_COLUMNS) + ')'
+            params.extend([pattern] * len(SEARCH_COLUMNS))
+    if category:
+        sql += ' AND vocab.category = ?'
+        params.append(category)
+    sql += ' ORDER BY %s LIMIT ?' % order
+    params.append(limit + 1)
+    rows = db.execute(sql, params).fetchall()
+    items = [row_entry(row) for row in rows[:limit]]
+    next_cursor = rows[limit]['id'] if len(rows) > limit else None
+    return items, next_cursor
+
+
+def vocab_usages(db, term, limit=50, cursor=0):
+    """Return one page of entries whose collocations or example sentence
+    contain ``term``.
+
+    The SQLite counterpart of :meth:`vocab_store.VocabSnapshot.usage_search`,
+    paginated like :func:`search_vocab`.  Terms shorter than three
+    characters cannot use the trigram index and are matched with ``LIKE``.
+    Both search the stored JSON text of the collocations, so the rows found
+    are checked again against the decoded texts; otherwise a term such as
+    ``",`` would match the JSON punctuation between them.
+    """
+    term = term.strip()
+    if not term:
+        return [], None
+    if len(term) >= MIN_FTS_QUERY:
+        sql = (
+            'SELECT vocab.* FROM vocab_usage_fts JOIN vocab ON vocab.id = vocab_usage_fts.rowid '
+            'WHERE vocab_usage_fts MATCH ? AND vocab_usage_fts.rowid >= ? '
+            'ORDER BY vocab_usage_fts.rowid LIMIT ?'
+        )
+        match = (_fts_phrase(term),)
+    else:
+        sql = (
+            "SELECT * FROM vocab WHERE (collocations LIKE ? ESCAPE '\\' "
+            "OR example LIKE ? ESCAPE '\\') AND id >= ? ORDER BY id LIMIT ?"
+        )
+        match = (_like_pattern(term),) * 2
+    items = []
+    folded = term.lower()
+    while True:
+        rows = db.execute(sql, match + (_clamp_integer(cursor), limit + 1)).fetchall()
+        for row in rows:
+            entry = row_entry(row)
+            texts = entry['collocations'] + ([entry['example']] if entry['example'] else [])
+            usages = [text for text in texts if folded in text.lower()]
+            if not usages:
+                continue
+            if len(items) == limit:
+                return items, row['id']
+            entry['usages'] = usages
+            items.append(entry)
+        if len(rows) <= limit:
+            return items, None
+        cursor = rows[-1]['id'] + 1
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        sys.exit('usage: python vocab_db.py VOCAB_JSON DATABASE')
+    count = import_vocab_file(sys.argv[1], sys.argv[2])
+    print(f"Imported {count} vocabulary entries into {sys.argv[2]}.")
@@ -0,0 +1,261 @@
+"""
+Typo-tolerant, ranked search over the vocabulary.
+
+The substring search of :meth:`vocab_store.VocabSnapshot.search` finds
+nothing for ``konichiwa`` or ``ohayo`` because the readings are spelled
+``konnichiwa`` and ``ohayou gozaimasu``.  :class:`FuzzyIndex` searches
+normalized keys instead:
+
+* romaji readings are folded with :func:`fold_romaji`: lowercased,
+  macrons, long vowels and doubled letters collapsed, Hepburn and Kunrei
+  spellings unified and spaces and punctuation dropped,
+* words are folded with :func:`fold_kana`, which maps katakana to
+  hiragana and drops the long vowel mark,
+* translations are lowercased with runs of whitespace collapsed.
+
+Every key is indexed by its character trigrams.  A query is folded the same
+way; the lexemes sharing the most trigrams with it are the candidates, and
+the best :data:`RERANK_CANDIDATES` of those (trigrams common to a large
+share of the deck are not counted) are reranked by a bounded edit
+distance of the query against each key (matching anywhere in the key, so a
+misspelled prefix of a long reading still scores well).  The number of
+candidates reranked is fixed, so a query costs about the same however large
+the deck is, and the same query always ranks the same way, which keeps the
+pages of a ranked result consistent with each other.
+
+Queries whose folded forms are shorter than :data:`MIN_QUERY_LENGTH`
+characters (``学``, ``こ``, ``k``) have too few trigrams to find anything but
+exact matches; :meth:`FuzzyIndex.accepts` is false for them and callers use
+a substring search instead.
+
+The index is built per distinct lexeme, not per entry: entries that share a
+lexeme share its score and are returned together, in file order.
+
+:class:`UsageIndex` answers the opposite question, which cards use a term
+in context: it indexes the collocations and example sentences, again per
+lexeme.
+"""
+
+import re
+import unicodedata
+from array import array
+
+
+# Trigram candidates reranked by edit distance per query.
+RERANK_CANDIDATES = 200
+
+# Queries whose folded forms are all shorter than this are left to the
+# substring search.
+MIN_QUERY_LENGTH = 3
+
+# Trigrams found in more than this share of the lexemes are too common to
+# narrow the candidates down and are skipped when the query has rarer ones.
+COMMON_GRAM_SHARE = 0.05
+
+# Relative weights of the keys of a lexeme.
+FIELD_WEIGHTS = (1.0, 1.0, 0.9)
+
+_ROMAJI_SPELLINGS = (
+    ('tsu', 'tu'), ('shi', 'si'), ('chi', 'ti'), ('sh', 'sy'), ('ch', 'ty'),
+    ('fu', 'hu'), ('ji', 'zi'), ('j', 'zy'),
+    ('ou', 'o'), ('oh', 'o'), ('ei', 'e'),
+)
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+_REPEATS = re.compile(r'(.)\1+')
+
+
+def fold_romaji(text):
+    """Return the search form of a romaji string."""
+    text = unicodedata.normalize('NFKD', text.lower())
+    text = ''.join(c for c in text if not unicodedata.combining(c))
+    text = _NON_ALNUM.sub('', text)
+    for spelling, folded in _ROMAJI_SPELLINGS:
+        text = text.replace(spelling, folded)
+    return _REPEATS.sub(r'\1', text)
+
+
+def fold_kana(text):
+    """Return the search form of a Japanese string."""
+    text = unicodedata.normalize('NFKC', text)
+    return ''.join(
+        chr(ord(c) - 0x60) if 'ァ' <= c <= 'ヶ' else c
+        for c in text
+        if c not in 'ー・ 　'
+    )
+
+
+def fold_text(text):
+    """Return the search form of a translation."""
+    return ' '.join(text.lower().split())
+
+
+def trigrams(text):
+    """Return the set of trigrams of ``text`` padded with spaces, so that
+    strings of one or two characters have trigrams too.
+    """
+    padded = ' %s ' % text
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def bounded_distance(query, text, limit):
+    """Return the edit distance between ``query`` and the closest substring
+    of ``text``, or ``None`` if it is larger than ``limit``.
+    """
+    previous = [0] * (len(text) + 1)
+    for i, qc in enumerate(query, 1):
+        current = [i]
+        best = i
+        for j, tc in enumerate(text, 1):
+            cost = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (qc != tc))
+            current.append(cost)
+            if cost < best:
+                best = cost
+        if best > limit:
+            return None
+        previous = current
+    distance = min(previous)
+    return distance if distance <= limit else None
+
+
+class FuzzyIndex:
+    """Trigram index over the folded keys of a list of lexemes."""
+
+    def __init__(self, lexemes):
+        self.keys = []
+        grams = {}
+        for ref, lexeme in enumerate(lexemes):
+            keys = (
+                fold_romaji(lexeme.get('reading', '')),
+                fold_kana(lexeme.get('word', '')),
+                fold_text(lexeme.get('translation', '')),
+            )
+            self.keys.append(keys)
+            for gram in set().union(*(trigrams(key) for key in keys if key)):
+                postings = grams.get(gram)
+                if postings is None:
+                    postings = grams[gram] = array('I')
+                postings.append(ref)
+        self.grams = grams
+
+    def query_keys(self, query):
+        """Return the folded forms of ``query`` compared with each key."""
+        return (fold_romaji(query), fold_kana(query), fold_text(query))
+
+    def accepts(self, query):
+        """Return whether ``query`` is long enough for a fuzzy search."""
+        return max(len(key) for key in self.query_keys(query)) >= MIN_QUERY_LENGTH
+
+    def score(self, ref, query_keys):
+        """Return the relevance of lexeme ``ref``, between 0 and 1."""
+        best = 0.0
+        for weight, key, query in zip(FIELD_WEIGHTS, self.keys[ref], query_keys):
+            if not key or not query:
+                continue
+            if key == query:
+                score = 1.0
+            elif key.startswith(query):
+                score = 0.9
+            elif query in key:
+                score = 0.8
+            else:
+                limit = max(1, len(query) // 4)
+                distance = bounded_distance(query, key, limit)
+                if distance is None:
+                    continue
+                score = 0.7 * (1.0 - distance / (len(query) + 1))
+            best = max(best, weight * score)
+        return best
+
+    def search(self, query):
+        """Return ``(ref, score)`` pairs for the lexemes matching ``query``,
+        best first.
+        """
+        query_keys = self.query_keys(query)
+        query_grams = set().union(*(trigrams(key) for key in query_keys if key))
+        if not query_grams:
+            return []
+        postings = sorted((self.grams.get(gram, ()) for gram in query_grams), key=len)
+        common = max(1000, int(COMMON_GRAM_SHARE * len(self.keys)))
+        # A query made only of common trigrams matches most of the deck;
+        # then only the first lexemes of the rarest one are considered.
+        used = [refs for refs in postings if len(refs) <= common] or [postings[0][:common]]
+        overlap = {}
+        for refs in used:
+            for ref in refs:
+                overlap[ref] = overlap.get(ref, 0) + 1
+        # Require a third of the trigrams, so that a single shared trigram
+        # does not make every lexeme a candidate.
+        needed = max(1, len(used) // 3)
+        candidates = sorted(
+            (ref for ref, count in overlap.items() if count >= needed),
+            key=lambda ref: (-overlap[ref], ref),
+        )
+        results = []
+        for ref in candidates[:RERANK_CANDIDATES]:
+            score = self.score(ref, query_keys)
+            if score > 0:
+                results.append((ref, score))
+        results.sort(key=lambda pair: (-pair[1], pair[0]))
+        return results
+
+
+def usage_texts(lexeme):
+    """Return the collocations and example sentence of ``lexeme``, the
+    texts searched for usages of a term.
+    """
+    texts = list(lexeme.get('collocations') or ())
+    if lexeme.get('example'):
+        texts.append(lexeme['example'])
+    return texts
+
+
+class UsageIndex:
+    """Reverse index from the characters and character bigrams of the
+    collocations and example sentences to the lexemes using them.
+
+    Japanese text has no spaces to split words on, so the index works on
+    characters: a term of one character is looked up directly, a longer
+    term through its rarest bigram, and the candidates are then checked for
+    the whole term.  Each lexeme is indexed once, however many entries
+    share it.
+    """
+
+    def __init__(self, lexemes):
+        self.texts = []
+        grams = {}
+        for ref, lexeme in enumerate(lexemes):
+            texts = usage_texts(lexeme)
+            self.texts.append(texts)
+            keys = set()
+            for text in texts:
+                text = text.lower()
+                keys.update(text)
+                keys.update(text[i:i + 2] for i in range(len(text) - 1))
+            for gram in keys:
+                postings = grams.get(gram)
+                if postings is None:
+                    postings = grams[gram] = array('I')
+                postings.append(ref)
+        self.grams = grams
+
+    def search(self, term):
+        """Return the refs of the lexemes whose collocations or example
+        contain ``term``, in ascending order.
+        """
+        term = term.strip().lower()
+        if not term:
+            return []
+        if len(term) == 1:
+            return list(self.grams.get(term, ()))
+        candidates = min(
+            (self.grams.get(term[i:i + 2], ()) for i in range(len(term) - 1)),
+            key=len,
+        )
+        if len(term) == 2:
+            return list(candidates)
+        return [ref for ref in candidates if self.matches(ref, term)]
+
+    def matches(self, ref, term):
+        """Return the texts of lexeme ``ref`` that contain ``term``."""
+        term = term.strip().lower()
+        return [text for text in self.texts[ref] if term in text.lower()]
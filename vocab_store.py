@@ -0,0 +1,726 @@
+"""
+In-memory vocabulary store for the Japanese learning site.
+
+The vocabulary file is parsed once per process and kept in memory as an
+immutable snapshot together with the data derived from it (the sorted list of
+categories and a lookup from entry id to entry).  Most entries are copies of
+a few base expressions that differ only in id and category, so the snapshot
+stores each distinct expression once and the entries as compact arrays of
+references; see :func:`normalize_entries`.  Requests read the
+current snapshot without touching the disk.  The file's modification time and
+size are checked at most once per ``check_interval`` seconds; when either
+changes the file is parsed again and the new snapshot replaces the old one in
+a single assignment, so a request never sees a half-built dataset.
+
+Each snapshot also carries a small search index: a list of entry positions
+per category and an index from character bigrams of the lowercased ``word``,
+``reading`` and ``translation`` fields to the positions that contain them.
+:meth:`VocabSnapshot.search` walks the shortest matching posting list from
+the requested cursor and stops as soon as a page is full, so the cost of a
+query depends on the page size rather than on the size of the dataset.
+The entry counts and ids per category and part of speech are kept in a
+:class:`FacetIndex`, and :meth:`VocabSnapshot.fuzzy_search` ranks entries
+with the typo-tolerant index of ``vocab_search.py``, whose reverse index of
+collocations and example sentences backs :meth:`VocabSnapshot.usage_search`.
+
+Every reload that changes the deck gets a new, larger dataset version, and
+the store remembers which entry ids each recent version added, changed or
+deleted (found by comparing per-entry content hashes), so clients holding an
+older version can fetch just the difference; see
+:meth:`VocabStore.changes_since`.
+
+The full-deck response body is serialized at most once per snapshot and kept
+together with its gzip and (when the optional ``brotli`` package is
+installed) brotli compressed variants and a content-hash ETag; see
+:class:`VocabPayload`.
+"""
+
+import bisect
+import gzip
+import hashlib
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from array import array
+
+from vocab_search import FuzzyIndex, UsageIndex
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+
+# Fields shared by every entry built from the same base expression.  Only
+# ``id`` and ``category`` vary between duplicates, so the normalized format
+# stores each distinct combination of these fields once as a "lexeme".
+LEXEME_FIELDS = ('word', 'reading', 'translation', 'part', 'collocations', 'example')
+
+NORMALIZED_FORMAT = 'normalized-v1'
+
+# Fields counted by FacetIndex and the value assumed when one is missing.
+FACET_FIELDS = ('category', 'part')
+_FACET_DEFAULTS = {'category': 'Misc', 'part': ''}
+
+
+def normalize_entries(entries):
+    """Return the normalized form of an iterable of entries.
+
+    The result is a JSON-serializable dictionary with a ``lexemes`` table
+    (one list of :data:`LEXEME_FIELDS` values per distinct lexeme), the
+    ``categories`` table, and three parallel columns ``ids``,
+    ``lexeme_refs`` and ``category_refs`` with one value per entry.
+    :func:`expand_normalized` (and ``expandVocab`` in ``script.js``) turn it
+    back into the list of entries.
+    """
+    lexemes = []
+    lexeme_refs = {}
+    categories = []
+    category_refs = {}
+    ids = []
+    lexeme_col = []
+    category_col = []
+    for entry in entries:
+        lexeme = tuple(
+            tuple(entry.get(field) or ()) if field == 'collocations' else entry.get(field, '')
+            for field in LEXEME_FIELDS
+        )
+        ref = lexeme_refs.get(lexeme)
+        if ref is None:
+            ref = lexeme_refs[lexeme] = len(lexemes)
+            lexemes.append([list(value) if isinstance(value, tuple) else value for value in lexeme])
+        category = entry.get('category', 'Misc')
+        cref = category_refs.get(category)
+        if cref is None:
+            cref = category_refs[category] = len(categories)
+            categories.append(category)
+        ids.append(entry['id'])
+        lexeme_col.append(ref)
+        category_col.append(cref)
+    return {
+        'format': NORMALIZED_FORMAT,
+        'fields': list(LEXEME_FIELDS),
+        'lexemes': lexemes,
+        'categories': categories,
+        'ids': ids,
+        'lexeme_refs': lexeme_col,
+        'category_refs': category_col,
+    }
+
+
+def expand_normalized(data):
+    """Yield the entries described by a normalized dictionary.
+
+    Per-category chunks written by ``generate_vocab.py`` use the same format
+    with two shortcuts: ``lexemes`` may be an object keyed by lexeme ref, and
+    ``category_refs`` may be omitted when there is a single category.
+    """
+    fields = data['fields']
+    lexemes = data['lexemes']
+    if isinstance(lexemes, dict):
+        lexemes = {int(ref): values for ref, values in lexemes.items()}
+    categories = data['categories']
+    category_refs = data.get('category_refs') or itertools.repeat(0)
+    for entry_id, ref, cref in zip(data['ids'], data['lexeme_refs'], category_refs):
+        entry = dict(zip(fields, lexemes[ref]))
+        entry['category'] = categories[cref]
+        entry['id'] = entry_id
+        yield entry
+
+
+def read_vocab(f, path):
+    """Read a deck from the open file ``f``.
+
+    Files ending in ``.ndjson`` hold one entry per line and are consumed
+    lazily, so a large deck is normalized without ever building the full
+    list of entry dictionaries.  Anything else is parsed as JSON, either a
+    list of entries or the normalized form.
+    """
+    if path.endswith('.ndjson'):
+        return (json.loads(line) for line in f if line.strip())
+    return json.load(f)
+
+
+class VocabSnapshot:
+    """A parsed, read-only view of the vocabulary file.
+
+    The deck is held in normalized form: ``lexemes`` holds one shared
+    dictionary per distinct lexeme, and the entries themselves are three
+    compact arrays (``ids``, ``lexeme_refs`` and ``category_refs``) indexed
+    by position in file order.  Entry dictionaries are only built when they
+    are returned, see :meth:`entry`.  ``categories`` is the sorted list of
+    distinct categories and ``stamp`` is the ``(mtime_ns, size)`` pair of the
+    file the snapshot was built from.
+
+    ``data`` may be either a list of entries or the output of
+    :func:`normalize_entries`.
+    """
+
+    __slots__ = (
+        'lexemes', 'category_names', 'ids', 'lexeme_refs', 'category_refs',
+        'categories', 'stamp', 'loaded_at', '_ids_sorted', '_id_positions',
+        'category_positions', 'lexeme_keys', 'gram_index', 'facets', '_payloads',
+        'lexeme_positions', 'fuzzy', 'usages', 'hashes', 'version',
+    )
+
+    def __init__(self, data, stamp):
+        if not (isinstance(data, dict) and data.get('format') == NORMALIZED_FORMAT):
+            data = normalize_entries(data)
+        fields = data['fields']
+        self.lexemes = [
+            {field: _intern(value) for field, value in zip(fields, values)}
+            for values in data['lexemes']
+        ]
+        for lexeme in self.lexemes:
+            if 'collocations' in lexeme:
+                lexeme['collocations'] = tuple(_intern(c) for c in lexeme['collocations'])
+        self.category_names = [sys.intern(c) for c in data['categories']]
+        self.ids = array('q', data['ids'])
+        self.lexeme_refs = array('I', data['lexeme_refs'])
+        self.category_refs = array('I', data['category_refs'])
+        self.stamp = stamp
+        # Set by VocabStore when the snapshot is published.
+        self.version = 0
+        self.loaded_at = time.time()
+        self._payloads = {}
+        self._ids_sorted = all(a < b for a, b in zip(self.ids, self.ids[1:]))
+        self._id_positions = None if self._ids_sorted else {
+            entry_id: pos for pos, entry_id in enumerate(self.ids)
+        }
+        self._build_index()
+        self.facets = FacetIndex.from_snapshot(self)
+        self.hashes = self._hash_entries()
+        self.categories = self.facets.values('category')
+
+    def __len__(self):
+        return len(self.ids)
+
+    def entry(self, pos):
+        """Build the entry dictionary for the entry at position ``pos``."""
+        entry = dict(self.lexemes[self.lexeme_refs[pos]])
+        if 'collocations' in entry:
+            entry['collocations'] = list(entry['collocations'])
+        entry['category'] = self.category_names[self.category_refs[pos]]
+        entry['id'] = self.ids[pos]
+        return entry
+
+    def iter_entries(self, category=None):
+        """Yield every entry (or every entry in ``category``) in file order,
+        one dictionary at a time.
+        """
+        if category:
+            positions = self.category_positions.get(category, ())
+        else:
+            positions = range(len(self.ids))
+        for pos in positions:
+            yield self.entry(pos)
+
+    def position(self, entry_id):
+        """Return the position of the entry with id ``entry_id`` or ``None``."""
+        if self._ids_sorted:
+            pos = bisect.bisect_left(self.ids, entry_id)
+            if pos < len(self.ids) and self.ids[pos] == entry_id:
+                return pos
+            return None
+        return self._id_positions.get(entry_id)
+
+    def get(self, entry_id):
+        """Return the entry with id ``entry_id`` or ``None``."""
+        pos = self.position(entry_id)
+        return None if pos is None else self.entry(pos)
+
+    def category_of(self, pos):
+        """Return the category of the entry at position ``pos``."""
+        return self.category_names[self.category_refs[pos]]
+
+    def normalized(self):
+        """Return the deck in the format produced by :func:`normalize_entries`."""
+        fields = list(LEXEME_FIELDS)
+        return {
+            'format': NORMALIZED_FORMAT,
+            'fields': fields,
+            'lexemes': [[lexeme.get(field, '') for field in fields] for lexeme in self.lexemes],
+            'categories': self.category_names,
+            'ids': self.ids.tolist(),
+            'lexeme_refs': self.lexeme_refs.tolist(),
+            'category_refs': self.category_refs.tolist(),
+        }
+
+    def _build_index(self):
+        # Search keys and bigrams are computed once per lexeme and shared by
+        # all of its entries; postings are compact arrays of positions.
+        self.lexeme_keys = [search_key(lexeme) for lexeme in self.lexemes]
+        lexeme_grams = [bigrams(key) for key in self.lexeme_keys]
+        category_positions = {}
+        gram_index = {}
+        lexeme_positions = [array('I') for _ in self.lexemes]
+        for pos, (ref, cref) in enumerate(zip(self.lexeme_refs, self.category_refs)):
+            lexeme_positions[ref].append(pos)
+            category = self.category_names[cref]
+            positions = category_positions.get(category)
+            if positions is None:
+                positions = category_positions[category] = array('I')
+            positions.append(pos)
+            for gram in lexeme_grams[ref]:
+                postings = gram_index.get(gram)
+                if postings is None:
+                    postings = gram_index[gram] = array('I')
+                postings.append(pos)
+        self.category_positions = category_positions
+        self.gram_index = gram_index
+        self.lexeme_positions = lexeme_positions
+        self.fuzzy = FuzzyIndex(self.lexemes)
+        self.usages = UsageIndex(self.lexemes)
+
+    def search(self, query='', category=None, limit=50, cursor=0):
+        """Return one page of entries matching ``query`` and ``category``.
+
+        ``query`` is matched case-insensitively as a substring of the word,
+        reading or translation.  ``cursor`` is the position to resume from;
+        the returned ``(items, next_cursor)`` pair has ``next_cursor`` set to
+        ``None`` once the last page has been returned.
+        """
+        query = query.strip().lower()
+        candidates = self._candidates(query, category)
+        items = []
+        start = bisect.bisect_left(candidates, cursor)
+        for i in range(start, len(candidates)):
+            pos = candidates[i]
+            if query and query not in self.lexeme_keys[self.lexeme_refs[pos]]:
+                continue
+            if category and self.category_of(pos) != category:
+                continue
+            if len(items) == limit:
+                return items, pos
+            items.append(self.entry(pos))
+        return items, None
+
+    def _hash_entries(self):
+        # An entry's content is its lexeme and category, so the hash is
+        # computed once per distinct (lexeme, category) pair.
+        combos = {}
+        hashes = array('Q')
+        for ref, cref in zip(self.lexeme_refs, self.category_refs):
+            value = combos.get((ref, cref))
+            if value is None:
+                lexeme = self.lexemes[ref]
+                content = [lexeme.get(field, '') for field in LEXEME_FIELDS]
+                content.append(self.category_names[cref])
+                digest = hashlib.blake2b(
+                    json.dumps(content, ensure_ascii=False, default=list).encode('utf-8'), digest_size=8
+                ).digest()
+                value = combos[ref, cref] = int.from_bytes(digest, 'little')
+            hashes.append(value)
+        return hashes
+
+    def content_hash(self, pos):
+        """Return the 64-bit content hash of the entry at position ``pos``."""
+        return self.hashes[pos]
+
+    def fuzzy_search(self, query, category=None, limit=50, offset=0):
+        """Return one page of entries ranked by relevance to ``query``.
+
+        Matching is typo tolerant, see :class:`vocab_search.FuzzyIndex`.
+        Entries of the same lexeme share its score and keep their file order.
+        ``offset`` is the number of ranked entries to skip; the returned
+        ``(items, next_offset)`` pair has ``next_offset`` set to ``None``
+        once the last page has been returned.
+
+        Queries too short for the trigram index are answered by
+        :meth:`search` instead, whose cursor is a position; either way the
+        cursor returned is the one to pass back with the same query.
+        """
+        if not self.fuzzy.accepts(query):
+            return self.search(query, category, limit, offset)
+        items = []
+        skipped = 0
+        for ref, score in self.fuzzy.search(query):
+            for pos in self.lexeme_positions[ref]:
+                if category and self.category_of(pos) != category:
+                    continue
+                if skipped < offset:
+                    skipped += 1
+                    continue
+                if len(items) == limit:
+                    return items, offset + limit
+                items.append(self.entry(pos))
+        return items, None
+
+    def usage_search(self, term, limit=50, offset=0):
+        """Return one page of entries whose collocations or example
+        sentence contain ``term``, see :class:`vocab_search.UsageIndex`.
+
+        Each entry has an extra ``usages`` list with the matching texts.
+        Entries are grouped by lexeme and keep their file order within it.
+        ``offset`` is the number of matching entries to skip; the returned
+        ``(items, next_offset)`` pair has ``next_offset`` set to ``None``
+        once the last page has been returned.
+        """
+        items = []
+        skipped = 0
+        for ref in self.usages.search(term):
+            positions = self.lexeme_positions[ref]
+            if skipped + len(positions) <= offset:
+                # Whole lexemes are skipped without building their entries.
+                skipped += len(positions)
+                continue
+            usages = self.usages.matches(ref, term)
+            for pos in positions[max(0, offset - skipped):]:
+                if len(items) == limit:
+                    return items, offset + limit
+                entry = self.entry(pos)
+                entry['usages'] = usages
+                items.append(entry)
+            skipped = offset
+        return items, None
+
+    def payload(self, kind='full'):
+        """Return the :class:`VocabPayload` for the whole deck.
+
+        ``kind`` is ``'full'`` for the list of entries, ``'normalized'``
+        for the output of :meth:`normalized` or ``'facets'`` for the facet
+        counts (see :meth:`FacetIndex.summary`).  Each payload is built on first
+        use and then reused for the lifetime of the snapshot.
+        """
+        payload = self._payloads.get(kind)
+        if payload is None:
+            with _payload_lock:
+                payload = self._payloads.get(kind)
+                if payload is None:
+                    if kind == 'normalized':
+                        data = self.normalized()
+                    elif kind == 'facets':
+                        data = self.facets.summary()
+                    else:
+                        data = list(self.iter_entries())
+                    payload = self._payloads[kind] = VocabPayload(data)
+        return payload
+
+    def _candidates(self, query, category):
+        # Pick the shortest sorted position list that is guaranteed to
+        # contain every match; the remaining conditions are checked per
+        # candidate in search().
+        lists = []
+        if category:
+            lists.append(self.category_positions.get(category, ()))
+        if len(query) >= 2:
+            for gram in bigrams(query):
+                lists.append(self.gram_index.get(gram, ()))
+        if not lists:
+            return range(len(self.ids))
+        return min(lists, key=len)
+
+
+class FacetIndex:
+    """Entry counts and ids per value of each facet field.
+
+    For every field in :data:`FACET_FIELDS` the index maps each value to the
+    ids of the entries that have it, kept in ascending order in an
+    ``array('q')``; the count of a value is the length of its list.  The
+    index is built once per snapshot and never changed afterwards, so
+    requests can read it without locking.
+    """
+
+    def __init__(self):
+        self.ids = {field: {} for field in FACET_FIELDS}
+        self.total = 0
+
+    @classmethod
+    def from_entries(cls, entries):
+        """Build the index for an iterable of entries."""
+        index = cls()
+        for entry in entries:
+            for field in FACET_FIELDS:
+                index._append(field, entry.get(field, _FACET_DEFAULTS[field]), entry['id'])
+            index.total += 1
+        index._sort()
+        return index
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """Build the index for a :class:`VocabSnapshot` from its arrays."""
+        index = cls()
+        lexeme_parts = [lexeme.get('part', '') for lexeme in snapshot.lexemes]
+        for entry_id, ref, cref in zip(snapshot.ids, snapshot.lexeme_refs, snapshot.category_refs):
+            index._append('category', snapshot.category_names[cref], entry_id)
+            index._append('part', lexeme_parts[ref], entry_id)
+        if not snapshot._ids_sorted:
+            index._sort()
+        index.total = len(snapshot)
+        return index
+
+    def _append(self, field, value, entry_id):
+        ids = self.ids[field].get(value)
+        if ids is None:
+            ids = self.ids[field][value] = array('q')
+        ids.append(entry_id)
+
+    def _sort(self):
+        for values in self.ids.values():
+            for value, ids in values.items():
+                if any(a > b for a, b in zip(ids, ids[1:])):
+                    values[value] = array('q', sorted(ids))
+
+    def values(self, field):
+        """Return the sorted values of ``field``."""
+        return sorted(self.ids[field])
+
+    def counts(self, field):
+        """Return ``(value, count)`` pairs for ``field`` sorted by value."""
+        return [(value, len(self.ids[field][value])) for value in self.values(field)]
+
+    def summary(self):
+        """Return the JSON-serializable counts served by ``/api/facets``."""
+        return {
+            'total': self.total,
+            'facets': {
+                field: [{'value': value, 'count': count} for value, count in self.counts(field)]
+                for field in FACET_FIELDS
+            },
+        }
+
+
+def diff_snapshots(old, new):
+    """Return the ``(changed_ids, deleted_ids)`` between two snapshots.
+
+    ``changed_ids`` are the ids that are new in ``new`` or whose content
+    hash differs; ``deleted_ids`` are the ids only in ``old``.  Both are
+    sorted.
+    """
+    if old._ids_sorted and new._ids_sorted:
+        # Merge the two id columns.
+        changed = array('q')
+        deleted = array('q')
+        i = j = 0
+        old_ids, new_ids = old.ids, new.ids
+        while i < len(old_ids) and j < len(new_ids):
+            a, b = old_ids[i], new_ids[j]
+            if a == b:
+                if old.hashes[i] != new.hashes[j]:
+                    changed.append(b)
+                i += 1
+                j += 1
+            elif a < b:
+                deleted.append(a)
+                i += 1
+            else:
+                changed.append(b)
+                j += 1
+        deleted.extend(old_ids[i:])
+        changed.extend(new_ids[j:])
+        return changed, deleted
+    old_hashes = dict(zip(old.ids, old.hashes))
+    changed = array('q', sorted(
+        entry_id for entry_id, value in zip(new.ids, new.hashes)
+        if old_hashes.pop(entry_id, None) != value
+    ))
+    return changed, array('q', sorted(old_hashes))
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+_payload_lock = threading.Lock()
+
+
+class VocabPayload:
+    """A serialized JSON body and its compressed variants.
+
+    ``variants`` maps a content coding (``'identity'``, ``'gzip'`` and, when
+    available, ``'br'``) to a ``(body, etag)`` pair.  The ETags are strong
+    validators derived from a hash of the uncompressed body, with a suffix
+    per coding so that each representation has its own tag.
+    """
+
+    __slots__ = ('variants',)
+
+    def __init__(self, data):
+        body = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        self.variants = {
+            'identity': (body, digest),
+            'gzip': (gzip.compress(body, 9), digest + '-gz'),
+        }
+        if brotli is not None:
+            self.variants['br'] = (brotli.compress(body, quality=11), digest + '-br')
+
+    def select(self, accept_encodings):
+        """Pick the smallest variant acceptable to the client.
+
+        ``accept_encodings`` is the parsed ``Accept-Encoding`` header as
+        provided by ``request.accept_encodings``.  Returns a
+        ``(coding, body, etag)`` tuple.
+        """
+        for coding in ('br', 'gzip'):
+            if coding in self.variants and accept_encodings[coding] > 0:
+                return (coding,) + self.variants[coding]
+        return ('identity',) + self.variants['identity']
+
+
+def search_key(entry):
+    """Return the lowercased text searched for ``entry``.
+
+    The fields are joined with a NUL character so that neither a bigram nor a
+    substring match can span two fields.
+    """
+    return '\0'.join((
+        entry.get('word', ''),
+        entry.get('reading', ''),
+        entry.get('translation', ''),
+    )).lower()
+
+
+def bigrams(text):
+    """Return the set of character bigrams of ``text`` within a field."""
+    return {text[i:i + 2] for i in range(len(text) - 1) if '\0' not in text[i:i + 2]}
+
+
+class VocabStore:
+    """Process-wide cache of the vocabulary file with hot reload.
+
+    Call :meth:`snapshot` to obtain the current :class:`VocabSnapshot`.  The
+    counters returned by :meth:`stats` show how often the file was checked and
+    actually reloaded, which makes it easy to confirm that requests are being
+    served from memory.
+    """
+
+    # Number of versions whose changes are remembered for changes_since().
+    history_size = 32
+
+    def __init__(self, path, check_interval=1.0):
+        self.path = path
+        self.check_interval = check_interval
+        # (previous_version, version, changed_ids, deleted_ids) per recent
+        # version, oldest first.
+        self._history = []
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._next_check = 0.0
+        self.checks = 0
+        self.reloads = 0
+        self.reload_errors = 0
+        self.last_load_seconds = 0.0
+        # Optional callable invoked with the duration of every load.
+        self.on_load = None
+
+    def _stat(self):
+        st = os.stat(self.path)
+        return st.st_mtime_ns, st.st_size
+
+    def _load(self, stamp):
+        started = time.perf_counter()
+        with open(self.path, 'r', encoding='utf-8') as f:
+            snapshot = VocabSnapshot(read_vocab(f, self.path), stamp)
+        self._assign_version(snapshot, self._snapshot)
+        self.last_load_seconds = time.perf_counter() - started
+        self.reloads += 1
+        if self.on_load is not None:
+            self.on_load(self.last_load_seconds)
+        return snapshot
+
+    def _assign_version(self, snapshot, previous):
+        # Versions are the file's modification time in milliseconds, so
+        # that processes loading the same file agree on the version, but
+        # never go backwards within a process.  A reload that changes no
+        # entry keeps the previous version.
+        if previous is None:
+            snapshot.version = snapshot.stamp[0] // 1000000
+            return
+        changed, deleted = diff_snapshots(previous, snapshot)
+        if not changed and not deleted:
+            snapshot.version = previous.version
+            return
+        snapshot.version = max(previous.version + 1, snapshot.stamp[0] // 1000000)
+        self._history.append((previous.version, snapshot.version, changed, deleted))
+        del self._history[:-self.history_size]
+
+    def changes_since(self, version):
+        """Return the changes made to the deck after ``version``.
+
+        The result is ``(snapshot, changed_ids, deleted_ids)`` where the ids
+        are sorted lists and the entries of ``changed_ids`` are read from
+        ``snapshot``.  ``deleted_ids`` may include ids that were added and
+        deleted again after ``version``.  The id lists are ``None`` when ``version`` is not one
+        this process can compute a difference from (too old, from another
+        dataset, or in the future); the client must then fetch the whole
+        deck.
+        """
+        self.snapshot()
+        # Read the snapshot and the history together, so that they agree.
+        with self._lock:
+            snapshot = self._snapshot
+            history = list(self._history)
+        if version == snapshot.version:
+            return snapshot, [], []
+        starts = [item[0] for item in history]
+        if version not in starts:
+            return snapshot, None, None
+        changed = set()
+        deleted = set()
+        for _, _, item_changed, item_deleted in history[starts.index(version):]:
+            changed.update(item_changed)
+            changed.difference_update(item_deleted)
+            deleted.update(item_deleted)
+            deleted.difference_update(item_changed)
+        return snapshot, sorted(changed), sorted(deleted)
+
+    def snapshot(self):
+        """Return the current snapshot, reloading the file if it changed."""
+        current = self._snapshot
+        now = time.monotonic()
+        if current is not None and now < self._next_check:
+            return current
+        with self._lock:
+            current = self._snapshot
+            if current is not None and now < self._next_check:
+                return current
+            self._next_check = now + self.check_interval
+            self.checks += 1
+            try:
+                stamp = self._stat()
+                if current is None or stamp != current.stamp:
+                    self._snapshot = current = self._load(stamp)
+            except (OSError, ValueError):
+                # Keep serving the last good snapshot if the file is being
+                # rewritten or is temporarily unreadable.
+                self.reload_errors += 1
+                if current is None:
+                    raise
+            return current
+
+    def stamp(self):
+        """Return the ``(mtime_ns, size)`` stamp of the deck being served.
+
+        Before the first load the file is checked directly, so asking does
+        not parse the deck.
+        """
+        if self._snapshot is None:
+            return self._stat()
+        return self.snapshot().stamp
+
+    def check(self):
+        """Check the file now, whatever the interval, and return the current
+        snapshot.  Used by the prefork master in ``serve.py``, whose workers
+        never check the file themselves.
+        """
+        self._next_check = 0.0
+        return self.snapshot()
+
+    def stats(self):
+        """Return the reload counters and details of the current snapshot."""
+        current = self._snapshot
+        return {
+            'path': self.path,
+            'checks': self.checks,
+            'reloads': self.reloads,
+            'reload_errors': self.reload_errors,
+            'last_load_seconds': self.last_load_seconds,
+            'entries': len(current) if current else 0,
+            'lexemes': len(current.lexemes) if current else 0,
+            'loaded_at': current.loaded_at if current else None,
+            'version': current.version if current else None,
+        }